@@ -0,0 +1,131 @@
+import asyncio, functools
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# Whole-slot operations lock every section
+ALL = "*"
+
+# Operation name -> (save sections it reads or writes, whether it writes).
+# Sections are top-level files and folders of the slot; operations on
+# different sections run concurrently, reads of a section run side by side
+# and a write has its sections to itself.
+OPERATIONS: Dict[str, Tuple[Tuple[str, ...], bool]] = {
+    # Replaces the loaded slot, so nothing else may run meanwhile
+    "load_save": ((ALL,), True),
+    "get_save_info": (("Game.json", "Money.json", "Rank.json", "Time.json", "Players"), False),
+    "set_online_money": (("Money.json",), True),
+    "set_networth": (("Money.json",), True),
+    "set_lifetime_earnings": (("Money.json",), True),
+    "set_weekly_deposit_sum": (("Money.json",), True),
+    "set_rank": (("Rank.json",), True),
+    "set_rank_number": (("Rank.json",), True),
+    "set_tier": (("Rank.json",), True),
+    "set_organisation_name": (("Game.json",), True),
+    "set_cash_balance": (("Players",), True),
+    "add_discovered_products": (("Products",), True),
+    "remove_discovered_products": (("Products",), True),
+    "delete_generated_products": (("Products",), True),
+    "generate_products": (("Products",), True),
+    "update_property_quantities": (("Properties",), True),
+    "get_plastic_pots": (("Properties",), False),
+    "complete_all_quests": (("Quests",), True),
+    "modify_variables": (("Variables", "Players"), True),
+    "set_player_appearance": (("Players",), True),
+    "unlock_all_items_weeds": (("Rank.json",), True),
+    "unlock_all_properties": (("Properties",), True),
+    "unlock_all_businesses": (("Businesses",), True),
+    "update_npc_relationships_function": (("NPCs",), True),
+    "get_dealers": (("NPCs",), False),
+    "create_initial_backup": ((ALL,), True),
+    "create_feature_backup": ((ALL,), True),
+    "list_feature_backups": ((), False),
+    "diff_with_backup": ((ALL,), False),
+    "revert_feature": ((ALL,), True),
+    "revert_all_changes": ((ALL,), True),
+}
+
+
+class _ReadWriteLock:
+    """asyncio lock held by any number of readers or by one writer; waiting writers keep new readers out."""
+
+    def __init__(self):
+        self._cond = asyncio.Condition()
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    async def acquire(self, write: bool):
+        async with self._cond:
+            if write:
+                self._writers_waiting += 1
+                try:
+                    await self._cond.wait_for(lambda: not self._writer and not self._readers)
+                finally:
+                    self._writers_waiting -= 1
+                self._writer = True
+            else:
+                await self._cond.wait_for(lambda: not self._writer and not self._writers_waiting)
+                self._readers += 1
+
+    async def release(self, write: bool):
+        async with self._cond:
+            if write:
+                self._writer = False
+            else:
+                self._readers -= 1
+            self._cond.notify_all()
+
+
+class AsyncSaveManager:
+    """asyncio facade over a SaveManager; operations on different sections, and reads of the same one, overlap."""
+
+    def __init__(self, manager, executor: Optional[Executor] = None, max_workers: int = 4):
+        self.manager = manager
+        self._own_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="save-io")
+        sections = {section for names, _ in OPERATIONS.values() for section in names if section != ALL}
+        self._locks: Dict[str, _ReadWriteLock] = {section: _ReadWriteLock() for section in sorted(sections)}
+
+    def __getattr__(self, name: str):
+        if name not in OPERATIONS:
+            raise AttributeError(name)
+
+        @functools.wraps(getattr(self.manager, name))
+        async def operation(*args, **kwargs):
+            return await self.run(name, *args, **kwargs)
+        return operation
+
+    def _sections(self, names: Iterable[str]) -> list:
+        names = set(names)
+        if ALL in names:
+            return list(self._locks)
+        return sorted(names)
+
+    async def _locked(self, sections: list, write: bool, func, *args, **kwargs) -> Any:
+        # Always acquired in sorted order so overlapping operations cannot deadlock
+        acquired = []
+        try:
+            for section in sections:
+                await self._locks[section].acquire(write)
+                acquired.append(section)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+        finally:
+            for section in reversed(acquired):
+                await self._locks[section].release(write)
+
+    async def run(self, name: str, *args, **kwargs) -> Any:
+        """Run a SaveManager operation by name on the executor, holding the locks of the sections it touches."""
+        sections, write = OPERATIONS[name]
+        return await self._locked(self._sections(sections), write, getattr(self.manager, name), *args, **kwargs)
+
+    def close(self):
+        """Shut down the executor if this facade created it."""
+        if self._own_executor:
+            self.executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> "AsyncSaveManager":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,249 @@
+import marshal, os, tempfile, threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+JOURNAL_VERSION = 2
+
+
+def _fsync_dir(path: Path):
+    """Make a rename inside ``path`` durable. Only possible (and needed) on POSIX."""
+    if os.name == "nt":
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def disk_bytes(data: Union[str, bytes]) -> bytes:
+    """The bytes ``atomic_write`` puts on disk for ``data``."""
+    if isinstance(data, bytes):
+        return data
+    return data.replace("\n", os.linesep).encode('utf-8')
+
+
+def _write_temp(path: Path, data: Union[str, bytes], fsync: bool) -> str:
+    """Write ``data`` to a new temp file beside ``path``; returns the temp file's name."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        if isinstance(data, bytes):
+            f = os.fdopen(fd, 'wb')
+        else:
+            f = os.fdopen(fd, 'w', encoding='utf-8')
+        with f:
+            f.write(data)
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+    except BaseException:
+        _unlink(tmp_name)
+        raise
+    return tmp_name
+
+
+def _unlink(path: Union[str, Path]):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def atomic_write(path: Union[str, Path], data: Union[str, bytes], fsync: bool = True):
+    """Replace a file in one step by writing a temp file beside it and renaming it over the target."""
+    path = Path(path)
+    tmp_name = _write_temp(path, data, fsync)
+    try:
+        os.replace(tmp_name, path)
+    except BaseException:
+        _unlink(tmp_name)
+        raise
+    if fsync:
+        _fsync_dir(path.parent)
+
+
+def _sync_files(paths):
+    """Force files already written out to disk: one sync() where the OS has it, else an fsync per file."""
+    if hasattr(os, "sync"):
+        os.sync()
+        return
+    for path in paths:
+        try:
+            with open(path, 'r+b') as f:
+                os.fsync(f.fileno())
+        except OSError:
+            pass
+
+
+def same_content(path: Union[str, Path], data: Union[str, bytes]) -> bool:
+    """Whether the file at ``path`` already holds exactly what ``atomic_write(path, data)`` would write."""
+    data = disk_bytes(data)
+    try:
+        if os.stat(path).st_size != len(data):
+            return False
+        with open(path, 'rb') as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+class WriteJournal:
+    """Group commit: a group's files are written to temp files, synced together, then renamed over their targets.
+
+    A redo log of the renames is synced before the first one, so ``recover`` can finish them after a crash.
+    Groups are per thread; until its group ends, a thread reads its pending files through ``resolve``.
+    """
+
+    def __init__(self, journal_path: Path):
+        self.journal_path = Path(journal_path)
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        # Temp files of every thread's open group, hidden from listings
+        self._temps: Set[str] = set()
+
+    def _pending(self) -> Optional[Dict[str, Tuple[str, bool]]]:
+        """target -> (temp file, whether the target existed) for this thread's open group."""
+        return getattr(self._local, "pending", None)
+
+    @property
+    def active(self) -> bool:
+        return getattr(self._local, "depth", 0) > 0
+
+    def begin(self):
+        depth = getattr(self._local, "depth", 0)
+        if depth == 0:
+            self.recover()
+            self._local.pending = {}
+        self._local.depth = depth + 1
+
+    def end(self):
+        self._local.depth -= 1
+        if self._local.depth > 0:
+            return
+        pending, self._local.pending = self._local.pending, None
+        if pending:
+            self._commit(pending)
+
+    def _commit(self, pending: Dict[str, Tuple[str, bool]]):
+        renames = [(tmp, target, existed) for target, (tmp, existed) in pending.items()]
+        try:
+            with self._lock:
+                try:
+                    _sync_files([tmp for tmp, target, existed in renames])
+                    self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+                    atomic_write(self.journal_path, marshal.dumps({"version": JOURNAL_VERSION, "renames": renames}))
+                except OSError:
+                    # Nothing was renamed: the group is dropped and every file keeps its old content
+                    for tmp, target, existed in renames:
+                        _unlink(tmp)
+                    raise
+                errors = []
+                for tmp, target, existed in renames:
+                    try:
+                        os.replace(tmp, target)
+                    except OSError as e:
+                        # The rest of the group still goes in; only this file keeps its old content
+                        _unlink(tmp)
+                        errors.append(e)
+                for folder in {os.path.dirname(target) for tmp, target, existed in renames}:
+                    _fsync_dir(Path(folder))
+                os.unlink(self.journal_path)
+        finally:
+            with self._lock:
+                self._temps.difference_update(tmp for tmp, target, existed in renames)
+        if errors:
+            raise errors[0]
+
+    def write(self, path: Union[str, Path], data: Union[str, bytes]):
+        """Atomically replace a file; at once outside a group, when the group ends inside one."""
+        pending = self._pending()
+        if pending is None:
+            atomic_write(path, data)
+            return
+        path = str(path)
+        tmp = _write_temp(Path(path), data, fsync=False)
+        previous = pending.get(path)
+        if previous is not None:
+            _unlink(previous[0])
+        pending[path] = (tmp, previous[1] if previous is not None else os.path.exists(path))
+        with self._lock:
+            if previous is not None:
+                self._temps.discard(previous[0])
+            self._temps.add(tmp)
+
+    def resolve(self, path: Union[str, Path]) -> Path:
+        """Where this thread reads ``path`` from: its pending temp file inside a group, else ``path`` itself."""
+        pending = self._pending()
+        entry = pending.get(str(path)) if pending else None
+        return Path(entry[0]) if entry is not None else Path(path)
+
+    def pending_names(self, folder: Union[str, Path]) -> List[str]:
+        """Names of files this thread's group will create or replace in ``folder``."""
+        folder = str(folder)
+        return [os.path.basename(target) for target in self._pending() or ()
+                if os.path.dirname(target) == folder]
+
+    def pending_under(self, folder: Union[str, Path]) -> bool:
+        prefix = str(folder).rstrip("\\/") + os.sep
+        return any(target.startswith(prefix) for target in self._pending() or ())
+
+    def is_temp(self, path: Union[str, Path]) -> bool:
+        with self._lock:
+            return str(path) in self._temps
+
+    def forget(self, path: Union[str, Path]):
+        """Drop pending writes to a file (or everything under a folder) removed inside the group."""
+        pending = self._pending()
+        if not pending:
+            return
+        path = str(path)
+        for target in [target for target in pending
+                       if target == path or target.startswith(path.rstrip("\\/") + os.sep)]:
+            tmp, existed = pending.pop(target)
+            _unlink(tmp)
+            with self._lock:
+                self._temps.discard(tmp)
+
+    def recover(self) -> int:
+        """Finish the renames of a group whose commit a crash interrupted. Returns the number of files restored."""
+        with self._lock:
+            try:
+                with open(self.journal_path, 'rb') as f:
+                    stored = marshal.load(f)
+                renames = stored["renames"] if stored.get("version") == JOURNAL_VERSION else []
+            except FileNotFoundError:
+                return 0
+            except (OSError, EOFError, ValueError, TypeError, AttributeError, KeyError):
+                renames = []
+            restored = 0
+            folders = set()
+            for tmp, target, existed in renames:
+                try:
+                    tmp_mtime = os.stat(tmp).st_mtime_ns
+                except FileNotFoundError:
+                    continue  # renamed before the crash
+                try:
+                    # A target written after this group keeps its newer content
+                    replace = os.stat(target).st_mtime_ns <= tmp_mtime
+                except FileNotFoundError:
+                    # Deleted since: only new files are created
+                    replace = not existed
+                if replace:
+                    try:
+                        os.replace(tmp, target)
+                    except OSError:
+                        _unlink(tmp)
+                        continue
+                    folders.add(os.path.dirname(target))
+                    restored += 1
+                else:
+                    _unlink(tmp)
+            for folder in folders:
+                _fsync_dir(Path(folder))
+            _unlink(self.journal_path)
+            return restored
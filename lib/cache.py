@@ -0,0 +1,86 @@
+import marshal, os, threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class JsonCache:
+    """Thread-safe LRU cache of parsed JSON documents, keyed by path and (mtime_ns, size)."""
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], bytes]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _stat_key(path: Union[str, Path]) -> Tuple[int, int]:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+
+    def load(self, path: Union[str, Path], loader: Callable[[Path], Any],
+             stat: Optional[Tuple[int, int]] = None) -> Any:
+        """Return the parsed document at ``path``, calling ``loader`` on a miss or when the file changed."""
+        key = stat or self._stat_key(path)
+        with self._lock:
+            entry = self._entries.get(str(path))
+            if entry is not None and entry[0] == key:
+                self._entries.move_to_end(str(path))
+                self.hits += 1
+                return marshal.loads(entry[1])
+            self.misses += 1
+        data = loader(Path(path))
+        self._store(str(path), key, data)
+        return data
+
+    def put(self, path: Union[str, Path], data: Any, stat: Optional[Tuple[int, int]] = None):
+        """Refresh the entry for a file that was just written with ``data``."""
+        try:
+            key = stat or self._stat_key(path)
+        except OSError:
+            self.invalidate(path)
+            return
+        self._store(str(path), key, data)
+
+    def invalidate(self, path: Union[str, Path] = None):
+        """Drop one entry, or every entry when no path is given."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            entry = self._entries.pop(str(path), None)
+            if entry is not None:
+                self._bytes -= len(entry[1])
+
+    def _store(self, path: str, key: Tuple[int, int], data: Any):
+        self.invalidate(path)
+        try:
+            blob = marshal.dumps(data)
+        except ValueError:
+            return
+        if len(blob) > self.max_bytes:
+            return
+        with self._lock:
+            self.invalidate(path)
+            self._entries[path] = (key, blob)
+            self._bytes += len(blob)
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+        }
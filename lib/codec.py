@@ -0,0 +1,142 @@
+import json
+from pathlib import Path
+from typing import Any, Optional, Union
+from lib.atomic import atomic_write, same_content
+from lib.serializers import COMPACT, template_dumps
+
+try:
+    import orjson
+except ImportError:  # optional fast backend
+    orjson = None
+
+_BOM = b"\xef\xbb\xbf"
+# Output orjson may format differently from the stdlib: floats the stdlib writes in
+# exponent form (1e-05, 1e+16), NaN/Infinity (which orjson writes as null) and DEL,
+# which the stdlib escapes. A match inside a string only costs a stdlib fallback.
+_ORJSON_UNSAFE = (b"\x7f", b"0.0000", b"null") + tuple(b"%de" % digit for digit in range(10))
+
+# ``indent`` values besides a width, "\t" and None (json.dumps' one-line default):
+# COMPACT writes one line without spaces after separators, PRESERVE keeps the
+# layout the file already has
+PRESERVE = "preserve"
+# Enough of a file to judge its layout
+_HEAD_BYTES = 512
+
+
+def detect_indent(head: bytes, default: Union[int, str, None] = 4) -> Union[int, str, None]:
+    """The ``indent`` a JSON document was written with, judged from its first bytes."""
+    if head.startswith(_BOM):
+        head = head[len(_BOM):]
+    head = head.lstrip()
+    if head[:1] not in (b"{", b"["):
+        return default
+    body = head[1:]
+    if body.lstrip()[:1] in (b"", b"}", b"]"):
+        return default
+    newline = body.find(b"\n")
+    if newline != -1 and not body[:newline].strip():
+        line = body[newline + 1:]
+        if line.startswith(b"\t"):
+            return "\t"
+        return len(line) - len(line.lstrip(b" "))
+    token = b'":' if head[:1] == b"{" else b","
+    separator = body.find(token)
+    after = body[separator + len(token):separator + len(token) + 1]
+    if separator == -1 or not after:
+        return default
+    return None if after == b" " else COMPACT
+
+
+class JsonCodec:
+    """Stdlib JSON backend. Every save file read and write goes through a codec."""
+
+    name = "json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any, indent: Union[int, str, None] = 4) -> str:
+        """Serialize exactly like ``json.dumps(obj, indent=indent)``, or compactly for COMPACT."""
+        text = template_dumps(obj, indent)
+        if text is not None:
+            return text
+        if indent == COMPACT:
+            return json.dumps(obj, separators=(",", ":"))
+        return json.dumps(obj, indent=indent)
+
+    def load(self, path: Union[str, Path]) -> Any:
+        with open(path, 'rb') as f:
+            return self.loads(f.read())
+
+    @staticmethod
+    def file_indent(path: Union[str, Path], default: Union[int, str, None] = 4) -> Union[int, str, None]:
+        """The layout of the JSON file at ``path`` as an ``indent`` value, or ``default`` if there is none."""
+        try:
+            with open(path, 'rb') as f:
+                return detect_indent(f.read(_HEAD_BYTES), default)
+        except OSError:
+            return default
+
+    def dump(self, obj: Any, path: Union[str, Path], indent: Union[int, str, None] = 4, fsync: bool = True):
+        if indent == PRESERVE:
+            indent = self.file_indent(path)
+        # Text mode keeps the platform newline translation json.dump always had
+        atomic_write(path, self.dumps(obj, indent), fsync)
+
+    def dump_if_changed(self, obj: Any, path: Union[str, Path], indent: Union[int, str, None] = 4) -> bool:
+        """``dump`` unless the file already holds the same output. Returns True if it was written."""
+        if indent == PRESERVE:
+            indent = self.file_indent(path)
+        text = self.dumps(obj, indent)
+        if same_content(path, text):
+            return False
+        atomic_write(path, text)
+        return True
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson-backed codec producing output byte-identical to the stdlib backend."""
+
+    name = "orjson"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        if isinstance(data, bytes) and data.startswith(_BOM):
+            data = data[len(_BOM):]
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any, indent: Union[int, str, None] = 4) -> str:
+        if indent not in (2, 4, COMPACT):
+            return super().dumps(obj, indent)
+        try:
+            raw = orjson.dumps(obj, option=0 if indent == COMPACT else orjson.OPT_INDENT_2)
+        except (TypeError, orjson.JSONEncodeError):
+            return super().dumps(obj, indent)
+        if not raw.isascii() or any(token in raw for token in _ORJSON_UNSAFE):
+            return super().dumps(obj, indent)
+        text = raw.decode('ascii')
+        if indent == 4:
+            text = self._double_indent(text)
+        return text
+
+    @staticmethod
+    def _double_indent(text: str) -> str:
+        """Turn 2-space indentation into 4-space indentation."""
+        depth = 0
+        while "\n" + "  " * (depth + 1) in text:
+            depth += 1
+        for level in range(depth, 0, -1):
+            text = text.replace("\n" + "  " * level, "\n" + "\t" * level)
+        return text.replace("\t", "    ")
+
+
+def get_codec(name: Optional[str] = None) -> JsonCodec:
+    """Return the named backend, or the fastest one installed when ``name`` is None or "auto"."""
+    if name in (None, "auto"):
+        return OrjsonCodec() if orjson is not None else JsonCodec()
+    if name == "orjson":
+        if orjson is None:
+            raise ValueError("orjson is not installed")
+        return OrjsonCodec()
+    if name == "json":
+        return JsonCodec()
+    raise ValueError(f"Unknown JSON backend: {name}")
@@ -0,0 +1,120 @@
+import os, re, threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from lib.codec import COMPACT, JsonCodec
+from lib.loader import DEFAULT_IO_WORKERS
+
+STEAMID_PATTERN = re.compile(r"[0-9]{17}")
+SLOT_PATTERN = re.compile(r"SaveGame_[0-9]+")
+
+
+class SaveRoot(NamedTuple):
+    """A folder holding SteamID folders ("steam") or SaveGame_ folders ("legacy")."""
+    path: str
+    kind: str = "steam"
+
+
+class SlotInfo(NamedTuple):
+    path: str
+    name: str
+    root: str
+    kind: str
+    steam_id: Optional[str]
+
+
+class SaveDiscovery:
+    """Catalogue of every save slot under a set of save roots, re-listing only folders that changed."""
+
+    def __init__(self, roots: Iterable[SaveRoot], cache_path: Optional[Path] = None,
+                 codec: Optional[JsonCodec] = None, workers: Optional[int] = None):
+        self.roots = list(dict.fromkeys(roots))
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.codec = codec or JsonCodec()
+        self.workers = DEFAULT_IO_WORKERS if workers is None else max(1, int(workers))
+        self.listed = 0
+        self._lock = threading.Lock()
+        self._listings: Dict[str, Tuple[int, List[Tuple[str, bool]]]] = {}
+        self._slots: List[SlotInfo] = []
+        self._dirty = False
+        if self.cache_path is not None:
+            try:
+                stored = self.codec.load(self.cache_path)
+                self._listings = {path: (mtime, [tuple(child) for child in children])
+                                  for path, (mtime, children) in stored.get("listings", {}).items()}
+                self._slots = [SlotInfo(*slot) for slot in stored.get("slots", [])]
+            except (OSError, ValueError, TypeError, AttributeError):
+                self._listings, self._slots = {}, []
+
+    def add_root(self, root: SaveRoot):
+        if root not in self.roots:
+            self.roots.append(root)
+
+    def _list(self, folder: str) -> List[Tuple[str, bool]]:
+        """(name, is_dir) for the entries of a folder, from the cache while its mtime is unchanged."""
+        try:
+            mtime = os.stat(folder).st_mtime_ns
+        except OSError:
+            return []
+        with self._lock:
+            cached = self._listings.get(folder)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            with os.scandir(folder) as it:
+                children = sorted((entry.name, entry.is_dir()) for entry in it)
+        except OSError:
+            return []
+        with self._lock:
+            self._listings[folder] = (mtime, children)
+            self._dirty = True
+            self.listed += 1
+        return children
+
+    def _slots_in(self, folder: str, root: SaveRoot, steam_id: Optional[str]) -> List[SlotInfo]:
+        return [SlotInfo(os.path.join(folder, name), name, root.path, root.kind, steam_id)
+                for name, is_dir in self._list(folder) if is_dir and SLOT_PATTERN.fullmatch(name)]
+
+    def _scan_legacy(self, root: SaveRoot) -> List[SlotInfo]:
+        slots = self._slots_in(root.path, root, None)
+        if not slots and any(name.endswith(".json") for name, is_dir in self._list(root.path) if not is_dir):
+            slots = [SlotInfo(root.path, "Default Save", root.path, root.kind, None)]
+        return slots
+
+    def _scan_account(self, account: Tuple[SaveRoot, str]) -> List[SlotInfo]:
+        root, steam_id = account
+        return self._slots_in(os.path.join(root.path, steam_id), root, steam_id)
+
+    def refresh(self) -> List[SlotInfo]:
+        """Re-scan every root, listing only folders that changed. Returns the catalogue."""
+        steam_roots = [root for root in self.roots if root.kind == "steam"]
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            legacy = pool.map(self._scan_legacy, [root for root in self.roots if root.kind != "steam"])
+            listings = pool.map(self._list, [root.path for root in steam_roots])
+            accounts = [(root, name) for root, children in zip(steam_roots, listings)
+                        for name, is_dir in children if is_dir and STEAMID_PATTERN.fullmatch(name)]
+            slots = [slot for found in pool.map(self._scan_account, accounts) for slot in found]
+            slots += [slot for found in legacy for slot in found]
+        with self._lock:
+            if slots != self._slots:
+                self._slots = slots
+                self._dirty = True
+        return list(slots)
+
+    def cached(self) -> List[SlotInfo]:
+        """The catalogue from the last refresh, possibly from a previous run, without touching the disk."""
+        with self._lock:
+            return list(self._slots)
+
+    def save(self):
+        """Write the catalogue to ``cache_path`` if it changed. Raises OSError if it can't be written."""
+        with self._lock:
+            if not self._dirty or self.cache_path is None:
+                return
+            stored = {"listings": dict(self._listings), "slots": list(self._slots)}
+            self._dirty = False
+        try:
+            self.codec.dump(stored, self.cache_path, COMPACT)
+        except OSError:
+            self._dirty = True
+            raise
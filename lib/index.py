@@ -0,0 +1,163 @@
+import sqlite3, threading
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from lib.codec import JsonCodec
+from lib.manifest import SlotManifest
+from lib.storage import DiskStorage, SaveStorage
+
+SCHEMA_VERSION = 1
+
+
+class IndexedFile(NamedTuple):
+    path: str
+    data_type: Optional[str]
+    id: Optional[str]
+    name: Optional[str]
+    recruited: Optional[bool]
+    state: Optional[int]
+    property_code: Optional[str]
+    item_count: Optional[int]
+
+    @property
+    def parts(self) -> Tuple[str, ...]:
+        return tuple(self.path.split("/"))
+
+
+def _key_fields(data) -> tuple:
+    """Pull the indexed fields out of a parsed save document."""
+    if not isinstance(data, dict):
+        return (None, None, None, None, None, None, None)
+    recruited = data.get("Recruited")
+    state = data.get("State")
+    contents = data.get("Contents")
+    items = contents.get("Items") if isinstance(contents, dict) else None
+    return (
+        data.get("DataType"),
+        data.get("ID"),
+        data.get("Name"),
+        int(recruited) if isinstance(recruited, bool) else None,
+        state if isinstance(state, int) and not isinstance(state, bool) else None,
+        data.get("PropertyCode"),
+        len(items) if isinstance(items, list) else None,
+    )
+
+
+class SaveIndex:
+    """Persistent SQLite index of the size, mtime and key fields of every JSON file in a save slot."""
+
+    def __init__(self, save_path: Path, db_path: Path, workers: Optional[int] = None,
+                 codec: Optional[JsonCodec] = None,
+                 parse: Optional[Callable[[str, str], bool]] = None,
+                 process_threshold: Optional[int] = None,
+                 storage: Optional[SaveStorage] = None):
+        self.save_path = Path(save_path)
+        self.db_path = Path(db_path)
+        self.storage = storage or DiskStorage(self.save_path)
+        self.workers = workers
+        self.codec = codec
+        self.parse = parse
+        self.process_threshold = process_threshold
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._create_schema()
+
+    def _create_schema(self):
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self.conn.execute("DROP TABLE IF EXISTS files")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                parent TEXT NOT NULL,
+                filename TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                data_type TEXT,
+                id TEXT,
+                name TEXT,
+                recruited INTEGER,
+                state INTEGER,
+                property_code TEXT,
+                item_count INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS files_data_type ON files(data_type);
+            CREATE INDEX IF NOT EXISTS files_parent ON files(parent);
+        """)
+        self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def refresh(self, manifest: Optional[SlotManifest] = None) -> Tuple[int, int]:
+        """Re-read files whose size or mtime changed. Returns (reparsed, removed)."""
+        with self._lock:
+            return self._refresh(manifest)
+
+    def _refresh(self, manifest: Optional[SlotManifest]) -> Tuple[int, int]:
+        on_disk = (manifest or self.storage.manifest()).json_stats()
+        known = {path: (size, mtime) for path, size, mtime in
+                 self.conn.execute("SELECT path, size, mtime_ns FROM files")}
+
+        removed = [(path,) for path in known if path not in on_disk]
+        changed = [path for path, stat in on_disk.items() if known.get(path) != stat]
+
+        sniffed = {}
+        if self.parse is not None:
+            data_types = self.storage.sniff(changed, self.workers)
+            sniffed = {rel_path: data_type for rel_path, data_type in zip(changed, data_types)
+                       if data_type is not None and not self.parse(rel_path, data_type)}
+
+        parsed = dict(self.storage.load_json_files(
+            [rel_path for rel_path in changed if rel_path not in sniffed], self.codec or JsonCodec(),
+            self.workers, skip_errors=(OSError, ValueError), process_threshold=self.process_threshold))
+
+        rows = []
+        for rel_path in changed:
+            size, mtime = on_disk[rel_path]
+            if rel_path in sniffed:
+                fields = (sniffed[rel_path],) + (None,) * 6
+            else:
+                fields = _key_fields(parsed[rel_path]) if rel_path in parsed else (None,) * 7
+            parent, _, filename = rel_path.rpartition("/")
+            rows.append((rel_path, parent, filename, size, mtime) + fields)
+
+        with self.conn:
+            self.conn.executemany("DELETE FROM files WHERE path = ?", removed)
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        return len(rows), len(removed)
+
+    def find(self, data_type: Optional[str] = None, parent: Optional[str] = None,
+             under: Optional[str] = None, filename: Optional[str] = None) -> List[IndexedFile]:
+        """Query indexed files.
+
+        Args:
+            data_type: Match the file's DataType.
+            parent: Match files directly inside this relative folder.
+            under: Match files anywhere below this relative folder.
+            filename: Match the file name, e.g. "NPC.json".
+        """
+        clauses, params = [], []
+        if data_type is not None:
+            clauses.append("data_type = ?")
+            params.append(data_type)
+        if parent is not None:
+            clauses.append("parent = ?")
+            params.append(parent.strip("/"))
+        if under is not None:
+            prefix = under.strip("/") + "/"
+            clauses.append("substr(path, 1, ?) = ?")
+            params.extend([len(prefix), prefix])
+        if filename is not None:
+            clauses.append("filename = ?")
+            params.append(filename)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        query = ("SELECT path, data_type, id, name, recruited, state, property_code, item_count "
+                 f"FROM files{where} ORDER BY path")
+        with self._lock:
+            rows = self.conn.execute(query, params).fetchall()
+        return [IndexedFile(path, data_type, id_, name,
+                            None if recruited is None else bool(recruited), state, code, items)
+                for path, data_type, id_, name, recruited, state, code, items in rows]
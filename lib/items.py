@@ -0,0 +1,167 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from lib.codec import JsonCodec
+
+_UNDECODED = object()
+_MISSING = object()
+# Key orders seen so far; records with the same layout share one tuple
+_KEY_ORDERS: Dict[tuple, tuple] = {}
+
+
+class ItemRecord:
+    """Decoded item that converts back to a dict with the original key order."""
+
+    FIELDS = ("DataType", "ID", "Quantity", "Quality", "PackagingID")
+    __slots__ = FIELDS + ("extras", "_keys")
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        data = data or {}
+        for field in self.FIELDS:
+            setattr(self, field, data.get(field, _MISSING))
+        extras = {key: value for key, value in data.items() if key not in self.FIELDS}
+        self.extras = extras or None
+        keys = tuple(data)
+        self._keys = _KEY_ORDERS.setdefault(keys, keys)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.FIELDS:
+            value = getattr(self, key)
+            if value is _MISSING:
+                raise KeyError(key)
+            return value
+        if self.extras is None:
+            raise KeyError(key)
+        return self.extras[key]
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self:
+            keys = self._keys + (key,)
+            self._keys = _KEY_ORDERS.setdefault(keys, keys)
+        if key in self.FIELDS:
+            setattr(self, key, value)
+        else:
+            if self.extras is None:
+                self.extras = {}
+            self.extras[key] = value
+
+    def __contains__(self, key: object) -> bool:
+        if key in self.FIELDS:
+            return getattr(self, key) is not _MISSING
+        return self.extras is not None and key in self.extras
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        value = self[key]
+        if key in self.FIELDS:
+            setattr(self, key, _MISSING)
+        else:
+            del self.extras[key]
+        keys = tuple(k for k in self._keys if k != key)
+        self._keys = _KEY_ORDERS.setdefault(keys, keys)
+        return value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: self[key] for key in self._keys}
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ItemRecord):
+            return self.to_dict() == other.to_dict()
+        return self.to_dict() == other
+
+    def __repr__(self) -> str:
+        return f"ItemRecord({self.to_dict()!r})"
+
+
+class ItemList:
+    """An ``Items`` list of JSON-encoded item strings, re-encoded only where edited."""
+
+    def __init__(self, strings: List[str], codec: Optional[JsonCodec] = None):
+        self.codec = codec or JsonCodec()
+        self._strings: List[Optional[str]] = list(strings)
+        self._items: List[Any] = [_UNDECODED] * len(self._strings)
+        self._dirty = set()
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __getitem__(self, index: int) -> ItemRecord:
+        """Return the decoded item; raises ValueError if its string is not a JSON object."""
+        item = self._items[index]
+        if item is _UNDECODED:
+            data = self.codec.loads(self._strings[index])
+            if not isinstance(data, dict):
+                raise ValueError(f"Item {index} is not a JSON object")
+            item = self._items[index] = ItemRecord(data)
+        return item
+
+    def __setitem__(self, index: int, item: Union[ItemRecord, dict]):
+        self._items[index] = item if isinstance(item, ItemRecord) else ItemRecord(item)
+        self._dirty.add(index)
+
+    def decoded(self) -> Iterator[Tuple[int, ItemRecord]]:
+        """Yield (index, item) for every item that decodes to a JSON object."""
+        for index in range(len(self._strings)):
+            try:
+                item = self[index]
+            except (TypeError, ValueError):
+                continue
+            yield index, item
+
+    def find(self, data_type: str) -> Optional[Tuple[int, ItemRecord]]:
+        """Return (index, item) for the first item with the given DataType."""
+        for index, item in self.decoded():
+            if item.get("DataType") == data_type:
+                return index, item
+        return None
+
+    def mark_dirty(self, index: int):
+        self._dirty.add(index)
+
+    def update(self, index: int, fields: Dict[str, Any]) -> bool:
+        """Set fields on an item, flagging it only if a value actually changed."""
+        item = self[index]
+        changed = False
+        for key, value in fields.items():
+            if key not in item or item[key] != value or type(item[key]) is not type(value):
+                item[key] = value
+                changed = True
+        if changed:
+            self._dirty.add(index)
+        return changed
+
+    def append(self, item: Union[ItemRecord, dict]) -> int:
+        """Add a new item and return its index."""
+        self._strings.append(None)
+        self._items.append(item if isinstance(item, ItemRecord) else ItemRecord(item))
+        self._dirty.add(len(self._items) - 1)
+        return len(self._items) - 1
+
+    @property
+    def changed(self) -> bool:
+        return bool(self._dirty)
+
+    @property
+    def dirty_count(self) -> int:
+        return len(self._dirty)
+
+    def encode(self, order: Optional[Iterable[int]] = None) -> List[str]:
+        """Return the item strings, in ``order`` when given; unedited items keep their original string."""
+        for index in self._dirty:
+            self._strings[index] = self.codec.dumps(self._items[index].to_dict(), indent=None)
+        self._dirty.clear()
+        if order is None:
+            return list(self._strings)
+        return [self._strings[index] for index in order]
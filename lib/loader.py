@@ -0,0 +1,36 @@
+import json, os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Tuple
+from lib.codec import JsonCodec
+from lib.workers import decode_batch, run_batches
+
+DEFAULT_IO_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+
+_SKIPPED = object()
+
+
+def _read_json(path: Path, codec: JsonCodec, skip_errors: tuple) -> Any:
+    try:
+        return codec.load(path)
+    except skip_errors:
+        return _SKIPPED
+
+
+def load_json_files(paths: Iterable[Path], workers: Optional[int] = None,
+                    skip_errors: tuple = (json.JSONDecodeError,),
+                    codec: Optional[JsonCodec] = None,
+                    process_threshold: Optional[int] = None) -> List[Tuple[Path, Any]]:
+    """Read and decode JSON files in parallel. Returns (path, data) pairs in the order of ``paths``."""
+    paths = list(paths)
+    codec = codec or JsonCodec()
+    if process_threshold is not None and len(paths) >= process_threshold:
+        results = run_batches(decode_batch, paths, codec.name, skip_errors)
+        return [(path, data) for path, (ok, data) in zip(paths, results) if ok]
+    workers = DEFAULT_IO_WORKERS if workers is None else max(1, int(workers))
+    if workers == 1 or len(paths) < 2:
+        results = [_read_json(path, codec, skip_errors) for path in paths]
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+            results = list(pool.map(lambda path: _read_json(path, codec, skip_errors), paths))
+    return [(path, data) for path, data in zip(paths, results) if data is not _SKIPPED]
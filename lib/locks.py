@@ -0,0 +1,210 @@
+import errno, hashlib, os, threading, time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# Lock bytes in a slot's lock file; subtrees hash onto them, so unrelated subtrees rarely share one
+LOCK_BYTES = 64
+DEFAULT_LOCK_TIMEOUT = 30.0
+
+if os.name == "nt":
+    import ctypes, msvcrt
+    from ctypes import wintypes
+
+    class _Overlapped(ctypes.Structure):
+        _fields_ = [("Internal", ctypes.c_void_p), ("InternalHigh", ctypes.c_void_p),
+                    ("Offset", wintypes.DWORD), ("OffsetHigh", wintypes.DWORD), ("hEvent", wintypes.HANDLE)]
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _LOCKFILE_FAIL_IMMEDIATELY = 0x1
+    _LOCKFILE_EXCLUSIVE_LOCK = 0x2
+    _ERROR_LOCK_VIOLATION = 33
+
+    def _try_lock(fd: int, byte: int, exclusive: bool) -> bool:
+        flags = _LOCKFILE_FAIL_IMMEDIATELY | (_LOCKFILE_EXCLUSIVE_LOCK if exclusive else 0)
+        overlapped = _Overlapped(Offset=byte)
+        if _kernel32.LockFileEx(wintypes.HANDLE(msvcrt.get_osfhandle(fd)), flags, 0, 1, 0, ctypes.byref(overlapped)):
+            return True
+        error = ctypes.get_last_error()
+        if error == _ERROR_LOCK_VIOLATION:
+            return False
+        raise ctypes.WinError(error)
+
+    def _unlock(fd: int, byte: int):
+        overlapped = _Overlapped(Offset=byte)
+        _kernel32.UnlockFileEx(wintypes.HANDLE(msvcrt.get_osfhandle(fd)), 0, 1, 0, ctypes.byref(overlapped))
+else:
+    import fcntl
+
+    def _try_lock(fd: int, byte: int, exclusive: bool) -> bool:
+        try:
+            fcntl.lockf(fd, (fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) | fcntl.LOCK_NB, 1, byte)
+            return True
+        except OSError as e:
+            if e.errno in (errno.EACCES, errno.EAGAIN):
+                return False
+            raise
+
+    def _unlock(fd: int, byte: int):
+        fcntl.lockf(fd, fcntl.LOCK_UN, 1, byte)
+
+
+class SlotLockTimeout(RuntimeError):
+    """Another process kept part of a slot locked for longer than the lock timeout."""
+
+
+def subtree_of(rel_path: str) -> str:
+    """The top-level folder of a slot path, or "" for files at the slot's root."""
+    rel_path = rel_path.replace("\\", "/").lstrip("/")
+    return rel_path.split("/", 1)[0] if "/" in rel_path else ""
+
+
+class _Byte:
+    __slots__ = ("shared", "owner", "depth", "os_mode")
+
+    def __init__(self):
+        self.shared: Dict[int, int] = {}  # thread id -> depth of its shared holds
+        self.owner: Optional[int] = None  # thread holding it exclusively
+        self.depth = 0
+        self.os_mode: Optional[bool] = None  # True exclusive, False shared, None unlocked
+
+    def idle(self) -> bool:
+        return self.owner is None and not self.shared
+
+
+class SlotLock:
+    """Per-subtree shared/exclusive locks on a slot, shared between editor processes through a lock file."""
+
+    def __init__(self, path: Optional[Union[str, Path]], timeout: float = DEFAULT_LOCK_TIMEOUT, granular: bool = True):
+        self.path = Path(path) if path is not None else None
+        self.timeout = timeout
+        self.granular = granular
+        self._cond = threading.Condition()
+        self._bytes: Dict[int, _Byte] = {}
+        self._fd: Optional[int] = None
+
+    def _byte_numbers(self, subtrees: Tuple[str, ...]) -> List[int]:
+        if not self.granular:
+            return [0]
+        if not subtrees:
+            return list(range(LOCK_BYTES))
+        return sorted({int.from_bytes(hashlib.blake2b(subtree.encode('utf-8'), digest_size=4).digest(), "little")
+                       % LOCK_BYTES for subtree in subtrees})
+
+    @contextmanager
+    def shared(self, *subtrees: str) -> Iterator[None]:
+        """Hold the subtrees (the whole slot if none) for reading."""
+        held = self._acquire(self._byte_numbers(subtrees), False)
+        try:
+            yield
+        finally:
+            self._release(held)
+
+    @contextmanager
+    def exclusive(self, *subtrees: str) -> Iterator[None]:
+        """Hold the subtrees (the whole slot if none) for writing."""
+        held = self._acquire(self._byte_numbers(subtrees), True)
+        try:
+            yield
+        finally:
+            self._release(held)
+
+    def _acquire(self, numbers: List[int], exclusive: bool) -> List[int]:
+        me = threading.get_ident()
+        held: List[int] = []
+        try:
+            for number in numbers:
+                self._acquire_byte(number, exclusive, me)
+                held.append(number)
+        except BaseException:
+            self._release(held)
+            raise
+        return held
+
+    def _acquire_byte(self, number: int, exclusive: bool, me: int):
+        deadline = None
+        delay = 0.005
+        with self._cond:
+            state = self._bytes.setdefault(number, _Byte())
+            if state.owner == me:
+                state.depth += 1
+                return
+            if me in state.shared:
+                if exclusive:
+                    raise RuntimeError(f"Cannot lock {self.path} for writing while reading it on the same thread")
+                state.shared[me] += 1
+                return
+            while True:
+                if not (exclusive and state.idle() or not exclusive and state.owner is None):
+                    # Held by another thread of this process, which wakes us when it releases
+                    self._cond.wait()
+                    continue
+                if state.os_mode is not None or self._os_lock(number, exclusive):
+                    if exclusive:
+                        state.owner, state.depth = me, 1
+                    else:
+                        state.shared[me] = 1
+                    return
+                # Held by another process: poll until the timeout
+                now = time.monotonic()
+                if deadline is None:
+                    deadline = now + self.timeout
+                elif now >= deadline:
+                    raise SlotLockTimeout(f"Timed out after {self.timeout:g}s waiting for the lock on {self.path}")
+                self._cond.wait(min(delay, deadline - now))
+                delay = min(delay * 2, 0.1)
+
+    def _os_lock(self, number: int, exclusive: bool) -> bool:
+        if self.path is None:
+            self._bytes[number].os_mode = exclusive
+            return True
+        if self._fd is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+        if not _try_lock(self._fd, number, exclusive):
+            return False
+        self._bytes[number].os_mode = exclusive
+        return True
+
+    def _release(self, numbers: List[int]):
+        me = threading.get_ident()
+        with self._cond:
+            for number in reversed(numbers):
+                state = self._bytes[number]
+                if state.owner == me:
+                    state.depth -= 1
+                    if state.depth == 0:
+                        state.owner = None
+                else:
+                    state.shared[me] -= 1
+                    if state.shared[me] == 0:
+                        del state.shared[me]
+                if state.idle():
+                    if self._fd is not None and state.os_mode is not None:
+                        _unlock(self._fd, number)
+                    state.os_mode = None
+            self._cond.notify_all()
+
+    def close(self):
+        """Close the lock file if nothing is held, e.g. before the slot is deleted."""
+        with self._cond:
+            if self._fd is not None and all(state.idle() for state in self._bytes.values()):
+                os.close(self._fd)
+                self._fd = None
+
+
+_registry: Dict[str, SlotLock] = {}
+_registry_lock = threading.Lock()
+
+
+def slot_lock(path: Optional[Union[str, Path]], timeout: float = DEFAULT_LOCK_TIMEOUT, granular: bool = True) -> SlotLock:
+    """The lock of the slot whose lock file is ``path``, shared by everything in this process."""
+    if path is None:
+        return SlotLock(None, timeout, granular)
+    key = str(Path(path).resolve())
+    with _registry_lock:
+        lock = _registry.get(key)
+        if lock is None:
+            lock = _registry[key] = SlotLock(path, timeout, granular)
+        lock.timeout = timeout
+        return lock
@@ -0,0 +1,90 @@
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+class ManifestEntry(NamedTuple):
+    path: str
+    is_dir: bool
+    size: int
+    mtime_ns: int
+
+
+class SlotManifest:
+    """Snapshot of a save slot's file tree taken in one os.scandir walk."""
+
+    def __init__(self, root: Path, walk: bool = True):
+        self.root = Path(root)
+        self.entries: Dict[str, ManifestEntry] = {}
+        self._children: Dict[str, List[str]] = {"": []}
+        self.syscalls = 0
+        if walk:
+            self._walk("", str(self.root))
+
+    @classmethod
+    def from_entries(cls, root: Path, entries: Iterable[ManifestEntry]) -> "SlotManifest":
+        """Build a manifest from entries listed elsewhere (a zip or in-memory slot), parents first."""
+        manifest = cls(root, walk=False)
+        for entry in entries:
+            parent, _, name = entry.path.rpartition("/")
+            manifest.entries[entry.path] = entry
+            manifest._children.setdefault(parent, []).append(name)
+            if entry.is_dir:
+                manifest._children.setdefault(entry.path, [])
+        for names in manifest._children.values():
+            names.sort()
+        return manifest
+
+    def _walk(self, rel_dir: str, abs_dir: str):
+        try:
+            self.syscalls += 1
+            with os.scandir(abs_dir) as it:
+                dir_entries = list(it)
+        except OSError:
+            return
+        names = self._children.setdefault(rel_dir, [])
+        subdirs = []
+        for dir_entry in dir_entries:
+            rel_path = f"{rel_dir}/{dir_entry.name}" if rel_dir else dir_entry.name
+            try:
+                is_dir = dir_entry.is_dir(follow_symlinks=False)
+                if is_dir:
+                    size, mtime_ns = 0, 0
+                else:
+                    if os.name != "nt":
+                        self.syscalls += 1
+                    st = dir_entry.stat(follow_symlinks=False)
+                    size, mtime_ns = st.st_size, st.st_mtime_ns
+            except OSError:
+                continue
+            self.entries[rel_path] = ManifestEntry(rel_path, is_dir, size, mtime_ns)
+            names.append(dir_entry.name)
+            if is_dir:
+                subdirs.append((rel_path, dir_entry.path))
+        names.sort()
+        for rel_path, abs_path in subdirs:
+            self._walk(rel_path, abs_path)
+
+    def exists(self, rel_path: str) -> bool:
+        return rel_path.strip("/") in self.entries
+
+    def is_dir(self, rel_path: str) -> bool:
+        entry = self.entries.get(rel_path.strip("/"))
+        return entry is not None and entry.is_dir
+
+    def children(self, rel_dir: str = "", dirs: Optional[bool] = None) -> List[str]:
+        """Names directly inside ``rel_dir``; ``dirs`` limits the result to folders (True) or files (False)."""
+        rel_dir = rel_dir.strip("/")
+        names = self._children.get(rel_dir, [])
+        if dirs is None:
+            return list(names)
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        return [name for name in names if self.entries[prefix + name].is_dir == dirs]
+
+    def files(self, suffix: str = "") -> List[ManifestEntry]:
+        return [entry for entry in self.entries.values()
+                if not entry.is_dir and entry.path.endswith(suffix)]
+
+    def json_stats(self) -> Dict[str, Tuple[int, int]]:
+        """Return {relative path: (size, mtime_ns)} for every JSON file in the slot."""
+        return {entry.path: (entry.size, entry.mtime_ns) for entry in self.files(".json")}
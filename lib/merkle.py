@@ -0,0 +1,181 @@
+import hashlib, marshal, os, shutil
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+MERKLE_VERSION = 1
+_CHUNK = 1024 * 1024
+
+
+def _hash_file(path: str) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            h.update(chunk)
+    return h.digest()
+
+
+def _join(rel_dir: str, name: str) -> str:
+    if not rel_dir or not name:
+        return rel_dir or name
+    return f"{rel_dir}/{name}"
+
+
+class TreeDiff(NamedTuple):
+    """Relative paths that differ between two trees; a folder is listed once, not per file."""
+    only_left: List[str]
+    only_right: List[str]
+    changed: List[str]
+
+    def __bool__(self) -> bool:
+        return bool(self.only_left or self.only_right or self.changed)
+
+
+class MerkleTree:
+    """Content hash per file and per folder of a directory tree, optionally persisted between runs."""
+
+    def __init__(self, root: Union[str, Path], store_path: Optional[Path] = None, ignore: Iterable[str] = ()):
+        self.root = Path(root)
+        self.store_path = Path(store_path) if store_path else None
+        self.ignore = frozenset(ignore)
+        self.nodes: Dict[str, tuple] = {}
+        self.hashed = 0
+        if self.store_path is not None:
+            try:
+                with open(self.store_path, 'rb') as f:
+                    stored = marshal.load(f)
+                if stored.get("version") == MERKLE_VERSION and stored.get("root") == str(self.root):
+                    self.nodes = stored["nodes"]
+            except (OSError, EOFError, ValueError, TypeError, AttributeError, KeyError):
+                self.nodes = {}
+
+    @property
+    def root_hash(self) -> Optional[bytes]:
+        node = self.nodes.get("")
+        return node[1] if node else None
+
+    def refresh(self) -> "MerkleTree":
+        """Re-walk the tree, hashing only new or modified files. Returns self."""
+        old, self.nodes = self.nodes, {}
+        self.hashed = 0
+        if self.root.is_dir():
+            self._hash_dir("", str(self.root), old)
+        return self
+
+    def _hash_dir(self, rel_dir: str, abs_dir: str, old: Dict[str, tuple]) -> bytes:
+        h = hashlib.blake2b(digest_size=16)
+        names = []
+        with os.scandir(abs_dir) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        for entry in entries:
+            if not rel_dir and entry.name in self.ignore:
+                continue
+            rel_path = _join(rel_dir, entry.name)
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    kind, digest = b"d", self._hash_dir(rel_path, entry.path, old)
+                else:
+                    st = entry.stat(follow_symlinks=False)
+                    previous = old.get(rel_path)
+                    if previous and previous[0] == "f" and previous[1:3] == (st.st_mtime_ns, st.st_size):
+                        digest = previous[3]
+                    else:
+                        digest = _hash_file(entry.path)
+                        self.hashed += 1
+                    self.nodes[rel_path] = ("f", st.st_mtime_ns, st.st_size, digest)
+                    kind = b"f"
+            except OSError:
+                continue
+            h.update(kind + entry.name.encode('utf-8') + b"\0" + digest)
+            names.append(entry.name)
+        digest = h.digest()
+        self.nodes[rel_dir] = ("d", digest, tuple(names))
+        return digest
+
+    def invalidate(self, rel_path: str):
+        """Forget the stored hashes of a path and everything below it."""
+        if not rel_path:
+            self.nodes.clear()
+            return
+        prefix = rel_path + "/"
+        for key in [key for key in self.nodes if key == rel_path or key.startswith(prefix)]:
+            del self.nodes[key]
+
+    def save(self):
+        """Write the hashes to ``store_path``. Raises OSError if they can't be written."""
+        if self.store_path is None:
+            return
+        tmp_path = self.store_path.with_name(self.store_path.name + ".tmp")
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            marshal.dump({"version": MERKLE_VERSION, "root": str(self.root), "nodes": self.nodes}, f)
+        os.replace(tmp_path, self.store_path)
+
+
+def diff_trees(left: MerkleTree, right: MerkleTree, left_rel: str = "", right_rel: str = "") -> TreeDiff:
+    """Compare ``left_rel`` in one tree with ``right_rel`` in another. Returns paths relative to them."""
+    result = TreeDiff([], [], [])
+    left_node, right_node = left.nodes.get(left_rel), right.nodes.get(right_rel)
+    if left_node is None or right_node is None:
+        if left_node is not None:
+            result.only_left.append("")
+        elif right_node is not None:
+            result.only_right.append("")
+        return result
+    stack: List[Tuple[str, tuple, tuple]] = [("", left_node, right_node)]
+    while stack:
+        rel, left_node, right_node = stack.pop()
+        if left_node[1] == right_node[1]:
+            continue
+        left_names, right_names = set(left_node[2]), set(right_node[2])
+        for name in sorted(left_names | right_names):
+            child = _join(rel, name)
+            if name not in right_names:
+                result.only_left.append(child)
+                continue
+            if name not in left_names:
+                result.only_right.append(child)
+                continue
+            left_child = left.nodes[_join(left_rel, child)]
+            right_child = right.nodes[_join(right_rel, child)]
+            if left_child[0] != right_child[0]:
+                result.changed.append(child)
+            elif left_child[0] == "d":
+                stack.append((child, left_child, right_child))
+            elif left_child[3] != right_child[3]:
+                result.changed.append(child)
+    return result
+
+
+def mirror_tree(source: MerkleTree, target: MerkleTree, source_rel: str = "", target_rel: str = "") -> int:
+    """Make ``target_rel`` a copy of ``source_rel``, touching only what differs. Returns the count touched."""
+    diff = diff_trees(source, target, source_rel, target_rel)
+    source_dir = source.root / source_rel
+    target_dir = target.root / target_rel
+
+    def remove(rel):
+        path = target_dir / rel
+        if path.is_dir() and not path.is_symlink():
+            shutil.rmtree(path)
+        elif path.exists():
+            path.unlink()
+
+    def copy(rel):
+        src, dst = source_dir / rel, target_dir / rel
+        if src.is_dir():
+            shutil.copytree(src, dst)
+        else:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(src, dst)
+
+    for rel in diff.only_right:
+        remove(rel)
+    for rel in diff.changed:
+        if source.nodes[_join(source_rel, rel)][0] != target.nodes[_join(target_rel, rel)][0]:
+            remove(rel)
+        copy(rel)
+    for rel in diff.only_left:
+        copy(rel)
+    for rel in diff.only_right + diff.changed + diff.only_left:
+        target.invalidate(_join(target_rel, rel))
+    target.refresh()
+    return len(diff.only_left) + len(diff.only_right) + len(diff.changed)
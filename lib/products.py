@@ -0,0 +1,261 @@
+import json, re
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+from lib.codec import JsonCodec
+from lib.storage import DiskStorage, SaveStorage
+
+_KEY_LINE = re.compile(r'"((?:[^"\\]|\\.)*)": (.*)$')
+
+
+class ProductsLayoutError(ValueError):
+    """Products.json is not laid out the way the streaming editor expects."""
+
+
+class ProductsFile:
+    """Edits the top-level arrays of Products.json one element at a time."""
+
+    def __init__(self, path: Union[str, Path], codec: Optional[JsonCodec] = None,
+                 storage: Optional[SaveStorage] = None):
+        self.path = Path(path)
+        self.codec = codec or JsonCodec()
+        if storage is None:
+            self.storage, self.rel_path = DiskStorage(self.path.parent), self.path.name
+        else:
+            self.storage, self.rel_path = storage, self.path.as_posix()
+
+    def exists(self) -> bool:
+        return self.storage.exists(self.rel_path)
+
+    @staticmethod
+    def _indent_unit(first_lines: List[str]) -> int:
+        if len(first_lines) < 2 or first_lines[0].rstrip("\n") != "{":
+            raise ProductsLayoutError("document does not start with '{' on its own line")
+        unit = len(first_lines[1]) - len(first_lines[1].lstrip(" "))
+        if unit == 0:
+            raise ProductsLayoutError("top-level keys are not indented")
+        return unit
+
+    def _elements(self, lines: Iterator[str], unit: int) -> Iterator[str]:
+        """Yield the raw lines of each element of an open array, up to its closing bracket."""
+        element: List[str] = []
+        for line in lines:
+            indent = len(line) - len(line.lstrip(" "))
+            stripped = line.strip()
+            if indent == unit and stripped in ("]", "],"):
+                if element:
+                    yield "".join(element)
+                self._close = stripped
+                return
+            if indent < 2 * unit:
+                raise ProductsLayoutError(f"unexpected line inside array: {stripped[:40]}")
+            starts_element = indent == 2 * unit and stripped[:1] not in ("}", "]")
+            if starts_element and element:
+                yield "".join(element)
+                element = []
+            element.append(line)
+        raise ProductsLayoutError("unterminated array")
+
+    @staticmethod
+    def _element_text(raw: str) -> str:
+        text = raw.rstrip()
+        return text[:-1] if text.endswith(",") else text
+
+    def iter_array(self, key: str) -> Iterator[Any]:
+        """Yield the elements of a top-level array, falling back to a full load for unexpected layouts."""
+        try:
+            yield from self._stream_array(key)
+        except ProductsLayoutError:
+            yield from self.storage.load_json(self.rel_path, self.codec).get(key, [])
+
+    def _stream_array(self, key: str) -> Iterator[Any]:
+        with self.storage.open_text(self.rel_path) as f:
+            lines = iter(f)
+            head = [next(lines, ""), next(lines, "")]
+            unit = self._indent_unit(head)
+            lines = self._chain(head[1:], lines)
+            for line in lines:
+                indent = len(line) - len(line.lstrip(" "))
+                match = _KEY_LINE.match(line.strip()) if indent == unit else None
+                if match is None or json.loads(f'"{match.group(1)}"') != key:
+                    continue
+                if match.group(2) in ("[]", "[],"):
+                    return
+                if match.group(2) != "[":
+                    raise ProductsLayoutError(f"{key} is not an array")
+                for raw in self._elements(lines, unit):
+                    yield self.codec.loads(self._element_text(raw))
+                return
+
+    @staticmethod
+    def _chain(first: List[str], rest: Iterator[str]) -> Iterator[str]:
+        yield from first
+        yield from rest
+
+    def edit(self, append: Optional[Dict[str, Iterable[Any]]] = None,
+             keep: Optional[Dict[str, Callable[[Any], bool]]] = None,
+             unique: Iterable[str] = (), default: Optional[dict] = None):
+        """Filter and extend top-level arrays.
+
+        Args:
+            append: Values to add to the end of each named array; missing arrays are created.
+            keep: Predicate per array; elements for which it returns False are dropped.
+            unique: Arrays of plain values (IDs) whose appended values are skipped when already present.
+            default: Document to start from when the file does not exist.
+        """
+        append = {key: list(values) for key, values in (append or {}).items()}
+        keep = keep or {}
+        unique = set(unique)
+        if not self.exists():
+            self._edit_loaded(dict(default or {}), append, keep, unique)
+            return
+        try:
+            self._edit_streaming(append, keep, unique)
+        except ProductsLayoutError:
+            self._edit_loaded(self.storage.load_json(self.rel_path, self.codec), append, keep, unique)
+
+    def _edit_loaded(self, data: dict, append: Dict[str, list], keep: Dict[str, Callable[[Any], bool]],
+                     unique: set):
+        for key, predicate in keep.items():
+            if key in data:
+                data[key] = [value for value in data[key] if predicate(value)]
+        for key, values in append.items():
+            target = data.setdefault(key, [])
+            if key in unique:
+                values = self._new_values(values, set(target))
+            target.extend(values)
+        self.storage.dump_json(self.rel_path, data, self.codec)
+
+    @staticmethod
+    def _new_values(values: list, seen: set) -> list:
+        fresh = []
+        for value in values:
+            if value not in seen:
+                seen.add(value)
+                fresh.append(value)
+        return fresh
+
+    def _copied_elements(self, lines: Iterator[str], unit: int) -> Iterator[str]:
+        """Pass an array's existing elements through unparsed, as one chunk per line."""
+        closing = (" " * unit + "]", " " * unit + "],")
+        held = None
+        for line in lines:
+            if line.rstrip("\n") in closing:
+                if held is not None:
+                    yield held.rstrip("\n")
+                self._close = line.strip()
+                return
+            if held is not None:
+                yield held
+            held = line
+        raise ProductsLayoutError("unterminated array")
+
+    def _kept_elements(self, raws: Iterator[str], predicate: Optional[Callable[[Any], bool]],
+                       seen: Optional[set]) -> Iterator[str]:
+        """Yield the text of existing elements that pass ``predicate``, recording values in ``seen``."""
+        for raw in raws:
+            text = self._element_text(raw)
+            literal = text.strip()
+            if literal[:1] == '"' and "\\" not in literal:
+                value = literal[1:-1]  # plain string ID, no escapes to decode
+            else:
+                value = self.codec.loads(text)
+            if predicate is not None and not predicate(value):
+                continue
+            if seen is not None:
+                seen.add(value)
+            yield text
+
+    def _write_array(self, out, prefix: str, existing: Iterable[str], values: list,
+                     close: Optional[str], unit: int, seen: Optional[set] = None, raw: bool = False) -> str:
+        """Write an array element by element and return its closing line, unwritten."""
+        count = 0
+        for text in existing:
+            if count == 0:
+                out.write(f"{prefix}[\n")
+            elif not raw:
+                out.write(",\n")
+            out.write(text)
+            count += 1
+        if seen is not None:
+            values = self._new_values(values, seen)
+        for value in values:
+            out.write(f"{prefix}[\n" if count == 0 else ",\n")
+            out.write(self._format_element(value, unit))
+            count += 1
+        close = close or self._close
+        if count == 0:
+            return f"{prefix}[]{close[1:]}\n"
+        out.write("\n")
+        return f"{' ' * unit}{close}\n"
+
+    def _format_element(self, value: Any, unit: int) -> str:
+        text = self.codec.dumps(value, indent=unit)
+        return " " * (2 * unit) + text.replace("\n", "\n" + " " * (2 * unit))
+
+    def _edit_streaming(self, append: Dict[str, list], keep: Dict[str, Callable[[Any], bool]], unique: set):
+        pending = dict(append)
+        # The source is closed before the rewritten file replaces it
+        with self.storage.replace_text(self.rel_path) as out, self.storage.open_text(self.rel_path) as src:
+            lines = iter(src)
+            head = [next(lines, ""), next(lines, "")]
+            unit = self._indent_unit(head)
+            out.write(head[0])
+            lines = self._chain(head[1:], lines)
+            # The last line of the previous top-level value is held back so a
+            # comma can be added to it when new arrays go at the end.
+            previous = None
+            nested = " " * (unit + 1)
+            for line in lines:
+                if line.startswith(nested):
+                    # Inside a value that is not being edited
+                    if previous is not None:
+                        out.write(previous)
+                    previous = line
+                    continue
+                indent = len(line) - len(line.lstrip(" "))
+                stripped = line.strip()
+                if indent == 0 and stripped == "}":
+                    if pending:
+                        if previous is None:
+                            raise ProductsLayoutError("empty document")
+                        out.write(previous.rstrip("\n") + ",\n")
+                        keys = list(pending)
+                        previous = None
+                        for key in keys:
+                            if previous is not None:
+                                out.write(previous.rstrip("\n") + ",\n")
+                            values = pending.pop(key)
+                            if key in unique:
+                                values = self._new_values(values, set())
+                            previous = self._write_array(out, f"{' ' * unit}{json.dumps(key)}: ", (),
+                                                         values, "]", unit)
+                    if previous is not None:
+                        out.write(previous)
+                    out.write(line)
+                    for rest in lines:
+                        if rest.strip():
+                            raise ProductsLayoutError("data after the closing brace")
+                    break
+                if previous is not None:
+                    out.write(previous)
+                    previous = None
+                match = _KEY_LINE.match(stripped) if indent == unit else None
+                key = json.loads(f'"{match.group(1)}"') if match else None
+                if match and match.group(2) in ("[", "[]", "[],") and (key in keep or key in pending):
+                    predicate = keep.get(key)
+                    seen = set() if key in unique else None
+                    raw = match.group(2) == "[" and predicate is None and seen is None
+                    if raw:
+                        existing = self._copied_elements(lines, unit)
+                    elif match.group(2) == "[":
+                        existing = self._kept_elements(self._elements(lines, unit), predicate, seen)
+                    else:
+                        existing = ()
+                        self._close = "]," if match.group(2).endswith(",") else "]"
+                    prefix = line[:indent] + stripped[:-len(match.group(2))]
+                    values = pending.pop(key, [])
+                    previous = self._write_array(out, prefix, existing, values, None, unit, seen, raw)
+                    continue
+                previous = line
+            else:
+                raise ProductsLayoutError("missing closing brace")
@@ -0,0 +1,52 @@
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterator
+
+
+class LazySaveData(MutableMapping):
+    """Save document whose sections are parsed the first time they are read."""
+
+    def __init__(self):
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._values: Dict[str, Any] = {}
+
+    def register(self, key: str, loader: Callable[[], Any]):
+        """Register a loader for a section, dropping any cached value."""
+        self._loaders[key] = loader
+        self._values.pop(key, None)
+
+    def is_loaded(self, key: str) -> bool:
+        return key in self._values
+
+    def invalidate(self, key: str = None):
+        """Forget the cached value of a section (or all sections) so it is re-read on next access."""
+        if key is None:
+            for loaded_key in list(self._values):
+                if loaded_key in self._loaders:
+                    del self._values[loaded_key]
+        elif key in self._loaders:
+            self._values.pop(key, None)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._values:
+            if key not in self._loaders:
+                raise KeyError(key)
+            self._values[key] = self._loaders[key]()
+        return self._values[key]
+
+    def __setitem__(self, key: str, value: Any):
+        self._values[key] = value
+
+    def __delitem__(self, key: str):
+        if key not in self._values and key not in self._loaders:
+            raise KeyError(key)
+        self._values.pop(key, None)
+        self._loaders.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values or key in self._loaders
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(dict.fromkeys([*self._loaders, *self._values]))
+
+    def __len__(self) -> int:
+        return len(self._loaders.keys() | self._values.keys())
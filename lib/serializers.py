@@ -0,0 +1,206 @@
+import json
+from json.encoder import INFINITY, encode_basestring_ascii
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+# ``indent`` value for one line without spaces after separators (re-exported by lib.codec)
+COMPACT = "compact"
+
+
+class Field(NamedTuple):
+    """A value of a template prototype that ``Template.fill`` takes as a keyword argument."""
+    name: str
+
+
+def _floatstr(value: float) -> str:
+    # As the json module writes floats
+    if value != value:
+        return "NaN"
+    if value == INFINITY:
+        return "Infinity"
+    if value == -INFINITY:
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+class _Layout:
+    """Whitespace and value encoding matching ``json.dumps`` for one ``indent`` value."""
+
+    def __init__(self, indent: Union[int, str, None]):
+        self.indent = indent
+        self.newlines = indent is not None and indent != COMPACT
+        self.unit = (" " * indent if isinstance(indent, int) else indent) if self.newlines else ""
+        self.item_sep = "," if indent is not None else ", "
+        self.key_sep = ":" if indent == COMPACT else ": "
+
+    def newline(self, depth: int) -> str:
+        return "\n" + self.unit * depth if self.newlines else ""
+
+    def dumps(self, value: Any) -> str:
+        if self.indent == COMPACT:
+            return json.dumps(value, separators=(",", ":"))
+        return json.dumps(value, indent=self.indent)
+
+    def encoder(self) -> Callable[[Any, int], str]:
+        """``encode(value, depth)``: the text of a value nested ``depth`` levels deep."""
+        newlines, unit, item_sep, dumps = self.newlines, self.unit, self.item_sep, self.dumps
+
+        def encode(value: Any, depth: int) -> str:
+            kind = type(value)
+            if kind is str:
+                return encode_basestring_ascii(value)
+            if value is None:
+                return "null"
+            if value is True:
+                return "true"
+            if value is False:
+                return "false"
+            if kind is int:
+                return int.__repr__(value)
+            if kind is float:
+                return _floatstr(value)
+            if kind is list and all(type(item) is str for item in value):
+                # Lists of IDs and encoded items are the common case
+                if not value:
+                    return "[]"
+                if not newlines:
+                    return "[" + item_sep.join(map(encode_basestring_ascii, value)) + "]"
+                inner = "\n" + unit * (depth + 1)
+                return ("[" + inner + ("," + inner).join(map(encode_basestring_ascii, value))
+                        + "\n" + unit * depth + "]")
+            text = dumps(value)
+            return text.replace("\n", "\n" + unit * depth) if newlines and depth else text
+        return encode
+
+
+class Template:
+    """Serializer compiled for one document layout, byte-identical to ``json.dumps``."""
+
+    def __init__(self, prototype: dict):
+        self.prototype = prototype
+        self.keys = tuple(prototype)
+        self.data_type = prototype.get("DataType")
+        self._compiled: Dict[Any, Tuple[Callable[[dict], Optional[str]], Callable[..., str]]] = {}
+
+    def _compile(self, indent: Union[int, str, None]) -> Tuple[Callable[[dict], Optional[str]], Callable[..., str]]:
+        compiled = self._compiled.get(indent)
+        if compiled is not None:
+            return compiled
+        layout = _Layout(indent)
+        encode = layout.encoder()
+        checks: List[str] = []
+        fields: List[str] = []
+
+        def build(proto: dict, expr: Optional[str], depth: int) -> List[Tuple[bool, str]]:
+            """(is_code, text) pieces of an object: literal text, or an expression for a leaf."""
+            pieces = []
+            for position, (key, sub) in enumerate(proto.items()):
+                pieces.append((False, ("{" if position == 0 else layout.item_sep) + layout.newline(depth + 1)
+                               + encode_basestring_ascii(key) + layout.key_sep))
+                value = None if expr is None else f"{expr}[{key!r}]"
+                if type(sub) is dict and sub:
+                    if value is not None:
+                        checks.append(f"type({value}) is dict and tuple({value}) == {tuple(sub)!r}")
+                    pieces.extend(build(sub, value, depth + 1))
+                elif value is not None:
+                    pieces.append((True, f"enc({value}, {depth + 1})"))
+                elif isinstance(sub, Field):
+                    fields.append(sub.name)
+                    pieces.append((True, f"enc({sub.name}, {depth + 1})"))
+                else:
+                    pieces.append((False, encode(sub, depth + 1)))
+            pieces.append((False, layout.newline(depth) + "}"))
+            return pieces
+
+        def join(pieces: List[Tuple[bool, str]]) -> str:
+            merged: List[str] = []
+            literal = ""
+            for is_code, text in pieces:
+                if is_code:
+                    if literal:
+                        merged.append(repr(literal))
+                        literal = ""
+                    merged.append(text)
+                else:
+                    literal += text
+            if literal:
+                merged.append(repr(literal))
+            return "''.join((" + ", ".join(merged) + ",))"
+
+        dumps_body = join(build(self.prototype, "doc", 0))
+        condition = " and ".join([f"tuple(doc) == {self.keys!r}"] + checks)
+        fill_body = join(build(self.prototype, None, 0))
+        source = (f"def dumps(doc):\n"
+                  f"    if not ({condition}):\n"
+                  f"        return None\n"
+                  f"    return {dumps_body}\n"
+                  f"def fill({', '.join(['*'] + fields) if fields else ''}):\n"
+                  f"    return {fill_body}\n")
+        namespace = {"enc": encode}
+        exec(compile(source, f"<template {self.data_type}>", "exec"), namespace)
+        compiled = (namespace["dumps"], namespace["fill"])
+        self._compiled[indent] = compiled
+        return compiled
+
+    def dumps(self, doc: dict, indent: Union[int, str, None] = 4) -> Optional[str]:
+        """``json.dumps(doc, indent=indent)``, or None if ``doc`` doesn't have this template's layout."""
+        return self._compile(indent)[0](doc)
+
+    def fill(self, indent: Union[int, str, None] = 4, **fields: Any) -> str:
+        """The text of the prototype with ``fields`` filled in, as ``json.dumps`` would write it."""
+        return self._compile(indent)[1](**fields)
+
+
+COLOURS = ("MainColor", "SecondaryColor", "LeafColor", "StemColor")
+# Keyword arguments WEED_PRODUCT.fill takes for the colour channels, in order
+COLOUR_FIELDS = tuple(f"{colour[:-5].lower()}_{channel}" for colour in COLOURS for channel in "rgb")
+
+WEED_PRODUCT = Template({
+    "DataType": "WeedProductData",
+    "DataVersion": 0,
+    "GameVersion": "0.3.3f15",
+    "Name": Field("name"),
+    "ID": Field("product_id"),
+    "DrugType": Field("drug_type"),
+    "Properties": Field("properties"),
+    "AppearanceSettings": {
+        colour: {"r": Field(f"{colour[:-5].lower()}_r"), "g": Field(f"{colour[:-5].lower()}_g"),
+                 "b": Field(f"{colour[:-5].lower()}_b"), "a": 255}
+        for colour in COLOURS
+    },
+})
+
+INVENTORY = Template({"DataType": "InventoryData", "DataVersion": 0, "GameVersion": "0.3.3f15",
+                      "Items": Field("items")})
+
+_HEADER = {"DataType": None, "DataVersion": 0, "GameVersion": "0.3.3f15"}
+
+# Layouts the game and the editor write for the high-volume object types
+TEMPLATES = [
+    WEED_PRODUCT,
+    INVENTORY,
+    Template({**_HEADER, "DataType": "NPCData", "ID": None}),
+    Template({**_HEADER, "DataType": "DealerData", "ID": None, "Recruited": None, "AssignedCustomerIDs": None,
+              "ActiveContractGUIDs": None, "Cash": None, "OverflowItems": {"Items": None},
+              "HasBeenRecommended": None}),
+    Template({**_HEADER, "DataType": "RelationshipData", "RelationDelta": None, "Unlocked": None,
+              "UnlockType": None}),
+    Template({**_HEADER, "DataType": "PropertyData", "PropertyCode": None, "IsOwned": None,
+              "SwitchStates": None, "ToggleableStates": None}),
+    Template({**_HEADER, "DataType": "BusinessData", "PropertyCode": None, "IsOwned": None,
+              "SwitchStates": None, "ToggleableStates": None, "LaunderingOperations": None}),
+    # unlock_all_businesses creates missing businesses without LaunderingOperations
+    Template({**_HEADER, "DataType": "BusinessData", "PropertyCode": None, "IsOwned": None,
+              "SwitchStates": None, "ToggleableStates": None}),
+]
+_BY_LAYOUT = {(template.data_type, template.keys): template for template in TEMPLATES}
+
+
+def template_dumps(obj: Any, indent: Union[int, str, None] = 4) -> Optional[str]:
+    """Serialize ``obj`` with the template for its DataType and keys, or return None when there is none."""
+    if type(obj) is not dict:
+        return None
+    data_type = obj.get("DataType")
+    if not isinstance(data_type, str):
+        return None
+    template = _BY_LAYOUT.get((data_type, tuple(obj)))
+    return template.dumps(obj, indent) if template is not None else None
@@ -0,0 +1,79 @@
+import hashlib, marshal, os, threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+SNAPSHOT_VERSION = 1
+
+
+def file_fingerprint(path: Union[str, Path]) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def folder_fingerprint(path: Union[str, Path], suffix: str = ".json") -> Optional[tuple]:
+    """(name, mtime_ns, size) for every matching file directly inside ``path``, from a single listing."""
+    stamps = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.name.endswith(suffix) and entry.is_file():
+                    st = entry.stat()
+                    stamps.append((entry.name, st.st_mtime_ns, st.st_size))
+    except OSError:
+        return None
+    return tuple(sorted(stamps))
+
+
+class SaveSnapshot:
+    """Binary snapshot of the parsed parts of a save slot, reused while their files are unchanged."""
+
+    def __init__(self, snapshot_path: Optional[Path], save_path: Path):
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.save_path = str(save_path)
+        self._entries: Dict[str, Tuple[Any, bytes]] = {}
+        self._dirty = False
+        self._lock = threading.RLock()
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                stored = marshal.load(f)
+            if stored.get("version") == SNAPSHOT_VERSION and stored.get("save_path") == self.save_path:
+                self._entries = stored["entries"]
+        except (OSError, EOFError, ValueError, TypeError, AttributeError, KeyError):
+            self._entries = {}
+
+    @staticmethod
+    def path_for(snapshot_dir: Path, save_path: Path, suffix: str = ".snapshot") -> Path:
+        """Per-slot file inside ``snapshot_dir``: one per slot path and suffix."""
+        digest = hashlib.blake2b(str(save_path).encode('utf-8'), digest_size=8).hexdigest()
+        return Path(snapshot_dir) / f"{Path(save_path).name}_{digest}{suffix}"
+
+    def get(self, key: str, fingerprint: Any, build: Callable[[], Any]) -> Any:
+        """Return the stored part if ``fingerprint`` matches, otherwise ``build()`` it and store the result."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == fingerprint:
+            return marshal.loads(entry[1])
+        value = build()
+        with self._lock:
+            try:
+                self._entries[key] = (fingerprint, marshal.dumps(value))
+            except ValueError:
+                self._entries.pop(key, None)
+            self._dirty = True
+        return value
+
+    def save(self):
+        """Write the snapshot if any part was rebuilt since it was read. Raises OSError if it can't be written."""
+        with self._lock:
+            if not self._dirty or self.snapshot_path is None:
+                return
+            tmp_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                marshal.dump({"version": SNAPSHOT_VERSION, "save_path": self.save_path,
+                              "entries": self._entries}, f)
+            os.replace(tmp_path, self.snapshot_path)
+            self._dirty = False
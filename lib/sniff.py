@@ -0,0 +1,34 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+from lib.loader import DEFAULT_IO_WORKERS
+
+SNIFF_BYTES = 512
+_DATA_TYPE = re.compile(rb'(?:\xef\xbb\xbf)?\s*\{\s*"DataType"\s*:\s*"([A-Za-z0-9_]*)"')
+
+
+def sniff_data_type(path: Union[str, Path], size: int = SNIFF_BYTES) -> Optional[str]:
+    """Read a save file's DataType from its first bytes, or None if it isn't the first key."""
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(size)
+    except OSError:
+        return None
+    return sniff_bytes(head)
+
+
+def sniff_bytes(head: bytes) -> Optional[str]:
+    """DataType from the first bytes of a save file already in memory, or None."""
+    match = _DATA_TYPE.match(head)
+    return match.group(1).decode('ascii') if match else None
+
+
+def sniff_files(paths: Iterable[Path], workers: Optional[int] = None) -> List[Optional[str]]:
+    """Sniff the DataType of many files on a bounded thread pool, in order."""
+    paths = list(paths)
+    workers = DEFAULT_IO_WORKERS if workers is None else max(1, int(workers))
+    if workers == 1 or len(paths) < 2:
+        return [sniff_data_type(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+        return list(pool.map(sniff_data_type, paths))
@@ -0,0 +1,629 @@
+import hashlib, io, json, os, shutil, tempfile, threading, time, zipfile
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, IO, Iterator, List, NamedTuple, Optional, Tuple, Union
+from lib.atomic import WriteJournal, disk_bytes
+from lib.codec import PRESERVE, JsonCodec, detect_indent
+from lib.loader import load_json_files
+from lib.manifest import ManifestEntry, SlotManifest
+from lib.merkle import TreeDiff
+from lib.sniff import SNIFF_BYTES, sniff_bytes, sniff_files
+from lib.snapshot import folder_fingerprint
+
+
+def _join(rel_dir: str, name: str) -> str:
+    if not rel_dir or not name:
+        return rel_dir or name
+    return f"{rel_dir}/{name}"
+
+
+def _clean(rel_path: Union[str, Path]) -> str:
+    rel_path = Path(rel_path).as_posix() if isinstance(rel_path, Path) else rel_path.replace("\\", "/")
+    return "" if rel_path == "." else rel_path.strip("/")
+
+
+class WriteCounts(NamedTuple):
+    """Files a write operation rewrote, files it left alone because their content was already current,
+    and files it handed to the write-behind queue."""
+    written: int = 0
+    unchanged: int = 0
+    queued: int = 0
+
+    def __str__(self) -> str:
+        text = f"{self.written} written, {self.unchanged} unchanged"
+        return f"{text}, {self.queued} queued" if self.queued else text
+
+
+class SaveStorage(ABC):
+    """Files of one save slot, addressed by relative posix path ("Properties/barn/Data.json")."""
+
+    location: Optional[Path] = None
+
+    def __init__(self):
+        # rel_path -> ((mtime_ns, size), digest) of content known to be in the storage
+        self._digests: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+        # rel_path -> ((mtime_ns, size), indent) of JSON files whose layout is known
+        self._indents: Dict[str, Tuple[Tuple[int, int], Union[int, str, None]]] = {}
+
+    # Primitives
+
+    @abstractmethod
+    def exists(self, rel_path: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_dir(self, rel_path: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def listdir(self, rel_dir: str = "", dirs: Optional[bool] = None) -> List[str]:
+        """Sorted names inside ``rel_dir``; ``dirs`` limits the result to folders (True) or files (False)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stat(self, rel_path: str) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of a file, or None if it doesn't exist."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def read_bytes(self, rel_path: str) -> bytes:
+        raise NotImplementedError
+
+    def read_head(self, rel_path: str, size: int) -> bytes:
+        """The first ``size`` bytes of a file."""
+        return self.read_bytes(rel_path)[:size]
+
+    @abstractmethod
+    def write_text(self, rel_path: str, text: str):
+        """Write a file, creating its folder if needed."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def makedirs(self, rel_dir: str):
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove(self, rel_path: str):
+        """Delete a file or a whole folder; missing paths are ignored."""
+        raise NotImplementedError
+
+    def open_text(self, rel_path: str) -> IO[str]:
+        return io.StringIO(self.read_bytes(rel_path).decode('utf-8'), newline=None)
+
+    @contextmanager
+    def replace_text(self, rel_path: str) -> Iterator[IO[str]]:
+        """Write a file through a text stream; it replaces the old file only if the block succeeds."""
+        out = io.StringIO()
+        yield out
+        self.write_text(rel_path, out.getvalue())
+
+    def flush(self):
+        """Persist buffered writes. Storages that write through have nothing to do."""
+
+    @contextmanager
+    def group(self) -> Iterator[None]:
+        """Group the writes of a block so they become durable together, at its end."""
+        yield
+
+    def recover(self) -> int:
+        """Repair writes interrupted by a crash; returns the number of files restored."""
+        return 0
+
+    def sidecar(self, suffix: str) -> Optional[Path]:
+        """Disk path for a file kept next to the slot (index, backup), or None when the slot isn't on disk."""
+        return None
+
+    def backup_storage(self) -> "SaveStorage":
+        """Storage holding the slot's initial and feature backups."""
+        return MemoryStorage()
+
+    # Helpers built on the primitives
+
+    def load_json(self, rel_path: str, codec: JsonCodec) -> Any:
+        return codec.loads(self.read_bytes(rel_path))
+
+    def encode_text(self, text: str) -> bytes:
+        """The bytes ``write_text`` stores for ``text``."""
+        return text.encode('utf-8')
+
+    def write_text_if_changed(self, rel_path: str, text: str) -> bool:
+        """Write a file unless it already holds exactly ``text``. Returns True if it was written."""
+        rel_path = _clean(rel_path)
+        data = self.encode_text(text)
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        stat = self.stat(rel_path)
+        if stat is not None and stat[1] == len(data):
+            known = self._digests.get(rel_path)
+            if known is not None and known[0] == stat:
+                unchanged = known[1] == digest
+            else:
+                unchanged = self.read_bytes(rel_path) == data
+            if unchanged:
+                self._digests[rel_path] = (stat, digest)
+                return False
+        self.write_text(rel_path, text)
+        stat = self.stat(rel_path)
+        if stat is not None:
+            self._digests[rel_path] = (stat, digest)
+        return True
+
+    def known_digest(self, rel_path: str, stat: Tuple[int, int]) -> Optional[bytes]:
+        """Digest of the content this storage last wrote or compared for a file, if the file still has ``stat``."""
+        known = self._digests.get(_clean(rel_path))
+        return known[1] if known is not None and known[0] == stat else None
+
+    def digest(self, rel_path: str) -> Optional[bytes]:
+        """Digest of a file's content, read only when the file changed since it was last hashed; None if missing."""
+        rel_path = _clean(rel_path)
+        stat = self.stat(rel_path)
+        if stat is None:
+            return None
+        digest = self.known_digest(rel_path, stat)
+        if digest is None:
+            digest = hashlib.blake2b(self.read_bytes(rel_path), digest_size=16).digest()
+            self._digests[rel_path] = (stat, digest)
+        return digest
+
+    def _remember_digest(self, rel_path: str, digest: bytes):
+        rel_path = _clean(rel_path)
+        stat = self.stat(rel_path)
+        if stat is not None:
+            self._digests[rel_path] = (stat, digest)
+
+    def json_indent(self, rel_path: str, default: Union[int, str, None] = 4) -> Union[int, str, None]:
+        """The ``indent`` an existing JSON file was written with (see lib.codec.detect_indent)."""
+        rel_path = _clean(rel_path)
+        stat = self.stat(rel_path)
+        if stat is None:
+            return default
+        known = self._indents.get(rel_path)
+        if known is not None and known[0] == stat:
+            return known[1]
+        try:
+            indent = detect_indent(self.read_head(rel_path, SNIFF_BYTES), default)
+        except OSError:
+            return default
+        self._indents[rel_path] = (stat, indent)
+        return indent
+
+    def dump_json(self, rel_path: str, data: Any, codec: JsonCodec,
+                  indent: Union[int, str, None] = PRESERVE) -> bool:
+        """Write a document unless the file already holds it. Returns True if it was written."""
+        rel_path = _clean(rel_path)
+        if indent == PRESERVE:
+            indent = self.json_indent(rel_path)
+        written = self.write_text_if_changed(rel_path, codec.dumps(data, indent))
+        stat = self.stat(rel_path)
+        if stat is not None:
+            self._indents[rel_path] = (stat, indent)
+        return written
+
+    def load_json_files(self, rel_paths: List[str], codec: JsonCodec, workers: Optional[int] = None,
+                        skip_errors: tuple = (json.JSONDecodeError,),
+                        process_threshold: Optional[int] = None) -> List[Tuple[str, Any]]:
+        """Decode many files; returns (rel_path, data) pairs in order, leaving out files raising ``skip_errors``."""
+        results = []
+        for rel_path in rel_paths:
+            try:
+                results.append((rel_path, self.load_json(rel_path, codec)))
+            except skip_errors:
+                continue
+        return results
+
+    def sniff(self, rel_paths: List[str], workers: Optional[int] = None) -> List[Optional[str]]:
+        """DataType of each file read from its first bytes, or None (see lib.sniff)."""
+        results = []
+        for rel_path in rel_paths:
+            try:
+                results.append(sniff_bytes(self.read_bytes(rel_path)[:SNIFF_BYTES]))
+            except OSError:
+                results.append(None)
+        return results
+
+    def folder_fingerprint(self, rel_dir: str, suffix: str = ".json") -> Optional[tuple]:
+        """(name, mtime_ns, size) for every matching file directly inside ``rel_dir``."""
+        if not self.is_dir(rel_dir):
+            return None
+        stamps = []
+        for name in self.listdir(rel_dir, dirs=False):
+            stat = self.stat(_join(rel_dir, name)) if name.endswith(suffix) else None
+            if stat is not None:
+                stamps.append((name, stat[0], stat[1]))
+        return tuple(stamps)
+
+    def walk(self, rel_dir: str = "") -> Iterator[ManifestEntry]:
+        """Every file and folder below ``rel_dir``, parents before children."""
+        for name in self.listdir(rel_dir):
+            rel_path = _join(rel_dir, name)
+            if self.is_dir(rel_path):
+                yield ManifestEntry(rel_path, True, 0, 0)
+                yield from self.walk(rel_path)
+            else:
+                stat = self.stat(rel_path)
+                if stat is not None:
+                    yield ManifestEntry(rel_path, False, stat[1], stat[0])
+
+    def manifest(self) -> SlotManifest:
+        return SlotManifest.from_entries(self.location or Path(), self.walk())
+
+    def copy_to(self, target: "SaveStorage", rel_path: str = "", target_rel: Optional[str] = None):
+        """Copy a file or folder into ``target``, merging with what is already there."""
+        target_rel = rel_path if target_rel is None else target_rel
+        if self.is_dir(rel_path):
+            target.makedirs(target_rel)
+            for name in self.listdir(rel_path):
+                self.copy_to(target, _join(rel_path, name), _join(target_rel, name))
+        elif self.exists(rel_path):
+            data = self.read_bytes(rel_path)
+            target.write_bytes(target_rel, data)
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            self._remember_digest(rel_path, digest)
+            target._remember_digest(target_rel, digest)
+
+    def write_bytes(self, rel_path: str, data: bytes):
+        self.write_text(rel_path, data.decode('utf-8'))
+
+    def import_folder(self, source: Union[str, Path], rel_dir: str):
+        """Copy a folder from disk into the storage."""
+        source = Path(source)
+        self.makedirs(rel_dir)
+        for child in sorted(source.iterdir()):
+            rel_path = _join(rel_dir, child.name)
+            if child.is_dir():
+                self.import_folder(child, rel_path)
+            else:
+                self.write_bytes(rel_path, child.read_bytes())
+
+
+class DiskStorage(SaveStorage):
+    """A save slot folder on disk."""
+
+    def __init__(self, root: Union[str, Path]):
+        super().__init__()
+        self.root = Path(root)
+        self.location = self.root
+        self.journal = WriteJournal(self.sidecar("_Journal"))
+
+    def path(self, rel_path: str) -> Path:
+        rel_path = _clean(rel_path)
+        return self.root / rel_path if rel_path else self.root
+
+    def _read_path(self, rel_path: str) -> Path:
+        """Where a file's current content is: a write pending in this thread's group is read from its temp file."""
+        return self.journal.resolve(self.path(rel_path))
+
+    def exists(self, rel_path: str) -> bool:
+        return self._read_path(rel_path).exists()
+
+    def is_dir(self, rel_path: str) -> bool:
+        return self.path(rel_path).is_dir()
+
+    def listdir(self, rel_dir: str = "", dirs: Optional[bool] = None) -> List[str]:
+        folder = self.path(rel_dir)
+        try:
+            with os.scandir(folder) as it:
+                entries = {entry.name: entry.is_dir() for entry in it if not self.journal.is_temp(entry.path)}
+        except OSError:
+            return []
+        entries.update(dict.fromkeys(self.journal.pending_names(folder), False))
+        return sorted(name for name, is_dir in entries.items() if dirs is None or is_dir == dirs)
+
+    def stat(self, rel_path: str) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self._read_path(rel_path))
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def read_bytes(self, rel_path: str) -> bytes:
+        return self._read_path(rel_path).read_bytes()
+
+    def read_head(self, rel_path: str, size: int) -> bytes:
+        with open(self._read_path(rel_path), 'rb') as f:
+            return f.read(size)
+
+    def encode_text(self, text: str) -> bytes:
+        return disk_bytes(text)
+
+    def write_text(self, rel_path: str, text: str):
+        path = self.path(rel_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.journal.write(path, text)
+
+    def write_bytes(self, rel_path: str, data: bytes):
+        path = self.path(rel_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.journal.write(path, data)
+
+    def makedirs(self, rel_dir: str):
+        self.path(rel_dir).mkdir(parents=True, exist_ok=True)
+
+    def remove(self, rel_path: str):
+        path = self.path(rel_path)
+        self.journal.forget(path)
+        if path.is_dir() and not path.is_symlink():
+            shutil.rmtree(path)
+        elif path.exists():
+            path.unlink()
+
+    def open_text(self, rel_path: str) -> IO[str]:
+        return open(self._read_path(rel_path), 'r', encoding='utf-8')
+
+    @contextmanager
+    def replace_text(self, rel_path: str) -> Iterator[IO[str]]:
+        path = self.path(rel_path)
+        self.journal.forget(path)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as out:
+                yield out
+                # Streamed files are too big to journal, so they are synced even inside a group
+                out.flush()
+                os.fsync(out.fileno())
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+    @contextmanager
+    def group(self) -> Iterator[None]:
+        self.journal.begin()
+        try:
+            yield
+        finally:
+            self.journal.end()
+
+    def recover(self) -> int:
+        return self.journal.recover()
+
+    def sidecar(self, suffix: str) -> Optional[Path]:
+        return self.root.parent / (self.root.name + suffix)
+
+    def backup_storage(self) -> SaveStorage:
+        return DiskStorage(self.sidecar("_Backup"))
+
+    def load_json(self, rel_path: str, codec: JsonCodec) -> Any:
+        return codec.load(self._read_path(rel_path))
+
+    def load_json_files(self, rel_paths: List[str], codec: JsonCodec, workers: Optional[int] = None,
+                        skip_errors: tuple = (json.JSONDecodeError,),
+                        process_threshold: Optional[int] = None) -> List[Tuple[str, Any]]:
+        rel_by_path = {self._read_path(rel_path): rel_path for rel_path in rel_paths}
+        return [(rel_by_path[path], data) for path, data in
+                load_json_files(list(rel_by_path), workers, skip_errors=skip_errors, codec=codec,
+                                process_threshold=process_threshold)]
+
+    def sniff(self, rel_paths: List[str], workers: Optional[int] = None) -> List[Optional[str]]:
+        return sniff_files([self._read_path(rel_path) for rel_path in rel_paths], workers)
+
+    def folder_fingerprint(self, rel_dir: str, suffix: str = ".json") -> Optional[tuple]:
+        return folder_fingerprint(self.path(rel_dir), suffix)
+
+    def manifest(self) -> SlotManifest:
+        return SlotManifest(self.root)
+
+    def copy_to(self, target: SaveStorage, rel_path: str = "", target_rel: Optional[str] = None):
+        src = self.path(rel_path)
+        if not isinstance(target, DiskStorage) or self.journal.pending_under(src) or target.journal.active:
+            # The generic copy sees this thread's pending writes and groups what it writes
+            return super().copy_to(target, rel_path, target_rel)
+        src = self._read_path(rel_path)
+        dst = target.path(rel_path if target_rel is None else target_rel)
+        if src.is_dir():
+            shutil.copytree(src, dst, dirs_exist_ok=True)
+        elif src.exists():
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(src, dst)
+
+    def import_folder(self, source: Union[str, Path], rel_dir: str):
+        shutil.copytree(source, self.path(rel_dir), dirs_exist_ok=True)
+
+
+class MemoryStorage(SaveStorage):
+    """A save slot held entirely in memory."""
+
+    def __init__(self):
+        super().__init__()
+        self._files: Dict[str, Tuple[bytes, int]] = {}
+        self._dirs = {""}
+        self._clock = 0
+        self._lock = threading.RLock()
+
+    def _tick(self) -> int:
+        # Strictly increasing, so every write changes the file's cache key
+        self._clock = max(time.time_ns(), self._clock + 1)
+        return self._clock
+
+    def exists(self, rel_path: str) -> bool:
+        rel_path = _clean(rel_path)
+        return rel_path in self._files or rel_path in self._dirs
+
+    def is_dir(self, rel_path: str) -> bool:
+        return _clean(rel_path) in self._dirs
+
+    def listdir(self, rel_dir: str = "", dirs: Optional[bool] = None) -> List[str]:
+        rel_dir = _clean(rel_dir)
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        with self._lock:
+            names = set()
+            if dirs is not False:
+                names.update(path[len(prefix):] for path in self._dirs
+                             if path and path.startswith(prefix) and "/" not in path[len(prefix):])
+            if dirs is not True:
+                names.update(path[len(prefix):] for path in self._files
+                             if path.startswith(prefix) and "/" not in path[len(prefix):])
+        return sorted(names)
+
+    def stat(self, rel_path: str) -> Optional[Tuple[int, int]]:
+        entry = self._files.get(_clean(rel_path))
+        return None if entry is None else (entry[1], len(entry[0]))
+
+    def read_bytes(self, rel_path: str) -> bytes:
+        entry = self._files.get(_clean(rel_path))
+        if entry is None:
+            raise FileNotFoundError(rel_path)
+        return entry[0]
+
+    def write_text(self, rel_path: str, text: str):
+        self.write_bytes(rel_path, text.encode('utf-8'))
+
+    def write_bytes(self, rel_path: str, data: bytes, mtime_ns: Optional[int] = None):
+        rel_path = _clean(rel_path)
+        with self._lock:
+            self.makedirs(rel_path.rpartition("/")[0])
+            self._files[rel_path] = (bytes(data), mtime_ns if mtime_ns is not None else self._tick())
+
+    def makedirs(self, rel_dir: str):
+        rel_dir = _clean(rel_dir)
+        with self._lock:
+            while rel_dir not in self._dirs:
+                self._dirs.add(rel_dir)
+                rel_dir = rel_dir.rpartition("/")[0]
+
+    def remove(self, rel_path: str):
+        rel_path = _clean(rel_path)
+        prefix = rel_path + "/"
+        with self._lock:
+            if not rel_path:
+                self._files.clear()
+                self._dirs = {""}
+                return
+            self._files.pop(rel_path, None)
+            if rel_path in self._dirs:
+                for path in [path for path in self._files if path.startswith(prefix)]:
+                    del self._files[path]
+                self._dirs = {path for path in self._dirs if path != rel_path and not path.startswith(prefix)}
+
+
+class ZipStorage(MemoryStorage):
+    """A save slot inside a zip archive, edited in memory and written back by ``flush``."""
+
+    def __init__(self, path: Union[str, Path]):
+        super().__init__()
+        self.path = Path(path)
+        self.location = self.path
+        self.prefix = ""
+        self._dirty = False
+        if self.path.exists():
+            self._read()
+            self._dirty = False
+
+    def _read(self):
+        with zipfile.ZipFile(self.path, 'r') as zf:
+            infos = zf.infolist()
+            tops = {info.filename.split("/", 1)[0] for info in infos}
+            if len(tops) == 1 and all("/" in info.filename for info in infos):
+                self.prefix = tops.pop() + "/"
+            for info in infos:
+                rel_path = info.filename[len(self.prefix):]
+                if info.is_dir():
+                    self.makedirs(rel_path)
+                else:
+                    mtime_ns = int(datetime(*info.date_time).timestamp()) * 1_000_000_000
+                    super().write_bytes(rel_path, zf.read(info), mtime_ns)
+
+    def write_bytes(self, rel_path: str, data: bytes, mtime_ns: Optional[int] = None):
+        super().write_bytes(rel_path, data, mtime_ns)
+        self._dirty = True
+
+    def makedirs(self, rel_dir: str):
+        if _clean(rel_dir) not in self._dirs:
+            super().makedirs(rel_dir)
+            self._dirty = True
+
+    def remove(self, rel_path: str):
+        super().remove(rel_path)
+        self._dirty = True
+
+    def flush(self):
+        """Rewrite the archive if anything changed since it was read or last flushed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+            os.close(fd)
+            try:
+                with zipfile.ZipFile(tmp_name, 'w', zipfile.ZIP_DEFLATED) as zf:
+                    for rel_dir in sorted(self._dirs):
+                        if rel_dir or self.prefix:
+                            zf.writestr(zipfile.ZipInfo(self.prefix + (f"{rel_dir}/" if rel_dir else "")), b"")
+                    for rel_path, (data, mtime_ns) in sorted(self._files.items()):
+                        info = zipfile.ZipInfo(self.prefix + rel_path,
+                                               time.localtime(max(mtime_ns // 1_000_000_000, 315532800))[:6])
+                        info.compress_type = zipfile.ZIP_DEFLATED
+                        zf.writestr(info, data)
+                with open(tmp_name, 'r+b') as f:
+                    os.fsync(f.fileno())
+                os.replace(tmp_name, self.path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+                raise
+            self._dirty = False
+
+    def sidecar(self, suffix: str) -> Optional[Path]:
+        return self.path.parent / (self.path.stem + suffix)
+
+    def backup_storage(self) -> SaveStorage:
+        return ZipStorage(self.sidecar("_Backup.zip"))
+
+
+def open_storage(path: Union[str, Path]) -> SaveStorage:
+    """Storage for a slot path: a zip archive for ``*.zip`` files, otherwise the folder."""
+    path = Path(path)
+    if path.suffix.lower() == ".zip" and not path.is_dir():
+        return ZipStorage(path)
+    return DiskStorage(path)
+
+
+def diff_storages(left: SaveStorage, right: SaveStorage, left_rel: str = "", right_rel: str = "",
+                  ignore: Tuple[str, ...] = ()) -> TreeDiff:
+    """Compare two folders by size and remembered content digests. Returns paths relative to them."""
+    result = TreeDiff([], [], [])
+    stack = [""]
+    while stack:
+        rel = stack.pop()
+        left_names = set(left.listdir(_join(left_rel, rel)))
+        right_names = set(right.listdir(_join(right_rel, rel)))
+        if not rel:
+            left_names -= set(ignore)
+            right_names -= set(ignore)
+        for name in sorted(left_names | right_names):
+            child = _join(rel, name)
+            if name not in right_names:
+                result.only_left.append(child)
+                continue
+            if name not in left_names:
+                result.only_right.append(child)
+                continue
+            left_dir, right_dir = left.is_dir(_join(left_rel, child)), right.is_dir(_join(right_rel, child))
+            if left_dir != right_dir:
+                result.changed.append(child)
+            elif left_dir:
+                stack.append(child)
+            else:
+                left_path, right_path = _join(left_rel, child), _join(right_rel, child)
+                left_stat, right_stat = left.stat(left_path), right.stat(right_path)
+                if (left_stat is None or right_stat is None or left_stat[1] != right_stat[1]
+                        or left.digest(left_path) != right.digest(right_path)):
+                    result.changed.append(child)
+    return result
+
+
+def mirror_storage(source: SaveStorage, target: SaveStorage, source_rel: str = "", target_rel: str = "",
+                   ignore: Tuple[str, ...] = ()) -> int:
+    """Make ``target_rel`` in ``target`` a copy of ``source_rel`` in ``source``; returns the paths touched."""
+    diff = diff_storages(source, target, source_rel, target_rel, ignore)
+    touched = diff.only_left + diff.only_right + diff.changed
+    for rel in touched:
+        target.remove(_join(target_rel, rel))
+        source.copy_to(target, _join(source_rel, rel), _join(target_rel, rel))
+    return len(touched)
@@ -0,0 +1,108 @@
+import os, threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Union
+from lib.codec import COMPACT, JsonCodec
+
+SUMMARY_FILES = ("Game.json", "Money.json", "Time.json")
+
+
+def format_playtime(playtime_seconds: int) -> str:
+    days, remaining_seconds = divmod(int(playtime_seconds), 86400)
+    hours, remaining_seconds = divmod(remaining_seconds, 3600)
+    minutes, seconds = divmod(remaining_seconds, 60)
+    return f"{days}d, {hours}h, {minutes}m, {seconds}s"
+
+
+class SlotSummaryCache:
+    """Persistent cache of the details shown for each save slot, keyed by slot path."""
+
+    def __init__(self, cache_path: Path, codec: Optional[JsonCodec] = None):
+        self.cache_path = Path(cache_path)
+        self.codec = codec or JsonCodec()
+        self._lock = threading.Lock()
+        self._dirty = False
+        try:
+            self._entries: Dict[str, dict] = self.codec.load(self.cache_path)
+        except (OSError, ValueError):
+            self._entries = {}
+        if not isinstance(self._entries, dict):
+            self._entries = {}
+
+    @staticmethod
+    def _fingerprint(slot: Path) -> list:
+        stamps = []
+        for filename in SUMMARY_FILES:
+            try:
+                st = os.stat(slot / filename)
+                stamps.append([st.st_mtime_ns, st.st_size])
+            except OSError:
+                stamps.append(None)
+        return stamps
+
+    def _read_summary(self, slot: Path, fingerprint: list) -> dict:
+        documents = {}
+        for filename in SUMMARY_FILES:
+            try:
+                data = self.codec.load(slot / filename)
+            except (OSError, ValueError):
+                data = {}
+            documents[filename] = data if isinstance(data, dict) else {}
+        game, money, time_data = (documents[filename] for filename in SUMMARY_FILES)
+        mtimes = [stamp[0] for stamp in fingerprint if stamp]
+        try:
+            networth = int(money.get("Networth", 0))
+        except (TypeError, ValueError):
+            networth = 0
+        try:
+            playtime = format_playtime(time_data.get("Playtime", 0))
+        except (TypeError, ValueError):
+            playtime = "Unknown"
+        return {
+            "fingerprint": fingerprint,
+            "organisation_name": game.get("OrganisationName", "Unknown Organization"),
+            "game_version": game.get("GameVersion", "Unknown"),
+            "playtime": playtime,
+            "networth": networth,
+            "last_modified": datetime.fromtimestamp(max(mtimes) / 1e9).strftime("%Y-%m-%d %H:%M") if mtimes else "Unknown",
+        }
+
+    def cached(self, slot: Union[str, Path]) -> Optional[dict]:
+        """Return the stored summary for a slot without checking whether it is still current."""
+        with self._lock:
+            return self._entries.get(str(slot))
+
+    def get(self, slot: Union[str, Path]) -> dict:
+        """Return an up-to-date summary, re-reading the slot only if its files changed."""
+        slot = Path(slot)
+        fingerprint = self._fingerprint(slot)
+        with self._lock:
+            entry = self._entries.get(str(slot))
+        if entry is not None and entry.get("fingerprint") == fingerprint:
+            return entry
+        entry = self._read_summary(slot, fingerprint)
+        with self._lock:
+            self._entries[str(slot)] = entry
+            self._dirty = True
+        return entry
+
+    def discard_missing(self):
+        """Drop summaries of slots that no longer exist."""
+        with self._lock:
+            missing = [path for path in self._entries if not os.path.isdir(path)]
+            for path in missing:
+                del self._entries[path]
+            self._dirty = self._dirty or bool(missing)
+
+    def save(self):
+        """Write the cache to disk if anything changed since it was loaded or last saved. Raises OSError on failure."""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = dict(self._entries)
+            self._dirty = False
+        try:
+            self.codec.dump(entries, self.cache_path, COMPACT)
+        except OSError:
+            self._dirty = True
+            raise
@@ -0,0 +1,75 @@
+from typing import Any, Dict, List, Optional
+
+from lib.locks import subtree_of
+
+
+class TransactionError(RuntimeError):
+    """A transaction was opened while another one is active."""
+
+
+class SaveTransaction:
+    """Stages document writes and writes each touched file once on commit; rolls back on error."""
+
+    def __init__(self, manager):
+        self.manager = manager
+        self.staged: Dict[str, Any] = {}
+        self.requested = 0
+        self.written = 0
+        self.unchanged = 0
+
+    @property
+    def writes_saved(self) -> int:
+        """Writes avoided by coalescing or because the file was already current; valid once committed."""
+        return self.requested - self.written
+
+    def stage(self, filename: str, data: Any):
+        self.requested += 1
+        self.staged[filename] = data
+
+    def get(self, filename: str) -> Optional[Any]:
+        return self.staged.get(filename)
+
+    def commit(self):
+        storage = self.manager.storage
+        originals: Dict[str, Optional[bytes]] = {}
+        written: List[str] = []
+        try:
+            with self.manager._writing(tuple({subtree_of(filename) for filename in self.staged})):
+                try:
+                    for filename, data in self.staged.items():
+                        originals[filename] = storage.read_bytes(filename) if storage.exists(filename) else None
+                        if self.manager._write_json_file(filename, data):
+                            written.append(filename)
+                        else:
+                            self.unchanged += 1
+                except BaseException:
+                    for filename in written:
+                        if originals[filename] is None:
+                            storage.remove(filename)
+                        else:
+                            storage.write_bytes(filename, originals[filename])
+                    raise
+        except BaseException:
+            self.rollback()
+            raise
+        self.written = len(written)
+        self.staged = {}
+
+    def rollback(self):
+        filenames = list(self.staged)
+        self.staged = {}
+        self.manager._reload_documents(filenames)
+
+    def __enter__(self) -> "SaveTransaction":
+        if self.manager._transaction is not None:
+            raise TransactionError("A save transaction is already open")
+        self.manager._transaction = self
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.manager._transaction = None
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
@@ -0,0 +1,117 @@
+import hashlib, marshal, threading
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+
+class _Missing:
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+# Stands for a key absent on one side of a merge
+MISSING = _Missing()
+
+
+def content_digest(raw: bytes) -> bytes:
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+class Conflict(NamedTuple):
+    """A value both the editor and another program changed since the editor read the file."""
+    path: str
+    base: Any
+    ours: Any
+    theirs: Any
+
+
+class WriteConflictError(RuntimeError):
+    """A file changed on disk since it was read and the edit could not be merged into it."""
+
+    def __init__(self, filename: str, conflicts: List[Conflict]):
+        self.filename = filename
+        self.conflicts = conflicts
+        lines = [f"  {conflict.path or '(whole file)'}: editor {conflict.ours!r}, on disk {conflict.theirs!r}"
+                 for conflict in conflicts[:10]]
+        if len(conflicts) > 10:
+            lines.append(f"  ... and {len(conflicts) - 10} more")
+        super().__init__(f"{filename} was changed outside the editor; the edit was not saved:\n" + "\n".join(lines))
+
+
+def merge(base: Any, ours: Any, theirs: Any, path: str = "") -> Tuple[Any, List[Conflict]]:
+    """Three-way merge of two edits of a JSON value. Returns (merged, conflicts)."""
+    if ours == theirs or theirs == base:
+        return ours, []
+    if ours == base:
+        return theirs, []
+    if type(base) is dict and type(ours) is dict and type(theirs) is dict:
+        merged = {}
+        conflicts: List[Conflict] = []
+        for key in dict.fromkeys([*theirs, *ours]):
+            value, found = merge(base.get(key, MISSING), ours.get(key, MISSING), theirs.get(key, MISSING),
+                                 f"{path}/{key}" if path else key)
+            conflicts.extend(found)
+            if value is not MISSING:
+                merged[key] = value
+        return merged, conflicts
+    return ours, [Conflict(path, base, ours, theirs)]
+
+
+class DocumentVersion(NamedTuple):
+    stat: Tuple[int, int]
+    # blake2b of the bytes read or written, when known
+    digest: Optional[bytes]
+    # marshal blob of the content, kept for documents held in memory between edits
+    base: Optional[bytes]
+
+
+class DocumentVersions:
+    """The version of each document the editor last read or wrote, for optimistic concurrency."""
+
+    def __init__(self):
+        self._versions: Dict[str, DocumentVersion] = {}
+        self._lock = threading.Lock()
+
+    def record(self, rel_path: str, stat: Optional[Tuple[int, int]], digest: Optional[bytes] = None,
+               base: Any = MISSING):
+        """Note the version of a document just read or written; ``base`` is its content, if it should be kept."""
+        with self._lock:
+            if stat is None:
+                self._versions.pop(rel_path, None)
+                return
+            known = self._versions.get(rel_path)
+            if known is not None and known.stat == stat and (digest is None or known.digest in (None, digest)):
+                digest = known.digest or digest
+                blob = known.base if known.base is not None or base is MISSING else marshal.dumps(base)
+            else:
+                blob = None if base is MISSING else marshal.dumps(base)
+            self._versions[rel_path] = DocumentVersion(stat, digest, blob)
+
+    def get(self, rel_path: str) -> Optional[DocumentVersion]:
+        with self._lock:
+            return self._versions.get(rel_path)
+
+    def clear(self):
+        with self._lock:
+            self._versions.clear()
+
+    def reconcile(self, rel_path: str, ours: Any, stat: Optional[Tuple[int, int]],
+                  read: Callable[[], bytes], loads: Callable[[bytes], Any]) -> Any:
+        """The document to write for ``ours``, merged with changes made since it was read. Raises WriteConflictError."""
+        version = self.get(rel_path)
+        if version is None or stat is None or stat == version.stat:
+            return ours
+        raw = read()
+        if version.digest is not None and content_digest(raw) == version.digest:
+            return ours
+        theirs = loads(raw)
+        if version.base is None:
+            if theirs == ours:
+                return ours
+            if type(ours) is dict and type(theirs) is dict:
+                conflicts = merge({}, ours, theirs)[1]
+            else:
+                conflicts = []
+            raise WriteConflictError(rel_path, conflicts or [Conflict("", MISSING, ours, theirs)])
+        merged, conflicts = merge(marshal.loads(version.base), ours, theirs)
+        if conflicts:
+            raise WriteConflictError(rel_path, conflicts)
+        return merged
@@ -0,0 +1,112 @@
+import atexit, os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+from lib.codec import get_codec
+from lib.items import ItemList
+from lib.versions import content_digest
+
+# File count above which opted-in bulk operations decode in worker processes
+DEFAULT_PROCESS_THRESHOLD = 2000
+PROCESS_WORKERS = max(1, (os.cpu_count() or 1) - 1)
+# Files per task: large enough that pickling results back is amortised over
+# many parses, small enough to keep every worker busy until the end
+MIN_BATCH = 32
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Shared process pool, started on first use; spawning workers is too slow to repeat per call."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=PROCESS_WORKERS)
+        atexit.register(shutdown_pool)
+    return _pool
+
+
+def shutdown_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
+
+
+def run_batches(func: Callable[..., list], paths: Sequence[Path], *args: Any) -> list:
+    """Call ``func(batch, *args)`` on the process pool for batches of ``paths``; return the results in order."""
+    paths = [str(path) for path in paths]
+    if not paths:
+        return []
+    batch_size = max(MIN_BATCH, -(-len(paths) // (PROCESS_WORKERS * 4)))
+    batches = [paths[i:i + batch_size] for i in range(0, len(paths), batch_size)]
+    results = []
+    for batch_results in _get_pool().map(func, batches, *([arg] * len(batches) for arg in args)):
+        results.extend(batch_results)
+    return results
+
+
+def decode_batch(paths: List[str], codec_name: str, skip_errors: tuple) -> list:
+    """Parse a batch of JSON files. Returns (True, data) per file, or (False, None) for skipped files."""
+    codec = get_codec(codec_name)
+    results = []
+    for path in paths:
+        try:
+            results.append((True, codec.load(path)))
+        except skip_errors:
+            results.append((False, None))
+    return results
+
+
+def update_storage_file(path: str, codec, quantity: int, packaging: str, update_type: str,
+                        quality: str) -> Optional[Tuple[Tuple[int, int], bytes, dict]]:
+    """Edit the items of one storage Data.json. Returns (stat, digest, document), or None if unchanged."""
+    st = os.stat(path)
+    with open(path, 'rb') as f:
+        raw = f.read()
+    data = codec.loads(raw)
+    if update_storage_data(data, codec, quantity, packaging, update_type, quality):
+        return (st.st_mtime_ns, st.st_size), content_digest(raw), data
+    return None
+
+
+def update_storage_data(data: dict, codec, quantity: int, packaging: str, update_type: str, quality: str) -> bool:
+    """Apply update_storage_file's edit to an already parsed Data.json. Returns True if anything changed."""
+    if "Contents" not in data or "Items" not in data["Contents"]:
+        return False
+
+    items = ItemList(data["Contents"]["Items"], codec)
+    for i, item in items.decoded():
+        # Determine if we should modify this item
+        modify = False
+        if update_type == "both":
+            modify = True
+        elif update_type == "weed" and item.get("DataType") in ("WeedData", "CocaineData", "MethData"):
+            modify = True
+        elif update_type == "item" and item.get("DataType") == "ItemData":
+            modify = True
+
+        if modify:
+            fields = {"Quantity": quantity}
+            if item.get("DataType") in ("WeedData", "CocaineData", "MethData"):
+                if packaging != "none":
+                    fields["PackagingID"] = packaging
+                fields["Quality"] = quality  # Set quality here
+            items.update(i, fields)
+
+    if items.changed:
+        data["Contents"]["Items"] = items.encode()
+        return True
+    return False
+
+
+def update_storage_batch(paths: List[str], codec_name: str, quantity: int, packaging: str,
+                         update_type: str, quality: str) -> list:
+    """update_storage_file for a batch; a file that fails gives its exception. The caller writes the documents."""
+    codec = get_codec(codec_name)
+    results = []
+    for path in paths:
+        try:
+            results.append(update_storage_file(path, codec, quantity, packaging, update_type, quality))
+        except Exception as e:
+            results.append(e)
+    return results
@@ -0,0 +1,109 @@
+import threading
+from collections import OrderedDict
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
+
+
+class WriteBehindError(RuntimeError):
+    """Writes queued before a flush failed on the writer thread."""
+
+    def __init__(self, failures: List[Tuple[str, BaseException]]):
+        super().__init__("; ".join(f"{key}: {error}" for key, error in failures))
+        self.failures = failures
+
+
+class WriteBehindQueue:
+    """Runs file writes on a background thread; ``flush`` waits for them.
+
+    Failed writes are passed to ``on_failure`` on the writer thread as they happen; without it,
+    the next ``flush`` raises them as a WriteBehindError.
+    """
+
+    def __init__(self, batch: Optional[Callable[[List[str]], ContextManager]] = None, name: str = "save-writer",
+                 on_failure: Optional[Callable[[WriteBehindError], None]] = None):
+        self.name = name
+        self.on_failure = on_failure
+        self._batch = batch or nullcontext
+        self._cond = threading.Condition()
+        self._waiting: "OrderedDict[str, Tuple[Any, Callable[[], Any]]]" = OrderedDict()
+        self._writing: Dict[str, Tuple[Any, Callable[[], Any]]] = {}
+        self._failures: List[Tuple[str, BaseException]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.queued = 0
+        self.written = 0
+
+    def submit(self, key: str, write: Callable[[], Any], value: Any = None):
+        """Queue ``write`` for ``key``; ``value`` is what ``pending(key)`` returns until it has run."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("The write-behind queue is closed")
+            self._waiting[key] = (value, write)
+            self.queued += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def pending(self, key: str) -> Optional[Any]:
+        with self._cond:
+            entry = self._waiting.get(key) or self._writing.get(key)
+            return entry[0] if entry is not None else None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._waiting and not self._closed:
+                    self._cond.wait()
+                if not self._waiting:
+                    return
+                self._writing, self._waiting = self._waiting, OrderedDict()
+                batch = self._writing
+            failures = []
+            written = 0
+            try:
+                with self._batch(list(batch)):
+                    for key, (_, write) in batch.items():
+                        try:
+                            write()
+                            written += 1
+                        except Exception as e:
+                            failures.append((key, e))
+            except Exception as e:
+                # The group did not commit, so none of the batch is known to be on disk
+                written = 0
+                failures.append(("batch", e))
+            on_failure = self.on_failure
+            if failures and on_failure is not None:
+                try:
+                    on_failure(WriteBehindError(failures))
+                    failures = []
+                except Exception:
+                    pass  # keep them for the next flush
+            with self._cond:
+                self.written += written
+                self._failures.extend(failures)
+                self._writing = {}
+                self._cond.notify_all()
+
+    def flush(self):
+        """Wait until every queued write has run. Raises WriteBehindError for failures not passed to ``on_failure``."""
+        if threading.current_thread() is self._thread:
+            return
+        with self._cond:
+            while self._waiting or self._writing:
+                self._cond.wait()
+            failures, self._failures = self._failures, []
+        if failures:
+            raise WriteBehindError(failures)
+
+    def close(self):
+        """Flush and stop the writer thread."""
+        try:
+            self.flush()
+        finally:
+            with self._cond:
+                self._closed = True
+                self._cond.notify_all()
+            if self._thread is not None:
+                self._thread.join()
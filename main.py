@@ -1,9 +1,10 @@
 # pyinstaller --noconfirm schedule1_editor.spec
 
-import sys, json, os, random, string, shutil, tempfile, urllib.request, zipfile, winreg, re, subprocess, psutil, ctypes, atexit, threading
+import sys, json, os, random, string, shutil, tempfile, urllib.request, zipfile, winreg, re, subprocess, psutil, ctypes, atexit, threading, multiprocessing, functools, marshal
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QStackedWidget, QWidget,
     QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
@@ -13,6 +14,25 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QUrl, QObject, Signal, QThread, QFile, QIODevice
 from PySide6.QtGui import QRegularExpressionValidator, QIntValidator, QPalette, QColor, QDesktopServices, QIcon
 from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from lib.savedata import LazySaveData
+from lib.index import IndexedFile, SaveIndex
+from lib.manifest import SlotManifest
+from lib.cache import DEFAULT_CACHE_BYTES, JsonCache
+from lib.codec import COMPACT, PRESERVE, JsonCodec, get_codec
+from lib.summary import SlotSummaryCache, format_playtime
+from lib.items import ItemList
+from lib.products import ProductsFile
+from lib.snapshot import SaveSnapshot
+from lib.merkle import MerkleTree, TreeDiff, diff_trees, mirror_tree
+from lib.workers import DEFAULT_PROCESS_THRESHOLD, run_batches, update_storage_batch, update_storage_data
+from lib.storage import DiskStorage, SaveStorage, WriteCounts, diff_storages, mirror_storage, open_storage
+from lib.discovery import SaveDiscovery, SaveRoot, SlotInfo
+from lib.transaction import SaveTransaction
+from lib.writebehind import WriteBehindError, WriteBehindQueue
+from lib.serializers import COLOUR_FIELDS, WEED_PRODUCT
+from lib.atomic import atomic_write
+from lib.locks import DEFAULT_LOCK_TIMEOUT, SlotLock, SlotLockTimeout, slot_lock, subtree_of
+from lib.versions import MISSING, DocumentVersions, WriteConflictError, content_digest
 
 CURRENT_VERSION = "1.0.7"
 
@@ -38,6 +58,27 @@ class UpdateChecker(QObject):
             print(f"Update check failed: {e}")
             self.finished.emit(('', ''))
 
+class SlotSummaryRefresher(QObject):
+    finished = Signal(list)
+
+    def __init__(self, manager):
+        super().__init__()
+        self.manager = manager
+
+    def run(self):
+        try:
+            self.finished.emit(self.manager.get_save_folders())
+        except Exception as e:
+            print(f"Save summary refresh failed: {e}")
+            self.finished.emit([])
+
+class WriteFailureNotifier(QObject):
+    """Carries failures of the background save writer to the GUI thread."""
+    failed = Signal(str)
+
+    def report(self, error: WriteBehindError):
+        self.failed.emit(str(error))
+
 def find_steam_path():
     try:
         with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Valve\Steam") as key:
@@ -128,8 +169,7 @@ def save_config(config):
     """Save the configuration to the config file."""
     config_path = get_config_path()
     try:
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=4)
+        atomic_write(config_path, json.dumps(config, indent=4))
     except IOError as e:
         print(f"Failed to save config: {e}")
 
@@ -185,53 +225,131 @@ GOOFYAHHHNAMES = [
     "Vancomycin", "Venlafaxine", "Verapamil", "Warfarin", "Zidovudine", "Zolpidem"
 ]
 
+def write_operation(method=None, *, subtrees: Tuple[str, ...] = ()):
+    """Mark a SaveManager method that writes to the slot: it runs as one write group, locking ``subtrees``."""
+    if method is None:
+        return functools.partial(write_operation, subtrees=subtrees)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._transaction is not None:
+            # The method only stages documents; the commit writes them as one group, under the locks
+            return method(self, *args, **kwargs)
+        state = self._write_state
+        depth = getattr(state, "depth", 0)
+        if depth > 0 or self.storage is None:
+            state.depth = depth + 1
+            try:
+                with self.locks.exclusive(*subtrees):
+                    return method(self, *args, **kwargs)
+            finally:
+                state.depth = depth
+        self.flush_writes()
+        state.depth = 1
+        state.counts = [0, 0, 0]
+        try:
+            with self._writing(subtrees):
+                return method(self, *args, **kwargs)
+        finally:
+            state.depth = 0
+            self.last_write_counts = WriteCounts(*state.counts)
+            state.counts = None
+    return wrapper
+
 class SaveManager:
+    # Header files parsed by load_save and the save_data sections holding them
+    DOCUMENT_SECTIONS = {
+        "Game.json": "game",
+        "Money.json": "money",
+        "Rank.json": "rank",
+        "Time.json": "time",
+        "Metadata.json": "metadata",
+        "Players/Player_0/Inventory.json": "inventory",
+    }
+    # File in each feature backup listing the slot paths it covers
+    FEATURE_BACKUP_PATHS = "_paths.json"
+    # Files kept next to a slot: its index (with SQLite's own journal files), write journal and lock file
+    SIDECAR_SUFFIXES = ("_Index.sqlite", "_Index.sqlite-journal", "_Index.sqlite-wal", "_Index.sqlite-shm",
+                        "_Journal", "_Lock")
+
     def __init__(self):
-        self.savefile_dir = self._find_save_directory()
         self.current_save: Optional[Path] = None
-        self.save_data: Dict[str, Union[dict, list]] = {}
+        # Every read and write of the loaded slot goes through its storage
+        self.storage: Optional[SaveStorage] = None
+        self.backup_storage: Optional[SaveStorage] = None
+        self._write_state = threading.local()
+        # Edits made from the GUI are written on a background thread
+        self.writer = WriteBehindQueue(self._write_batch)
+        atexit.register(self._close_writer)
+        self.last_write_counts = WriteCounts()
+        self._transaction: Optional[SaveTransaction] = None
+        self.save_data: LazySaveData = LazySaveData()
         self.backup_path: Optional[Path] = None
         self.feature_backups: Optional[Path] = None
+        self._index: Optional[SaveIndex] = None
+        self.manifest: Optional[SlotManifest] = None
+        self._inventory_items = None
+        self.snapshot: Optional[SaveSnapshot] = None
+        # Advisory lock shared with other editor processes on the loaded slot
+        self.locks = SlotLock(None)
+        # Guards lazily created shared state when operations run on worker threads
+        self._lock = threading.RLock()
+        config = load_config()
+        # Thread count for parallel JSON loading; None picks a default from the CPU count
+        self.io_workers: Optional[int] = config.get("io_workers")
+        # JSON backend: "auto" picks orjson when installed, "json" forces the stdlib
+        self.codec: JsonCodec = get_codec(config.get("json_backend"))
+        # Opt-in: decode in worker processes when an operation covers at least this many files
+        self.process_threshold: Optional[int] = (
+            config.get("process_pool_threshold", DEFAULT_PROCESS_THRESHOLD)
+            if config.get("process_pool_decode") else None)
+        # Layout of files written by bulk operations (generated products, storage
+        # contents): "preserve" keeps each file's layout, "compact" writes them on one line
+        self.bulk_indent = COMPACT if config.get("json_output") == "compact" else PRESERVE
+        # Seconds to wait for another editor process to release a slot before giving up
+        self.lock_timeout: float = config.get("lock_timeout", DEFAULT_LOCK_TIMEOUT)
+        cache_mb = config.get("json_cache_mb")
+        self.json_cache = JsonCache(int(cache_mb * 1024 * 1024) if cache_mb is not None else DEFAULT_CACHE_BYTES)
+        # Version of each file as last read or written, checked before writing over it
+        self.versions = DocumentVersions()
+        self.slot_summaries = SlotSummaryCache(get_config_path().parent / "slot_summaries.json", self.codec)
+        self.discovery = SaveDiscovery(self._save_roots(config), get_config_path().parent / "save_catalogue.json",
+                                       self.codec, self.io_workers)
+        self.savefile_dir = self._find_save_directory()
 
         self.used_names = set()
         self.available_names = []
+        self._product_names_loaded = False
 
     @staticmethod
     def _is_steamid_folder(name: str) -> bool:
         return re.fullmatch(r'[0-9]{17}', name) is not None
 
+    @staticmethod
+    def _save_roots(config: dict) -> List[SaveRoot]:
+        """Every folder to look for saves in: the chosen and default roots, any extra
+        "save_roots" from the config, and the Free Sample saves."""
+        local_low = Path.home() / "AppData" / "LocalLow" / "TVGS"
+        paths = [config.get("custom_save_directory"), str(local_low / "Schedule I" / "saves")]
+        roots = [SaveRoot(str(path)) for path in paths + list(config.get("save_roots", [])) if path]
+        roots.append(SaveRoot(str(local_low / "Schedule I Free Sample" / "Saves"), "legacy"))
+        return roots
+
     def _find_save_directory(self) -> Optional[Path]:
         """Attempt to find the save directory, using saved config, default, or user input."""
         from PySide6.QtWidgets import QFileDialog, QMessageBox
 
-        # Default save path
-        default_path = Path.home() / "AppData" / "LocalLow" / "TVGS" / "Schedule I" / "saves"
-
-        def validate_save_path(path: Path) -> Optional[Path]:
-            """Validate if the path contains a SteamID folder and SaveGame_ subfolder."""
-            if not path.exists():
-                return None
-            steamid_folders = [f for f in path.iterdir() if f.is_dir() and self._is_steamid_folder(f.name)]
-            if not steamid_folders:
-                return None
-            self.steamid_folder = steamid_folders[0]  # Set the first SteamID folder
-            for item in self.steamid_folder.iterdir():
-                if item.is_dir() and item.name.startswith("SaveGame_"):
-                    return item
+        def first_slot(root: Optional[Path] = None) -> Optional[Path]:
+            """First SaveGame_ folder in the Steam roots (or in ``root``), remembering its SteamID folder."""
+            for slot in self.discovery.refresh():
+                if slot.kind == "steam" and (root is None or Path(slot.root) == root):
+                    self.steamid_folder = Path(slot.path).parent
+                    return Path(slot.path)
             return None
 
-        # Load saved custom path from config
-        config = load_config()
-        saved_path_str = config.get("custom_save_directory")
-        if saved_path_str:
-            saved_path = Path(saved_path_str)
-            result = validate_save_path(saved_path)
-            if result:
-                return result
-
-        # Try the default path if no valid saved path
-        result = validate_save_path(default_path)
+        result = first_slot()
         if result:
+            self._save_cache(self.discovery, "save catalogue")
             return result
 
         # If both saved and default fail, prompt user for a custom directory
@@ -257,11 +375,14 @@ class SaveManager:
                     continue
 
             custom_path = Path(selected_dir)
-            result = validate_save_path(custom_path)
+            self.discovery.add_root(SaveRoot(str(custom_path)))
+            result = first_slot(custom_path)
             if result:
                 # Save the custom directory to config
+                config = load_config()
                 config["custom_save_directory"] = str(custom_path)
                 save_config(config)
+                self._save_cache(self.discovery, "save catalogue")
                 return result
             else:
                 QMessageBox.warning(
@@ -273,77 +394,189 @@ class SaveManager:
 
     def get_save_organisation_name(self, save_path: Path) -> str:
         try:
-            with open(save_path / "Game.json") as f:
-                return json.load(f).get("OrganisationName", "Unknown Organization")
+            return self.codec.load(save_path / "Game.json").get("OrganisationName", "Unknown Organization")
         except (FileNotFoundError, json.JSONDecodeError):
             return "Unknown Organization"
 
-    def get_save_folders(self) -> List[Dict[str, str]]:
-        if not hasattr(self, 'steamid_folder') or not self.steamid_folder:
-            return []
-        return [{"name": x.name, "path": str(x), "organisation_name": self.get_save_organisation_name(x)}
-                for x in self.steamid_folder.iterdir()
-                if x.is_dir() and re.fullmatch(r"SaveGame_[1-9]", x.name)]
+    def get_save_folders(self, cached: bool = False) -> List[Dict[str, str]]:
+        """List the save slots with their summaries; ``cached`` trusts stored summaries of known slots."""
+        catalogue = self.discovery.cached() if cached else self.discovery.refresh()
+        saves = []
+        for slot in catalogue:
+            if slot.kind != "steam" or not re.fullmatch(r"SaveGame_[1-9]", slot.name):
+                continue
+            summary = (self.slot_summaries.cached(slot.path) if cached else None) or self.slot_summaries.get(slot.path)
+            saves.append({"name": slot.name, "path": slot.path, "steam_id": slot.steam_id,
+                          **{key: value for key, value in summary.items() if key != "fingerprint"}})
+        if not cached:
+            self.slot_summaries.discard_missing()
+        self._save_cache(self.discovery, "save catalogue")
+        self._save_cache(self.slot_summaries, "slot summaries")
+        return saves
 
-    def load_save(self, save_path: Union[str, Path]) -> bool:
+    @staticmethod
+    def _save_cache(cache, description: str):
+        """Persist a cache; the editor works without it, so failures are only reported."""
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"Failed to save {description}: {e}")
+
+    def get_legacy_saves(self) -> List[SlotInfo]:
+        """Saves in the Free Sample folder that can be transferred into a slot."""
+        saves = [slot for slot in self.discovery.refresh() if slot.kind == "legacy"]
+        self._save_cache(self.discovery, "save catalogue")
+        return saves
+
+    def load_save(self, save_path: Union[str, Path], storage: Optional[SaveStorage] = None) -> bool:
+        """Open a save (a slot folder or zipped slot), reading only the small header files."""
+        self.flush_writes()
         self.current_save = Path(save_path)
-        if not self.current_save.exists():
+        self.storage = storage or open_storage(self.current_save)
+        if not self.storage.exists(""):
             return False
-        self.save_data = {}
+        self.locks.close()
+        # A zipped slot is rewritten as a whole, so it is locked as a whole
+        self.locks = slot_lock(self.storage.sidecar("_Lock"), self.lock_timeout,
+                               granular=isinstance(self.storage, DiskStorage))
         try:
-            self.save_data["game"] = self._load_json_file("Game.json")
-            self.save_data["money"] = self._load_json_file("Money.json")
-            self.save_data["rank"] = self._load_json_file("Rank.json")
-            self.save_data["time"] = self._load_json_file("Time.json")
-            self.save_data["metadata"] = self._load_json_file("Metadata.json")
-            self.save_data["properties"] = self._load_folder_data("Properties")
-            self.save_data["vehicles"] = self._load_folder_data("OwnedVehicles")
-            self.save_data["businesses"] = self._load_folder_data("Businesses")
-            self.save_data["inventory"] = self._load_json_file("Players/Player_0/Inventory.json")
-            self.backup_path = self.current_save.parent / (self.current_save.name + '_Backup')
-            self.feature_backups = self.backup_path / 'feature_backups'
-            self.create_initial_backup()
-
-            # Add this block to initialize used_names and available_names
+            restored = self.storage.recover()
+            if restored:
+                print(f"Restored {restored} file(s) from the write journal after an interrupted save")
+        except OSError as e:
+            print(f"Failed to restore files from the write journal: {e}")
+        self.save_data = LazySaveData()
+        self.versions.clear()
+        try:
+            location = self.storage.location
+            self.snapshot = SaveSnapshot(
+                SaveSnapshot.path_for(get_config_path().parent / "snapshots", location) if location else None,
+                self.current_save)
+            for filename, section in self.DOCUMENT_SECTIONS.items():
+                self.save_data[section] = self._load_snapshot_file(filename)
+            self._save_cache(self.snapshot, "snapshot")
+            self.save_data.register("properties", lambda: self._load_snapshot_folder("Properties"))
+            self.save_data.register("vehicles", lambda: self._load_snapshot_folder("OwnedVehicles"))
+            self.save_data.register("businesses", lambda: self._load_snapshot_folder("Businesses"))
+            self.backup_storage = self.storage.backup_storage()
+            self.backup_path = self.backup_storage.location
+            self.feature_backups = self.backup_path / 'feature_backups' if self.backup_path else None
+            self.close_index()
+            self.manifest = None
+            self._inventory_items = None
+
             self.used_names = set()
-            products_path = self.current_save / "Products" / "CreatedProducts"
-            if products_path.exists():
-                for file in products_path.glob("*.json"):
-                    try:
-                        with open(file, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            name = data.get("Name")
-                            if name:
-                                self.used_names.add(name)
-                    except json.JSONDecodeError:
-                        continue
-            self.available_names = [name for name in GOOFYAHHHNAMES if name not in self.used_names]
+            self.available_names = []
+            self._product_names_loaded = False
 
             return True
         except Exception as e:
             print(f"Error loading save: {e}")
             return False
 
+    @property
+    def index(self) -> SaveIndex:
+        """SQLite index of the loaded slot, stored next to its _Backup folder and opened on first use."""
+        with self._lock:
+            if self._index is None:
+                db_path = self.storage.sidecar('_Index.sqlite') or ":memory:"
+                self._index = SaveIndex(self.current_save, db_path, self.io_workers, self.codec,
+                                        parse=self._index_key_fields_needed,
+                                        process_threshold=self.process_threshold,
+                                        storage=self.storage)
+            return self._index
+
+    @staticmethod
+    def _index_key_fields_needed(rel_path: str, data_type: str) -> bool:
+        """Whether the index must parse a file for more than its DataType."""
+        if data_type == "DealerData":
+            return True
+        parts = rel_path.split("/")
+        return len(parts) >= 5 and parts[0] == "Properties" and parts[2] == "Objects" and parts[-1] == "Data.json"
+
+    def close_index(self):
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+
+    def scan_slot(self) -> SlotManifest:
+        """Walk the loaded slot once and keep the result as ``self.manifest``."""
+        self.manifest = self.storage.manifest()
+        return self.manifest
+
+    def find_files(self, manifest: Optional[SlotManifest] = None, **filters) -> List[IndexedFile]:
+        """Refresh the slot index and return the files matching the given filters."""
+        self.index.refresh(manifest or self.scan_slot())
+        return self.index.find(**filters)
+
+    def _load_product_names(self):
+        """Scan CreatedProducts for used names the first time product generation needs them."""
+        if self._product_names_loaded:
+            return
+        products_path = "Products/CreatedProducts"
+
+        def scan_names():
+            names = []
+            for _, data in self._load_folder_files(products_path):
+                name = data.get("Name")
+                if name:
+                    names.append(name)
+            return names
+
+        self.used_names = set(self.snapshot.get("used_names", self.storage.folder_fingerprint(products_path),
+                                                scan_names))
+        self._save_cache(self.snapshot, "snapshot")
+        self.available_names = [name for name in GOOFYAHHHNAMES if name not in self.used_names]
+        self._product_names_loaded = True
+
     def _load_json_file(self, filename: str) -> dict:
-        file_path = self.current_save / filename
-        if not file_path.exists():
+        if self._transaction is not None and self._transaction.get(filename) is not None:
+            return self._transaction.get(filename)
+        queued = self.writer.pending(filename)
+        if queued is not None:
+            # A copy, as the cache would hand out: the queued document is still to be serialised
+            return marshal.loads(marshal.dumps(queued))
+        stat = self.storage.stat(filename)
+        if stat is None:
+            self.versions.record(filename, None)
             return {}
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with self.locks.shared(subtree_of(filename)):
+            data = self.json_cache.load(self.current_save / filename,
+                                        lambda _: self._read_json_file(filename, stat), stat)
+        # Header documents stay in memory between edits, so keep what was read to merge against
+        self.versions.record(filename, stat, base=data if filename in self.DOCUMENT_SECTIONS else MISSING)
+        return data
 
-    def _load_folder_data(self, folder_name: str) -> list:
-        folder_path = self.current_save / folder_name
-        if not folder_path.exists():
-            return []
-        data = []
-        for file in folder_path.glob("*.json"):
-            try:
-                with open(file, 'r', encoding='utf-8') as f:
-                    data.append(json.load(f))
-            except json.JSONDecodeError:
-                continue
+    def _read_json_file(self, filename: str, stat: Tuple[int, int]) -> dict:
+        raw = self.storage.read_bytes(filename)
+        self.versions.record(filename, stat, content_digest(raw))
+        return self.codec.loads(raw)
+
+    def _load_snapshot_file(self, filename: str) -> dict:
+        """Load a file, reusing the warm-start snapshot while the file is unchanged."""
+        stat = self.storage.stat(filename)
+        data = self.snapshot.get(filename, stat, lambda: self._load_json_file(filename))
+        self.versions.record(filename, stat, base=data)
+        return data
+
+    def _load_snapshot_folder(self, folder_name: str) -> list:
+        """Load a folder section, reusing the warm-start snapshot while its files are unchanged."""
+        data = self.snapshot.get(folder_name, self.storage.folder_fingerprint(folder_name),
+                                 lambda: self._load_folder_data(folder_name))
+        self._save_cache(self.snapshot, "snapshot")
         return data
 
+    def _load_folder_files(self, folder_name: str) -> list:
+        """(relative path, data) for the JSON files directly inside a folder of the slot."""
+        with self.locks.shared(subtree_of(f"{folder_name}/")):
+            files = [f"{folder_name}/{name}" for name in self.storage.listdir(folder_name, dirs=False)
+                     if name.endswith(".json")]
+            return self.storage.load_json_files(files, self.codec, self.io_workers,
+                                                process_threshold=self.process_threshold)
+
+    def _load_folder_data(self, folder_name: str) -> list:
+        return [data for _, data in self._load_folder_files(folder_name)]
+
     def get_save_info(self) -> dict:
         if not self.save_data:
             return {}
@@ -353,15 +586,7 @@ class SaveManager:
         creation_date_str = "Unknown"
         creation_time_str = "Unknown"
         time_data = self.save_data.get("time", {})
-        playtime_seconds = time_data.get("Playtime", 0)
-        
-        days = playtime_seconds // 86400  # 24*3600
-        remaining_seconds = playtime_seconds % 86400
-        hours = remaining_seconds // 3600
-        remaining_seconds %= 3600
-        minutes = remaining_seconds // 60
-        seconds = remaining_seconds % 60
-        playtime_str = f"{days}d, {hours}h, {minutes}m, {seconds}s"
+        playtime_str = format_playtime(time_data.get("Playtime", 0))
 
         # Check if all required keys are present
         required_keys = ['Year', 'Month', 'Day', 'Hour', 'Minute', 'Second']
@@ -401,16 +626,10 @@ class SaveManager:
         
         # Extract cash balance from inventory
         cash_balance = 0
-        inventory = self.save_data.get("inventory", {})
-        if "Items" in inventory:
-            for item_str in inventory["Items"]:
-                try:
-                    item = json.loads(item_str)
-                    if item.get("DataType") == "CashData":
-                        cash_balance = int(item.get("CashBalance", 0))  # Ensure cash balance is an integer
-                        break
-                except json.JSONDecodeError:
-                    continue
+        inventory_items = self.inventory_items()
+        cash = inventory_items.find("CashData") if inventory_items is not None else None
+        if cash is not None:
+            cash_balance = int(cash[1].get("CashBalance", 0))  # Ensure cash balance is an integer
 
         return {
             "game_version": self.save_data.get("game", {}).get("GameVersion", "Unknown"),
@@ -428,61 +647,164 @@ class SaveManager:
             "cash_balance": cash_balance  # Ensure cash balance is an integer
         }
 
-    def _save_json_file(self, filename: str, data: dict):
-        file_path = self.current_save / filename
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
+    def _save_json_file(self, filename: str, data: dict, indent: Union[int, str, None] = PRESERVE):
+        if self._transaction is not None and indent == PRESERVE:
+            self._transaction.stage(filename, data)
+            return
+        self._write_json_file(filename, data, indent)
+
+    def _write_json_file(self, filename: str, data: dict, indent: Union[int, str, None] = PRESERVE) -> bool:
+        """Write a document unless the file already holds it, merging changes made on disk. Returns True if written."""
+        data = self._reconcile(filename, data)
+        written = self.storage.dump_json(filename, data, self.codec, indent)
+        stat = self.storage.stat(filename)
+        self.json_cache.put(self.current_save / filename, data, stat)
+        self.versions.record(filename, stat, self.storage.known_digest(filename, stat) if stat else None,
+                             data if filename in self.DOCUMENT_SECTIONS else MISSING)
+        self._count_writes(int(written), int(not written))
+        return written
+
+    def _reconcile(self, filename: str, data: dict) -> dict:
+        """``data``, merged with the changes made to the file on disk since the editor read it."""
+        merged = self.versions.reconcile(filename, data, self.storage.stat(filename),
+                                         lambda: self.storage.read_bytes(filename), self.codec.loads)
+        if merged is not data:
+            print(f"{filename} was changed outside the editor; merged those changes with the edit")
+            section = self.DOCUMENT_SECTIONS.get(filename)
+            if section is not None:
+                self.save_data[section] = merged
+        return merged
+
+    def _save_json_text(self, filename: str, text: str) -> bool:
+        """Write an already serialised document unless the file holds it. Returns True if it was written."""
+        written = self.storage.write_text_if_changed(filename, text)
+        self.json_cache.invalidate(self.current_save / filename)
+        self._count_writes(int(written), int(not written))
+        return written
+
+    def _count_writes(self, written: int, unchanged: int, queued: int = 0):
+        counts = getattr(self._write_state, "counts", None)
+        if counts is not None:
+            counts[0] += written
+            counts[1] += unchanged
+            counts[2] += queued
+
+    def _queue_json_file(self, filename: str, data: dict, indent: Union[int, str, None] = PRESERVE):
+        """Hand a document to the writer thread. ``data`` must not be modified afterwards."""
+        self.writer.submit(filename, functools.partial(self._write_json_file, filename, data, indent), data)
+        self._count_writes(0, 0, 1)
+
+    @contextmanager
+    def _writing(self, subtrees: Tuple[str, ...] = ()) -> Iterator[None]:
+        """Every write to the slot runs in here: after the initial backup, under the write locks, as one write group.
+
+        Writers of different subtrees, on different threads, run side by side.
+        """
+        self.create_initial_backup()
+        storage = self.storage
+        with self.locks.exclusive(*subtrees):
+            try:
+                with storage.group():
+                    yield
+            finally:
+                storage.flush()
+
+    def _write_batch(self, filenames: List[str]):
+        """Commit each batch from the write-behind queue as one write group."""
+        return self._writing(tuple({subtree_of(filename) for filename in filenames}))
+
+    def load_document(self, path: Union[str, Path]) -> dict:
+        """A JSON file of the loaded slot, including edits still waiting in the write-behind queue; {} if missing."""
+        return self._load_json_file(Path(path).relative_to(self.current_save).as_posix())
 
+    def save_document(self, path: Union[str, Path], data: dict):
+        """Queue a JSON file of the loaded slot for writing and return at once; the file keeps its layout."""
+        self._queue_json_file(Path(path).relative_to(self.current_save).as_posix(), data)
+
+    def flush_writes(self):
+        """Barrier: wait until every queued write is on disk. Raises WriteBehindError for failures not yet reported."""
+        self.writer.flush()
+
+    def _close_writer(self):
+        """Write out queued edits before the editor exits."""
+        try:
+            self.writer.close()
+        except WriteBehindError as e:
+            print(f"Some edits could not be saved: {e}")
+
+    def transaction(self) -> SaveTransaction:
+        """Batch edits: ``with manager.transaction():`` writes each touched file once when the block ends."""
+        return SaveTransaction(self)
+
+    def _reload_documents(self, filenames: List[str]):
+        """Re-read header documents from the slot, dropping in-memory edits to them."""
+        for filename in filenames:
+            section = self.DOCUMENT_SECTIONS.get(filename)
+            if section is not None:
+                self.save_data[section] = self._load_json_file(filename)
+
+    @write_operation(subtrees=("",))
     def set_online_money(self, new_amount: int):
         if "money" in self.save_data:
             self.save_data["money"]["OnlineBalance"] = new_amount
             self._save_json_file("Money.json", self.save_data["money"])
 
+    @write_operation(subtrees=("",))
     def set_networth(self, new_networth: int):
         if "money" in self.save_data:
             self.save_data["money"]["Networth"] = new_networth
             self._save_json_file("Money.json", self.save_data["money"])
 
+    @write_operation(subtrees=("",))
     def set_lifetime_earnings(self, new_earnings: int):
         if "money" in self.save_data:
             self.save_data["money"]["LifetimeEarnings"] = new_earnings
             self._save_json_file("Money.json", self.save_data["money"])
 
+    @write_operation(subtrees=("",))
     def set_weekly_deposit_sum(self, new_sum: int):
         if "money" in self.save_data:
             self.save_data["money"]["WeeklyDepositSum"] = new_sum
             self._save_json_file("Money.json", self.save_data["money"])
 
+    @write_operation(subtrees=("",))
     def set_rank(self, new_rank: str):
         if "rank" in self.save_data:
             self.save_data["rank"]["CurrentRank"] = new_rank
             self._save_json_file("Rank.json", self.save_data["rank"])
 
+    @write_operation(subtrees=("",))
     def set_rank_number(self, new_rank: int):
         if "rank" in self.save_data:
             self.save_data["rank"]["Rank"] = new_rank
             self._save_json_file("Rank.json", self.save_data["rank"])
 
+    @write_operation(subtrees=("",))
     def set_tier(self, new_tier: int):
         if "rank" in self.save_data:
             self.save_data["rank"]["Tier"] = new_tier
             self._save_json_file("Rank.json", self.save_data["rank"])
 
+    @write_operation(subtrees=("",))
     def set_organisation_name(self, new_name: str):
         if "game" in self.save_data:
             self.save_data["game"]["OrganisationName"] = new_name
             self._save_json_file("Game.json", self.save_data["game"])
 
-    def add_discovered_products(self, product_ids: list):
-        products_path = self.current_save / "Products"
-        products_json = products_path / "Products.json"
-        os.makedirs(products_path, exist_ok=True)
+    @write_operation(subtrees=("Products",))
+    def edit_products(self, append: dict = None, keep: dict = None, unique=(), default: dict = None):
+        """Append to / filter the arrays in Products.json (see ProductsFile.edit)."""
+        self.storage.makedirs("Products")
+        ProductsFile("Products/Products.json", self.codec, self.storage).edit(
+            append=append, keep=keep, unique=unique, default=default)
+        self.json_cache.invalidate(self.current_save / "Products" / "Products.json")
 
-        if products_json.exists():
-            with open(products_json, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        else:
-            data = {
+    @write_operation(subtrees=("Products",))
+    def add_discovered_products(self, product_ids: list):
+        self.edit_products(
+            append={"DiscoveredProducts": product_ids},
+            unique={"DiscoveredProducts"},
+            default={
                 "DataType": "ProductManagerData",
                 "DataVersion": 0,
                 "GameVersion": "0.3.3f15",
@@ -492,60 +814,33 @@ class SaveManager:
                 "IsMixComplete": False,
                 "MixRecipes": [],
                 "ProductPrices": []
-            }
-
-        discovered = data.setdefault("DiscoveredProducts", [])
-        for pid in product_ids:
-            if pid not in discovered:
-                discovered.append(pid)
-
-        with open(products_json, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
+            })
 
+    @write_operation(subtrees=("Products",))
     def generate_products(self, count: int, id_length: int, price: int, 
                         add_to_listed: bool = False, add_to_favourited: bool = False,
                         selected_properties: list = None, selected_ingredients: list = None,
                         min_props: int = 0, max_props: int = None, 
                         min_ingredients: int = 0, max_ingredients: int = None,
                         drug_type: int = 0, use_id_as_name: bool = False):
-        products_path = self.current_save / "Products"
-        os.makedirs(products_path, exist_ok=True)
-        created_path = products_path / "CreatedProducts"
-        os.makedirs(created_path, exist_ok=True)
+        if not use_id_as_name:
+            self._load_product_names()
+        self.storage.makedirs("Products/CreatedProducts")
 
         selected_properties = selected_properties or []
         selected_ingredients = selected_ingredients or []
         max_props = max_props if max_props is not None else len(selected_properties)
         max_ingredients = max_ingredients if max_ingredients is not None else len(selected_ingredients)
 
-        products_rel_path = "Products/Products.json"
-        products_json = self.current_save / products_rel_path
-
-        # Load or initialize products data
-        if products_json.exists():
-            data = self._load_json_file(products_rel_path)
-        else:
-            data = {
-                "DataType": "ProductManagerData",
-                "DataVersion": 0,
-                "GameVersion": "0.3.3f15",
-                "DiscoveredProducts": [],
-                "ListedProducts": [],
-                "ActiveMixOperation": {"ProductID": "", "IngredientID": ""},
-                "IsMixComplete": False,
-                "MixRecipes": [],
-                "ProductPrices": [],
-                "FavouritedProducts": []
-            }
+        products_file = ProductsFile("Products/Products.json", self.codec, self.storage)
 
+        # Only the new entries are kept in memory; they are appended to Products.json at the end
         new_product_ids = []
-        discovered = data.setdefault("DiscoveredProducts", [])
-        mix_recipes = data.setdefault("MixRecipes", [])
-        prices = data.setdefault("ProductPrices", [])
-        listed_products = data.setdefault("ListedProducts", [])
-        favourited_products = data.setdefault("FavouritedProducts", [])
+        discovered = []
+        mix_recipes = []
+        prices = []
 
-        existing_ids = set(discovered)
+        existing_ids = set(products_file.iter_array("DiscoveredProducts")) if use_id_as_name and products_file.exists() else set()
 
         def generate_id(length):
             return ''.join(random.choice(string.ascii_letters + string.digits) for _ in range(length))
@@ -592,114 +887,93 @@ class SaveManager:
             num_properties = random.randint(min_props, min(max_props, len(selected_properties)))
             properties = random.sample(selected_properties, k=num_properties) if selected_properties and num_properties > 0 else []
 
-            product_data = {
-                "DataType": "WeedProductData",
-                "DataVersion": 0,
-                "GameVersion": "0.3.3f15",
-                "Name": product_name,
-                "ID": product_key,
-                "DrugType": drug_type,
-                "Properties": properties,
-                "AppearanceSettings": {
-                    "MainColor": {"r": random.randint(0, 255), "g": random.randint(0, 255), "b": random.randint(0, 255), "a": 255},
-                    "SecondaryColor": {"r": random.randint(0, 255), "g": random.randint(0, 255), "b": random.randint(0, 255), "a": 255},
-                    "LeafColor": {"r": random.randint(0, 255), "g": random.randint(0, 255), "b": random.randint(0, 255), "a": 255},
-                    "StemColor": {"r": random.randint(0, 255), "g": random.randint(0, 255), "b": random.randint(0, 255), "a": 255}
-                }
-            }
-
+            # The WeedProductData file is filled in from its template, without building the
+            # document; the 12 random colour channels (r, g, b of four colours) come from one call
             product_rel_path = f"Products/CreatedProducts/{product_key}.json"
-            self._save_json_file(product_rel_path, product_data)
+            indent = self.storage.json_indent(product_rel_path) if self.bulk_indent == PRESERVE else self.bulk_indent
+            self._save_json_text(product_rel_path, WEED_PRODUCT.fill(
+                indent, name=product_name, product_id=product_key, drug_type=drug_type, properties=properties,
+                **dict(zip(COLOUR_FIELDS, random.randbytes(12)))))
             new_product_ids.append(product_key)
 
-        if add_to_listed:
-            listed_products.extend(new_product_ids)
-        if add_to_favourited:
-            favourited_products.extend(new_product_ids)
-
-        self._save_json_file(products_rel_path, data)
+        self.edit_products(
+            append={
+                "DiscoveredProducts": discovered,
+                "ListedProducts": new_product_ids if add_to_listed else [],
+                "MixRecipes": mix_recipes,
+                "ProductPrices": prices,
+                "FavouritedProducts": new_product_ids if add_to_favourited else []
+            },
+            default={
+                "DataType": "ProductManagerData",
+                "DataVersion": 0,
+                "GameVersion": "0.3.3f15",
+                "DiscoveredProducts": [],
+                "ListedProducts": [],
+                "ActiveMixOperation": {"ProductID": "", "IngredientID": ""},
+                "IsMixComplete": False,
+                "MixRecipes": [],
+                "ProductPrices": [],
+                "FavouritedProducts": []
+            })
     
+    @write_operation(subtrees=("Properties",))
     def update_property_quantities(self, property_type: str, quantity: int, 
                                 packaging: str, update_type: str, quality: str) -> int:
         """Update quantities and quality in property Data.json files"""
         updated_count = 0
-        properties_path = self.current_save / "Properties"
-        
-        if not properties_path.exists():
+        manifest = self.scan_slot()
+        if not manifest.is_dir("Properties"):
             return 0
 
-        # Determine directories to process
-        directories = []
-        if property_type == "all":
-            # Get all property directories
-            directories = [d for d in properties_path.iterdir() if d.is_dir()]
-        else:
-            # Use specified directory if it exists
-            target_dir = properties_path / property_type
-            if target_dir.exists() and target_dir.is_dir():
-                directories = [target_dir]
-
-        for prop_dir in directories:
-            objects_path = prop_dir / "Objects"
-            if not objects_path.exists():
-                continue
-
-            # Process all Data.json files
-            for data_file in objects_path.rglob("Data.json"):
-                try:
-                    with open(data_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-
-                    if "Contents" not in data or "Items" not in data["Contents"]:
-                        continue
-
-                    modified = False
-                    items = data["Contents"]["Items"]
-                    for i, item_str in enumerate(items):
-                        item = json.loads(item_str)
-                        
-                        # Determine if we should modify this item
-                        modify = False
-                        if update_type == "both":
-                            modify = True
-                        elif update_type == "weed" and item.get("DataType") in ("WeedData", "CocaineData", "MethData"):
-                            modify = True
-                        elif update_type == "item" and item.get("DataType") == "ItemData":
-                            modify = True
-
-                        if modify:
-                            item["Quantity"] = quantity
-                            if item.get("DataType") in ("WeedData", "CocaineData", "MethData"):
-                                if packaging != "none":
-                                    item["PackagingID"] = packaging
-                                item["Quality"] = quality  # Set quality here
-                            items[i] = json.dumps(item)
-                            modified = True
-
-                    if modified:
-                        with open(data_file, 'w', encoding='utf-8') as f:
-                            json.dump(data, f, indent=4)
-                        updated_count += 1
+        prefix = "Properties" if property_type == "all" else f"Properties/{property_type}"
+        # Only storage objects (Properties/<type>/Objects/.../Data.json) with items are candidates
+        data_files = [entry.path
+                      for entry in self.find_files(manifest, under=prefix, filename="Data.json")
+                      if len(entry.parts) >= 5 and entry.parts[2] == "Objects" and entry.item_count]
+
+        if (self.process_threshold is not None and len(data_files) >= self.process_threshold
+                and isinstance(self.storage, DiskStorage)):
+            # Workers parse and edit; the documents are queued here, like any other edit
+            results = run_batches(update_storage_batch, [self.storage.path(rel) for rel in data_files],
+                                  self.codec.name, quantity, packaging, update_type, quality)
+            for data_file, result in zip(data_files, results):
+                if isinstance(result, Exception):
+                    print(f"Error processing {self.current_save / data_file}: {str(result)}")
+                elif result is not None:
+                    stat, digest, data = result
+                    self.versions.record(data_file, stat, digest)
+                    self._queue_json_file(data_file, data, self.bulk_indent)
+                    updated_count += 1
+            return updated_count
 
-                except Exception as e:
-                    print(f"Error processing {data_file}: {str(e)}")
+        for data_file in data_files:
+            try:
+                data = self._load_json_file(data_file)
+                if update_storage_data(data, self.codec, quantity, packaging, update_type, quality):
+                    self._queue_json_file(data_file, data, self.bulk_indent)
+                    updated_count += 1
+            except Exception as e:
+                print(f"Error processing {self.current_save / data_file}: {str(e)}")
 
         return updated_count
 
+    @write_operation(subtrees=("Quests",))
     def complete_all_quests(self) -> tuple[int, int]:
         """Mark all quests and objectives as completed. Returns (quests_completed, objectives_completed)"""
-        quests_path = self.current_save / "Quests"
-        if not quests_path.exists():
+        manifest = self.scan_slot()
+        if not manifest.is_dir("Quests"):
             return 0, 0
 
         quests_completed = 0
         objectives_completed = 0
 
         # Process all quest files
-        for file_path in quests_path.rglob("*.json"):
+        for entry in self.find_files(manifest, data_type="QuestData", under="Quests"):
+            file_path = self.current_save / entry.path
             try:
-                rel_path = file_path.relative_to(self.current_save)
-                data = self._load_json_file(str(rel_path))
+                rel_path = entry.path
+                data = self._load_json_file(rel_path)
                 
                 if data.get("DataType") != "QuestData":
                     continue
@@ -721,7 +995,7 @@ class SaveManager:
                             modified = True
 
                 if modified:
-                    self._save_json_file(str(rel_path), data)
+                    self._save_json_file(rel_path, data)
 
             except Exception as e:
                 print(f"Error processing {file_path}: {str(e)}")
@@ -729,31 +1003,21 @@ class SaveManager:
 
         return quests_completed, objectives_completed
 
+    @write_operation(subtrees=("Variables", "Players"))
     def modify_variables(self) -> int:
         """Modify variables in both root and player Variables folders"""
         if not self.current_save:
             raise ValueError("No save loaded")
 
         count = 0
-        variables_dirs = []
+        # Root Variables folder plus each player's Variables folder
+        variables_dirs = ["Variables"] + [f"Players/Player_{i}/Variables" for i in range(10)]
 
-        # Add root Variables directory
-        root_vars = self.current_save / "Variables"
-        if root_vars.exists():
-            variables_dirs.append(root_vars)
-
-        # Add player Variables directories that exist
-        for i in range(10):
-            player_vars = self.current_save / f"Players/Player_{i}/Variables"
-            if player_vars.exists():
-                variables_dirs.append(player_vars)
-
-        # Process all found Variables directories
+        self.index.refresh(self.scan_slot())
         for var_dir in variables_dirs:
-            # Process JSON files
-            for json_file in var_dir.glob("*.json"):
-                rel_path = json_file.relative_to(self.current_save)
-                data = self._load_json_file(str(rel_path))
+            for entry in self.index.find(parent=var_dir):
+                rel_path = entry.path
+                data = self._load_json_file(rel_path)
                 
                 if "Value" in data:
                     original = data["Value"]
@@ -765,10 +1029,11 @@ class SaveManager:
                         count += 1
                     
                     if data["Value"] != original:
-                        self._save_json_file(str(rel_path), data)
+                        self._save_json_file(rel_path, data)
 
         return count
 
+    @write_operation(subtrees=("",))
     def unlock_all_items_weeds(self):
             """Unlock all items and weeds by setting rank and tier to 999."""
             try:
@@ -781,11 +1046,10 @@ class SaveManager:
             except Exception as e:
                 raise RuntimeError(f"Failed to unlock items and weeds: {str(e)}")
 
+    @write_operation(subtrees=("Properties",))
     def unlock_all_properties(self):
         """Unlock all properties by downloading and updating property data."""
         try:
-            properties_path = self.current_save / "Properties"
-            
             with tempfile.TemporaryDirectory() as temp_dir:
                 zip_path = Path(temp_dir) / "Properties.zip"
                 extract_path = Path(temp_dir) / "extracted"
@@ -803,9 +1067,9 @@ class SaveManager:
                 if extracted_props.exists():
                     for prop_type in extracted_props.iterdir():
                         if prop_type.is_dir():
-                            dst_dir = properties_path / prop_type.name
-                            if not dst_dir.exists():
-                                shutil.copytree(prop_type, dst_dir)
+                            dst_dir = f"Properties/{prop_type.name}"
+                            if not self.storage.exists(dst_dir):
+                                self.storage.import_folder(prop_type, dst_dir)
             
             updated = 0
             missing_template = {
@@ -818,34 +1082,32 @@ class SaveManager:
                 "ToggleableStates": [True, True]
             }
             
-            for prop_type in properties_path.iterdir():
-                if prop_type.is_dir():
-                    json_path = prop_type / "Property.json"
-                    if not json_path.exists():
-                        template = missing_template.copy()
-                        template["PropertyCode"] = prop_type.name.lower()
-                        self._save_json_file(json_path.relative_to(self.current_save), template)
-                        updated += 1
-                    else:
-                        data = self._load_json_file(json_path.relative_to(self.current_save))
-                        data["IsOwned"] = True
-                        for key in missing_template:
-                            if key not in data:
-                                data[key] = missing_template[key]
-                        data["SwitchStates"] = [True, True, True, True]
-                        data["ToggleableStates"] = [True, True]
-                        self._save_json_file(json_path.relative_to(self.current_save), data)
-                        updated += 1
+            for prop_type in self.storage.listdir("Properties", dirs=True):
+                json_path = f"Properties/{prop_type}/Property.json"
+                if not self.storage.exists(json_path):
+                    template = missing_template.copy()
+                    template["PropertyCode"] = prop_type.lower()
+                    self._save_json_file(json_path, template)
+                    updated += 1
+                else:
+                    data = self._load_json_file(json_path)
+                    data["IsOwned"] = True
+                    for key in missing_template:
+                        if key not in data:
+                            data[key] = missing_template[key]
+                    data["SwitchStates"] = [True, True, True, True]
+                    data["ToggleableStates"] = [True, True]
+                    self._save_json_file(json_path, data)
+                    updated += 1
             
             return updated
         except Exception as e:
             raise RuntimeError(f"Operation failed: {str(e)}")
 
+    @write_operation(subtrees=("Businesses",))
     def unlock_all_businesses(self):
         """Unlock all businesses by downloading and updating business data."""
         try:
-            businesses_path = self.current_save / "Businesses"
-            
             with tempfile.TemporaryDirectory() as temp_dir:
                 zip_path = Path(temp_dir) / "Businesses.zip"
                 extract_path = Path(temp_dir) / "extracted"
@@ -863,9 +1125,9 @@ class SaveManager:
                 if extracted_bus.exists():
                     for bus_type in extracted_bus.iterdir():
                         if bus_type.is_dir():
-                            dst_dir = businesses_path / bus_type.name
-                            if not dst_dir.exists():
-                                shutil.copytree(bus_type, dst_dir)
+                            dst_dir = f"Businesses/{bus_type.name}"
+                            if not self.storage.exists(dst_dir):
+                                self.storage.import_folder(bus_type, dst_dir)
             
             updated = 0
             missing_template = {
@@ -878,37 +1140,36 @@ class SaveManager:
                 "ToggleableStates": [True, True]
             }
             
-            for bus_type in businesses_path.iterdir():
-                if bus_type.is_dir():
-                    json_path = bus_type / "Business.json"
-                    if not json_path.exists():
-                        template = missing_template.copy()
-                        template["PropertyCode"] = bus_type.name.lower()
-                        self._save_json_file(json_path.relative_to(self.current_save), template)
-                        updated += 1
-                    else:
-                        data = self._load_json_file(json_path.relative_to(self.current_save))
-                        data["IsOwned"] = True
-                        for key in missing_template:
-                            if key not in data:
-                                data[key] = missing_template[key]
-                        data["SwitchStates"] = [True, True, True, True]
-                        data["ToggleableStates"] = [True, True]
-                        self._save_json_file(json_path.relative_to(self.current_save), data)
-                        updated += 1
+            for bus_type in self.storage.listdir("Businesses", dirs=True):
+                json_path = f"Businesses/{bus_type}/Business.json"
+                if not self.storage.exists(json_path):
+                    template = missing_template.copy()
+                    template["PropertyCode"] = bus_type.lower()
+                    self._save_json_file(json_path, template)
+                    updated += 1
+                else:
+                    data = self._load_json_file(json_path)
+                    data["IsOwned"] = True
+                    for key in missing_template:
+                        if key not in data:
+                            data[key] = missing_template[key]
+                    data["SwitchStates"] = [True, True, True, True]
+                    data["ToggleableStates"] = [True, True]
+                    self._save_json_file(json_path, data)
+                    updated += 1
             
             return updated
         except Exception as e:
             raise RuntimeError(f"Operation failed: {str(e)}")
 
+    @write_operation(subtrees=("NPCs",))
     def update_npc_relationships_function(self):
         """Update NPC relationships and recruit dealers using proper path handling and error reporting."""
         try:
             if not self.current_save:
                 raise ValueError("No save loaded")
 
-            npcs_dir = self.current_save / "NPCs"
-            npcs_dir.mkdir(parents=True, exist_ok=True)
+            self.storage.makedirs("NPCs")
 
             # Download and extract NPC templates
             with tempfile.TemporaryDirectory() as temp_dir:
@@ -931,36 +1192,33 @@ class SaveManager:
                 if not template_dir.exists():
                     raise FileNotFoundError("NPC template directory missing in archive")
 
-                existing_npcs = {npc.name for npc in npcs_dir.iterdir() if npc.is_dir()}
+                existing_npcs = set(self.storage.listdir("NPCs", dirs=True))
                 for npc_template in template_dir.iterdir():
                     if npc_template.is_dir() and npc_template.name not in existing_npcs:
-                        shutil.copytree(npc_template, npcs_dir / npc_template.name)
+                        self.storage.import_folder(npc_template, f"NPCs/{npc_template.name}")
 
             # Process all NPC relationships
             updated_count = 0
-            for npc_folder in npcs_dir.iterdir():
-                if not npc_folder.is_dir():
+            self.index.refresh(self.scan_slot())
+            for entry in self.index.find(under="NPCs", filename="Relationship.json"):
+                if len(entry.parts) != 3:
                     continue
+                rel_data = self._load_json_file(entry.path)
+                rel_data.update({
+                    "RelationDelta": 999,
+                    "Unlocked": True,
+                    "UnlockType": 1
+                })
+                self._save_json_file(entry.path, rel_data)
+                updated_count += 1
 
-                # Update Relationship.json
-                relationship_file = npc_folder / "Relationship.json"
-                if relationship_file.exists():
-                    rel_data = self._load_json_file(relationship_file.relative_to(self.current_save))
-                    rel_data.update({
-                        "RelationDelta": 999,
-                        "Unlocked": True,
-                        "UnlockType": 1
-                    })
-                    self._save_json_file(relationship_file.relative_to(self.current_save), rel_data)
-                    updated_count += 1
-
-                # Update DealerData in NPC.json
-                npc_file = npc_folder / "NPC.json"
-                if npc_file.exists():
-                    npc_data = self._load_json_file(npc_file.relative_to(self.current_save))
-                    if npc_data.get("DataType") == "DealerData":
-                        npc_data["Recruited"] = True
-                        self._save_json_file(npc_file.relative_to(self.current_save), npc_data)
+            # Recruit dealers that are not recruited yet
+            for entry in self.index.find(data_type="DealerData", under="NPCs", filename="NPC.json"):
+                if len(entry.parts) != 3 or entry.recruited:
+                    continue
+                npc_data = self._load_json_file(entry.path)
+                npc_data["Recruited"] = True
+                self._save_json_file(entry.path, npc_data)
 
             return updated_count
 
@@ -969,76 +1227,196 @@ class SaveManager:
 
     def create_initial_backup(self):
         """Create an initial backup of the save folder if it doesn't exist."""
-        if not self.backup_path.exists():
-            shutil.copytree(self.current_save, self.backup_path)
+        with self._lock:
+            if self.backup_storage is not None and not self.has_initial_backup():
+                with self.locks.shared():
+                    self.storage.copy_to(self.backup_storage)
+                self.backup_storage.flush()
+
+    def has_initial_backup(self) -> bool:
+        return self.backup_storage is not None and bool(self.backup_storage.listdir())
 
     def create_feature_backup(self, feature_name: str, paths: list[Path]):
         """Create a timestamped backup for specific files or directories."""
         from datetime import datetime  # Ensure datetime is imported
+        self.flush_writes()
+        # Feature backups live inside the initial backup's folder, so it must exist first
+        self.create_initial_backup()
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        backup_dir = self.feature_backups / feature_name / timestamp
-        backup_dir.mkdir(parents=True, exist_ok=True)
-        for path in paths:
-            if path.is_file():
-                rel_path = path.relative_to(self.current_save)
-                dest = backup_dir / rel_path
-                dest.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(path, dest)
-            elif path.is_dir():
-                rel_path = path.relative_to(self.current_save)
-                dest = backup_dir / rel_path
-                shutil.copytree(path, dest, dirs_exist_ok=True)
+        backup_dir = f"feature_backups/{feature_name}/{timestamp}"
+        self.backup_storage.makedirs(backup_dir)
+        rel_paths = [Path(path).relative_to(self.current_save).as_posix() for path in paths]
+        subtrees = {subtree_of(rel_path + "/" if self.storage.is_dir(rel_path) else rel_path) for rel_path in rel_paths}
+        with self.locks.shared(*subtrees):
+            for rel_path in rel_paths:
+                if self.storage.exists(rel_path):
+                    self.storage.copy_to(self.backup_storage, rel_path, f"{backup_dir}/{rel_path}")
+        # What the backup covers, so a revert restores exactly these paths
+        self.backup_storage.write_text(f"{backup_dir}/{self.FEATURE_BACKUP_PATHS}", json.dumps(rel_paths))
+        self.backup_storage.flush()
+
+    def _feature_backup_paths(self, backup_dir: str, feature: str) -> List[str]:
+        """Slot paths a feature backup covers."""
+        listing = f"{backup_dir}/{self.FEATURE_BACKUP_PATHS}"
+        if self.backup_storage.exists(listing):
+            return json.loads(self.backup_storage.read_bytes(listing))
+        # Older backups hold only their own folder
+        if self.backup_storage.is_dir(f"{backup_dir}/{feature}"):
+            return [feature]
+        raise FileNotFoundError(f"Backup {backup_dir} does not record the paths it covers")
 
     def list_feature_backups(self) -> dict[str, list[str]]:
         """List all feature backups with their timestamps."""
-        if not self.feature_backups.exists():
+        if self.backup_storage is None:
             return {}
         backups = {}
-        for feature_dir in self.feature_backups.iterdir():
-            if feature_dir.is_dir():
-                timestamps = [d.name for d in feature_dir.iterdir() if d.is_dir()]
-                if timestamps:
-                    backups[feature_dir.name] = sorted(timestamps, reverse=True)
+        for feature in self.backup_storage.listdir("feature_backups", dirs=True):
+            timestamps = self.backup_storage.listdir(f"feature_backups/{feature}", dirs=True)
+            if timestamps:
+                backups[feature] = sorted(timestamps, reverse=True)
         return backups
 
-    def revert_feature(self, feature: str, timestamp: str):
-        """Revert a specific feature to a given backup timestamp."""
-        backup_dir = self.feature_backups / feature / timestamp
-        if not backup_dir.exists():
+    @staticmethod
+    def _tree_store(path: Path) -> Path:
+        return SaveSnapshot.path_for(get_config_path().parent / "snapshots", path, ".merkle")
+
+    def tree(self, path: Path) -> MerkleTree:
+        """Up-to-date Merkle tree of a slot or backup folder, without its feature_backups folder."""
+        return MerkleTree(path, self._tree_store(path), ignore=("feature_backups",)).refresh()
+
+    def slot_sidecars(self, save_path: Union[str, Path]) -> List[Path]:
+        """Every file the editor keeps for a slot outside its folder and backup, to delete along with it."""
+        save_path = Path(save_path)
+        storage = open_storage(save_path)
+        paths = [storage.sidecar(suffix) for suffix in self.SIDECAR_SUFFIXES]
+        paths.append(SaveSnapshot.path_for(get_config_path().parent / "snapshots", save_path))
+        paths.append(self._tree_store(save_path))
+        backup_location = storage.backup_storage().location
+        if backup_location is not None:
+            paths.append(self._tree_store(backup_location))
+        return [path for path in paths if path is not None]
+
+    def compare_slots(self, left: Path, right: Path) -> TreeDiff:
+        """Paths that differ between two slot (or backup) folders."""
+        left_tree, right_tree = self.tree(Path(left)), self.tree(Path(right))
+        self._save_cache(left_tree, "tree hashes")
+        self._save_cache(right_tree, "tree hashes")
+        return diff_trees(left_tree, right_tree)
+
+    def _on_disk(self) -> bool:
+        """Whether the slot and its backup are plain folders, where Merkle trees apply."""
+        return isinstance(self.storage, DiskStorage) and isinstance(self.backup_storage, DiskStorage)
+
+    def diff_with_backup(self) -> TreeDiff:
+        """Paths in the loaded slot that differ from its initial backup."""
+        self.flush_writes()
+        if not self.has_initial_backup():
+            raise FileNotFoundError("Initial backup not found")
+        if not self._on_disk():
+            return diff_storages(self.backup_storage, self.storage, ignore=("feature_backups",))
+        return self.compare_slots(self.backup_path, self.current_save)
+
+    @write_operation
+    def revert_feature(self, feature: str, timestamp: str) -> int:
+        """Revert a specific feature to a given backup timestamp. Returns the number of paths restored."""
+        backup_dir = f"feature_backups/{feature}/{timestamp}"
+        if self.backup_storage is None or not self.backup_storage.exists(backup_dir):
             raise FileNotFoundError(f"Backup not found: {backup_dir}")
-        
-        feature_dir = self.current_save / feature
-        if feature_dir.exists():
-            shutil.rmtree(feature_dir)  # Remove existing feature directory
-        shutil.copytree(backup_dir / feature, feature_dir)  # Copy entire backup directory
 
-    def revert_all_changes(self):
-        """Revert all changes by restoring the initial backup."""
-        if not self.backup_path.exists():
+        # Only the paths the backup covers are copied back, and only where they differ from it;
+        # paths missing from the backup did not exist then and are removed
+        restored = 0
+        folders = []
+        for rel_path in self._feature_backup_paths(backup_dir, feature):
+            backup_rel = f"{backup_dir}/{rel_path}"
+            if self.backup_storage.is_dir(backup_rel):
+                folders.append(rel_path)
+            elif self.backup_storage.exists(backup_rel):
+                data = self.backup_storage.read_bytes(backup_rel)
+                if self.storage.is_dir(rel_path) or self.storage.stat(rel_path) is None \
+                        or self.storage.read_bytes(rel_path) != data:
+                    self.storage.remove(rel_path)
+                    self.storage.write_bytes(rel_path, data)
+                    restored += 1
+            elif self.storage.exists(rel_path):
+                self.storage.remove(rel_path)
+                restored += 1
+        if folders and self._on_disk():
+            source = MerkleTree(self.backup_storage.path(backup_dir)).refresh()
+            target = self.tree(self.current_save)
+            for rel_path in folders:
+                restored += mirror_tree(source, target, rel_path, rel_path)
+            self._save_cache(target, "tree hashes")
+        else:
+            for rel_path in folders:
+                restored += mirror_storage(self.backup_storage, self.storage, f"{backup_dir}/{rel_path}", rel_path)
+        self.json_cache.invalidate()
+        self.versions.clear()
+        return restored
+
+    @write_operation
+    def revert_all_changes(self) -> int:
+        """Revert all changes by restoring the initial backup. Returns the number of paths restored."""
+        if not self.has_initial_backup():
             raise FileNotFoundError("Initial backup not found")
-        shutil.rmtree(self.current_save)
-        shutil.copytree(self.backup_path, self.current_save)
+        if self._on_disk():
+            source = self.tree(self.backup_path)
+            target = self.tree(self.current_save)
+            restored = mirror_tree(source, target)
+            self._save_cache(source, "tree hashes")
+            self._save_cache(target, "tree hashes")
+        else:
+            restored = mirror_storage(self.backup_storage, self.storage, ignore=("feature_backups",))
+        self.json_cache.invalidate()
+        self.versions.clear()
+        return restored
 
+    @write_operation(subtrees=("Products",))
     def remove_discovered_products(self, product_ids: list) -> list:
-        products_path = self.current_save / "Products"
-        products_json = products_path / "Products.json"
-        if not products_json.exists():
+        if not self.storage.exists("Products/Products.json"):
             return []
 
-        with open(products_json, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        targets = set(product_ids)
+        found = set()
+
+        def keep(pid):
+            if pid in targets:
+                found.add(pid)
+                return False
+            return True
 
-        discovered = data.get("DiscoveredProducts", [])
-        removed = []
-        for pid in product_ids:
-            if pid in discovered:
-                discovered.remove(pid)
-                removed.append(pid)
+        self.edit_products(keep={"DiscoveredProducts": keep})
 
-        with open(products_json, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
+        return [pid for pid in dict.fromkeys(product_ids) if pid in found]
 
-        return removed
+    @write_operation(subtrees=("Products",))
+    def delete_generated_products(self) -> int:
+        """Delete every product in Products/CreatedProducts and remove it from the product lists. Returns the count."""
+        created = "Products/CreatedProducts"
+        generated = {name[:-5] for name in self.storage.listdir(created, dirs=False) if name.endswith(".json")}
+        if not generated:
+            return 0
+        self.edit_products(
+            keep={
+                "DiscoveredProducts": lambda pid: pid not in generated,
+                "ListedProducts": lambda pid: pid not in generated,
+                "MixRecipes": lambda recipe: recipe.get("Output") not in generated,
+                "ProductPrices": lambda price: price.get("String") not in generated,
+                "FavouritedProducts": lambda pid: pid not in generated
+            },
+            default={"DiscoveredProducts": [], "ListedProducts": [], "MixRecipes": [], "ProductPrices": [], "FavouritedProducts": []})
+        for product_id in generated:
+            rel_path = f"{created}/{product_id}.json"
+            self.storage.remove(rel_path)
+            self.json_cache.invalidate(self.current_save / rel_path)
+            self.versions.record(rel_path, None)
+        return len(generated)
+
+    @write_operation(subtrees=("Players",))
+    def set_player_appearance(self, appearance: dict, clothing: dict):
+        """Replace the player's Appearance.json and Clothing.json."""
+        self._save_json_file("Players/Player_0/Appearance.json", appearance)
+        self._save_json_file("Players/Player_0/Clothing.json", clothing)
 
     def get_next_save_folder_name(self) -> str:
         if not hasattr(self, 'steamid_folder') or not self.steamid_folder:
@@ -1065,20 +1443,28 @@ class SaveManager:
 
         return None
 
+    def inventory_items(self) -> Optional[ItemList]:
+        """Decoded view of the player inventory's Items, reused until the inventory is replaced."""
+        inventory = self.save_data.get("inventory", {})
+        strings = inventory.get("Items")
+        if strings is None:
+            return None
+        if self._inventory_items is None or self._inventory_items[0] is not strings:
+            self._inventory_items = (strings, ItemList(strings, self.codec))
+        return self._inventory_items[1]
+
+    @write_operation(subtrees=("Players",))
     def set_cash_balance(self, new_balance: int):
         if "inventory" in self.save_data:
             inventory = self.save_data["inventory"]
             if "Items" in inventory:
-                for i, item_str in enumerate(inventory["Items"]):
-                    try:
-                        item = json.loads(item_str)
-                        if item.get("DataType") == "CashData":
-                            item["CashBalance"] = new_balance
-                            inventory["Items"][i] = json.dumps(item)
-                            self._save_json_file("Players/Player_0/Inventory.json", inventory)
-                            return
-                    except json.JSONDecodeError:
-                        continue
+                items = self.inventory_items()
+                cash = items.find("CashData")
+                if cash is not None:
+                    if items.update(cash[0], {"CashBalance": new_balance}):
+                        inventory["Items"][:] = items.encode()
+                        self._save_json_file("Players/Player_0/Inventory.json", inventory)
+                    return
                 else:
                     print("No CashData item found in inventory.")
             else:
@@ -1088,53 +1474,33 @@ class SaveManager:
 
     def get_dealers(self) -> list[str]:
         """Retrieve a list of dealer names from the NPCs directory."""
-        npcs_dir = self.current_save / "NPCs"
-        if not npcs_dir.exists():
+        manifest = self.scan_slot()
+        if not manifest.is_dir("NPCs"):
             return []
-        dealers = []
-        for npc_folder in npcs_dir.iterdir():
-            if npc_folder.is_dir():
-                npc_json_path = npc_folder / "NPC.json"
-                if npc_json_path.exists():
-                    try:
-                        with open(npc_json_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                        if data.get("DataType") == "DealerData":
-                            dealers.append(npc_folder.name)
-                    except json.JSONDecodeError:
-                        continue
+        dealers = [entry.parts[1] for entry in
+                   self.find_files(manifest, data_type="DealerData", under="NPCs", filename="NPC.json")
+                   if len(entry.parts) == 3]
         return dealers
 
     def get_plastic_pots(self, property_type: Optional[str] = None):
         """Retrieve plastic pots filtered by property type if specified."""
         plastic_pots = []
-        properties_path = self.current_save / "Properties"
-        if not properties_path.exists():
+        manifest = self.scan_slot()
+        if not manifest.is_dir("Properties"):
             return plastic_pots
         
-        # Get directories to process based on filter
-        prop_dirs = []
-        if property_type:
-            target_dir = properties_path / property_type
-            if target_dir.exists():
-                prop_dirs.append(target_dir)
-        else:
-            prop_dirs = [d for d in properties_path.iterdir() if d.is_dir()]
-        
-        for prop_dir in prop_dirs:
-            objects_path = prop_dir / "Objects"
-            if objects_path.exists():
-                for obj_dir in objects_path.iterdir():
-                    if obj_dir.is_dir() and obj_dir.name.startswith("plasticpot_"):
-                        data_path = obj_dir / "Data.json"
-                        if data_path.exists():
-                            with open(data_path, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                            plastic_pots.append({
-                                'property_type': prop_dir.name,
-                                'object_id': obj_dir.name,
-                                'data': data
-                            })
+        prefix = f"Properties/{property_type}" if property_type else "Properties"
+        for entry in self.find_files(manifest, under=prefix, filename="Data.json"):
+            # Properties/<type>/Objects/plasticpot_<id>/Data.json
+            parts = entry.parts
+            if len(parts) != 5 or parts[2] != "Objects" or not parts[3].startswith("plasticpot_"):
+                continue
+            data = self._load_json_file(entry.path)
+            plastic_pots.append({
+                'property_type': parts[1],
+                'object_id': parts[3],
+                'data': data
+            })
         return plastic_pots
 
 class MultiSelectComboBox(QWidget):
@@ -1399,11 +1765,11 @@ class PropertiesTab(QWidget):
             if not self.main_window or not self.main_window.manager.current_save:
                 return
 
-            properties_path = self.main_window.manager.current_save / "Properties"
-            if not properties_path.exists():
+            manifest = self.main_window.manager.scan_slot()
+            if not manifest.is_dir("Properties"):
                 return
 
-            dirs = [d.name for d in properties_path.iterdir() if d.is_dir()]
+            dirs = manifest.children("Properties", dirs=True)
             
             dir_mapping = {
                 "barn": "Barn",
@@ -1449,7 +1815,8 @@ class PropertiesTab(QWidget):
                 property_type, quantity, packaging, update_type, quality
             )
             self.main_window.backups_tab.refresh_backup_list()
-            QMessageBox.information(self, "Success", f"Updated {updated} property locations")
+            QMessageBox.information(self, "Success", f"Updated {updated} property locations\n"
+                                                     f"Files: {self.main_window.manager.last_write_counts}")
         except ValueError:
             QMessageBox.warning(self, "Invalid Input", "Please enter a valid quantity")
         except Exception as e:
@@ -1544,13 +1911,13 @@ class PropertiesTab(QWidget):
         for row in range(self.plastic_pots_table.rowCount()):
             property_type = self.plastic_pots_table.item(row, 0).text()
             object_id = self.plastic_pots_table.item(row, 1).text()
-            data_path = self.main_window.manager.current_save / "Properties" / property_type / "Objects" / object_id / "Data.json"
-            if not data_path.exists():
+            rel_path = f"Properties/{property_type}/Objects/{object_id}/Data.json"
+            if not self.main_window.manager.storage.exists(rel_path):
                 continue
+            data_path = self.main_window.manager.current_save / rel_path
             
             # Load the existing data
-            with open(data_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self.main_window.manager.load_document(data_path)
             
             # Clean up any incorrect root-level fields (optional but recommended)
             for field in ["SeedID", "QualityLevel", "GrowthProgress"]:
@@ -1606,10 +1973,9 @@ class PropertiesTab(QWidget):
                 remaining_uses = 0
             data["RemainingSoilUses"] = remaining_uses
             
-            # Save the updated data
-            with open(data_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
-        
+            # Queue the updated data; the pots are written in the background as one batch
+            self.main_window.manager.save_document(data_path, data)
+
         QMessageBox.information(self, "Success", "Plastic pots changes saved successfully!")
 
 class ProductsTab(QWidget):
@@ -1856,39 +2222,12 @@ class ProductsTab(QWidget):
         
         if reply == QMessageBox.Yes:
             try:
-                products_path = self.main_window.manager.current_save / "Products"
-                created_path = products_path / "CreatedProducts"
-                products_json = products_path / "Products.json"
-                
-                if not created_path.exists():
+                deleted = self.main_window.manager.delete_generated_products()
+                if not deleted:
                     QMessageBox.information(self, "Info", "No generated products to delete.")
                     return
                 
-                generated_ids = [f.stem for f in created_path.glob("*.json") if f.is_file()]
-                
-                if not generated_ids:
-                    QMessageBox.information(self, "Info", "No generated products to delete.")
-                    return
-                
-                if products_json.exists():
-                    with open(products_json, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                else:
-                    data = {"DiscoveredProducts": [], "ListedProducts": [], "MixRecipes": [], "ProductPrices": [], "FavouritedProducts": []}
-                
-                data["DiscoveredProducts"] = [pid for pid in data.get("DiscoveredProducts", []) if pid not in generated_ids]
-                data["ListedProducts"] = [pid for pid in data.get("ListedProducts", []) if pid not in generated_ids]
-                data["MixRecipes"] = [recipe for recipe in data.get("MixRecipes", []) if recipe.get("Output") not in generated_ids]
-                data["ProductPrices"] = [price for price in data.get("ProductPrices", []) if price.get("String") not in generated_ids]
-                data["FavouritedProducts"] = [pid for pid in data.get("FavouritedProducts", []) if pid not in generated_ids]
-                
-                with open(products_json, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=4)
-                
-                for file_path in created_path.glob("*.json"):
-                    file_path.unlink()
-                
-                QMessageBox.information(self, "Success", f"Deleted {len(generated_ids)} generated products.")
+                QMessageBox.information(self, "Success", f"Deleted {deleted} generated products.")
             
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Deletion failed: {str(e)}")
@@ -1971,7 +2310,8 @@ class UnlocksTab(QWidget):
             self.main_window.backups_tab.refresh_backup_list()  # Add this line
 
             updated = self.main_window.manager.unlock_all_properties()
-            QMessageBox.information(self, "Success", f"Unlocked {updated} properties!")
+            QMessageBox.information(self, "Success", f"Unlocked {updated} properties!\n"
+                                                     f"Files: {self.main_window.manager.last_write_counts}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to unlock properties: {str(e)}")
 
@@ -1988,7 +2328,8 @@ class UnlocksTab(QWidget):
             
             updated = self.main_window.manager.unlock_all_businesses()
             self.main_window.backups_tab.refresh_backup_list()
-            QMessageBox.information(self, "Success", f"Unlocked {updated} businesses!")
+            QMessageBox.information(self, "Success", f"Unlocked {updated} businesses!\n"
+                                                     f"Files: {self.main_window.manager.last_write_counts}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to unlock businesses: {str(e)}")
 
@@ -2006,7 +2347,8 @@ class UnlocksTab(QWidget):
             self.main_window.backups_tab.refresh_backup_list()
             QMessageBox.information(
                 self, "Success",
-                f"Updated relationships for {updated} NPCs and recruited dealers!"
+                f"Updated relationships for {updated} NPCs and recruited dealers!\n"
+                f"Files: {self.main_window.manager.last_write_counts}"
             )
         except Exception as e:
             QMessageBox.critical(
@@ -2070,6 +2412,7 @@ class InventoryTab(QWidget):
         self.setLayout(layout)
         self.current_type = None
         self.current_entity = None
+        self.items = ItemList([])
         self.load_entities()  # Initial load
         self.on_type_changed()  # Trigger initial display
 
@@ -2088,10 +2431,8 @@ class InventoryTab(QWidget):
             dealers = self.main_window.manager.get_dealers()
             self.entity_combo.addItems(dealers)
         elif self.type_combo.currentText() == "Vehicles":
-            vehicles_path = self.main_window.manager.current_save / "OwnedVehicles"
-            if vehicles_path.exists():
-                vehicles = [d.name for d in vehicles_path.iterdir() if d.is_dir()]
-                self.entity_combo.addItems(vehicles)
+            vehicles = self.main_window.manager.storage.listdir("OwnedVehicles", dirs=True)
+            self.entity_combo.addItems(vehicles)
 
     def on_type_changed(self):
         """Handle type change: update entity combo, hide/show cash group, and load inventory."""
@@ -2115,6 +2456,7 @@ class InventoryTab(QWidget):
         self.current_entity = self.entity_combo.currentText()
         if not self.current_entity:
             self.inventory_table.setRowCount(0)
+            self.items = ItemList([])
             self.cash_input.clear()
             return
         if self.current_type == "Dealers":
@@ -2124,13 +2466,8 @@ class InventoryTab(QWidget):
             self.display_inventory(items)
             # Load cash
             npc_json_path = self.main_window.manager.current_save / "NPCs" / self.current_entity / "NPC.json"
-            if npc_json_path.exists():
-                with open(npc_json_path, 'r', encoding='utf-8') as f:
-                    npc_data = json.load(f)
-                cash = round(npc_data.get("Cash", 0))
-                self.cash_input.setText(str(cash))
-            else:
-                self.cash_input.setText("0")
+            npc_data = self.main_window.manager.load_document(npc_json_path)
+            self.cash_input.setText(str(round(npc_data.get("Cash", 0))))
         elif self.current_type == "Vehicles":
             # Load inventory
             contents_path = self.main_window.manager.current_save / "OwnedVehicles" / self.current_entity / "Contents.json"
@@ -2138,56 +2475,50 @@ class InventoryTab(QWidget):
             self.display_inventory(items)
 
     def _load_items(self, path):
-        """Helper method to load items from a JSON file."""
-        if path.exists():
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return data.get("Items", [])
-        return []
+        """Helper method to load items from a JSON file, including edits not yet written."""
+        data = self.main_window.manager.load_document(path)
+        return ItemList(data.get("Items", []), self.main_window.manager.codec)
 
     def display_inventory(self, items):
-        """Display the inventory in the table."""
+        """Display the inventory in the table. Each row keeps its item's index in ``self.items``."""
+        self.items = items
         self.inventory_table.blockSignals(True)
         self.inventory_table.setRowCount(0)
-        for item_str in items:
-            try:
-                item = json.loads(item_str)
-                item_type = item.get("DataType", "Unknown")
-                item_id = item.get("ID", "Unknown")
-                quantity = str(item.get("Quantity", 0))
-                quality = item.get("Quality", "")
-                packaging = item.get("PackagingID", "")
-                row = self.inventory_table.rowCount()
-                self.inventory_table.insertRow(row)
-                self.inventory_table.setItem(row, 0, QTableWidgetItem(item_type))
-                self.inventory_table.setItem(row, 1, QTableWidgetItem(item_id))
-                quantity_item = QTableWidgetItem(quantity)
-                quantity_item.setData(Qt.UserRole, item_str)
-                self.inventory_table.setItem(row, 2, quantity_item)
-                if item_type in ("WeedData", "CocaineData", "MethData"):
-                    quality_combo = QComboBox()
-                    quality_combo.addItems(["Trash", "Poor", "Standard", "Premium", "Heavenly"])
-                    quality_combo.setCurrentText(quality if quality else "Standard")
-                    quality_combo.currentTextChanged.connect(
-                        lambda text, r=row: self.update_item_json(r, "Quality", text)
-                    )
-                    self.inventory_table.setCellWidget(row, 3, quality_combo)
-                    packaging_combo = QComboBox()
-                    packaging_combo.addItems(["none", "baggie", "jar"])
-                    packaging_combo.setCurrentText(packaging if packaging else "none")
-                    packaging_combo.currentTextChanged.connect(
-                        lambda text, r=row: self.update_item_json(r, "PackagingID", text)
-                    )
-                    self.inventory_table.setCellWidget(row, 4, packaging_combo)
-                else:
-                    quality_item = QTableWidgetItem("N/A")
-                    quality_item.setFlags(quality_item.flags() & ~Qt.ItemIsEditable)
-                    self.inventory_table.setItem(row, 3, quality_item)
-                    packaging_item = QTableWidgetItem("N/A")
-                    packaging_item.setFlags(packaging_item.flags() & ~Qt.ItemIsEditable)
-                    self.inventory_table.setItem(row, 4, packaging_item)
-            except json.JSONDecodeError:
-                continue
+        for index, item in items.decoded():
+            item_type = item.get("DataType", "Unknown")
+            item_id = item.get("ID", "Unknown")
+            quantity = str(item.get("Quantity", 0))
+            quality = item.get("Quality", "")
+            packaging = item.get("PackagingID", "")
+            row = self.inventory_table.rowCount()
+            self.inventory_table.insertRow(row)
+            self.inventory_table.setItem(row, 0, QTableWidgetItem(item_type))
+            self.inventory_table.setItem(row, 1, QTableWidgetItem(item_id))
+            quantity_item = QTableWidgetItem(quantity)
+            quantity_item.setData(Qt.UserRole, index)
+            self.inventory_table.setItem(row, 2, quantity_item)
+            if item_type in ("WeedData", "CocaineData", "MethData"):
+                quality_combo = QComboBox()
+                quality_combo.addItems(["Trash", "Poor", "Standard", "Premium", "Heavenly"])
+                quality_combo.setCurrentText(quality if quality else "Standard")
+                quality_combo.currentTextChanged.connect(
+                    lambda text, r=row: self.update_item_json(r, "Quality", text)
+                )
+                self.inventory_table.setCellWidget(row, 3, quality_combo)
+                packaging_combo = QComboBox()
+                packaging_combo.addItems(["none", "baggie", "jar"])
+                packaging_combo.setCurrentText(packaging if packaging else "none")
+                packaging_combo.currentTextChanged.connect(
+                    lambda text, r=row: self.update_item_json(r, "PackagingID", text)
+                )
+                self.inventory_table.setCellWidget(row, 4, packaging_combo)
+            else:
+                quality_item = QTableWidgetItem("N/A")
+                quality_item.setFlags(quality_item.flags() & ~Qt.ItemIsEditable)
+                self.inventory_table.setItem(row, 3, quality_item)
+                packaging_item = QTableWidgetItem("N/A")
+                packaging_item.setFlags(packaging_item.flags() & ~Qt.ItemIsEditable)
+                self.inventory_table.setItem(row, 4, packaging_item)
         self.inventory_table.blockSignals(False)
 
     def on_item_changed(self, item):
@@ -2234,32 +2565,24 @@ class InventoryTab(QWidget):
                 self.inventory_table.setItem(row, col, na_item)
         quantity_item = self.inventory_table.item(row, 2)
         if quantity_item:
-            item_str = quantity_item.data(Qt.UserRole)
-            if item_str:
-                try:
-                    item = json.loads(item_str)
-                    if item_type in ("WeedData", "CocaineData", "MethData"):
-                        item.setdefault("Quality", "Standard")
-                        item.setdefault("PackagingID", "none")
-                    else:
-                        item.pop("Quality", None)
-                        item.pop("PackagingID", None)
-                    quantity_item.setData(Qt.UserRole, json.dumps(item))
-                except json.JSONDecodeError:
-                    pass
+            index = quantity_item.data(Qt.UserRole)
+            if index is not None:
+                item = self.items[index]
+                if item_type in ("WeedData", "CocaineData", "MethData"):
+                    item.setdefault("Quality", "Standard")
+                    item.setdefault("PackagingID", "none")
+                else:
+                    item.pop("Quality", None)
+                    item.pop("PackagingID", None)
+                self.items.mark_dirty(index)
 
     def update_item_json(self, row, field, value):
         """Update the JSON data for an item."""
         quantity_item = self.inventory_table.item(row, 2)
         if quantity_item:
-            item_str = quantity_item.data(Qt.UserRole)
-            if item_str:
-                try:
-                    item = json.loads(item_str)
-                    item[field] = value
-                    quantity_item.setData(Qt.UserRole, json.dumps(item))
-                except json.JSONDecodeError:
-                    QMessageBox.warning(self, "Error", "Invalid item data")
+            index = quantity_item.data(Qt.UserRole)
+            if index is not None:
+                self.items.update(index, {field: value})
 
     def insert_row(self):
         """Insert a new row with default values."""
@@ -2267,11 +2590,11 @@ class InventoryTab(QWidget):
         row = self.inventory_table.rowCount()
         self.inventory_table.insertRow(row)
         item = {"DataType": "ItemData", "ID": "new_item", "Quantity": 1}
-        item_str = json.dumps(item)
+        index = self.items.append(item)
         self.inventory_table.setItem(row, 0, QTableWidgetItem("ItemData"))
         self.inventory_table.setItem(row, 1, QTableWidgetItem("new_item"))
         quantity_item = QTableWidgetItem("1")
-        quantity_item.setData(Qt.UserRole, item_str)
+        quantity_item.setData(Qt.UserRole, index)
         self.inventory_table.setItem(row, 2, quantity_item)
         for col in (3, 4):
             na_item = QTableWidgetItem("N/A")
@@ -2297,34 +2620,32 @@ class InventoryTab(QWidget):
             return
         if not self.current_entity:
             return
-        items = [self.inventory_table.item(row, 2).data(Qt.UserRole) for row in range(self.inventory_table.rowCount())]
+        items = self.items.encode([self.inventory_table.item(row, 2).data(Qt.UserRole)
+                                   for row in range(self.inventory_table.rowCount())])
         if self.current_type == "Dealers":
             inventory_path = self.main_window.manager.current_save / "NPCs" / self.current_entity / "Inventory.json"
             npc_json_path = self.main_window.manager.current_save / "NPCs" / self.current_entity / "NPC.json"
+            cash_value = self.cash_input.text()
+            try:
+                cash = int(cash_value) if cash_value else None
+            except ValueError:
+                QMessageBox.warning(self, "Invalid Cash", "Cash must be an integer.")
+                return
             self.main_window.manager.create_feature_backup("NPCs", [inventory_path.parent])
             # Save inventory
             inventory_data = {"DataType": "InventoryData", "DataVersion": 0, "GameVersion": "0.3.3f15", "Items": items}
-            with open(inventory_path, 'w', encoding='utf-8') as f:
-                json.dump(inventory_data, f, indent=4)
+            self.main_window.manager.save_document(inventory_path, inventory_data)
             # Save cash
-            cash_value = self.cash_input.text()
-            if cash_value:
-                try:
-                    cash = int(cash_value)
-                    with open(npc_json_path, 'r', encoding='utf-8') as f:
-                        npc_data = json.load(f)
+            if cash is not None:
+                npc_data = self.main_window.manager.load_document(npc_json_path)
+                if npc_data:
                     npc_data["Cash"] = cash
-                    with open(npc_json_path, 'w', encoding='utf-8') as f:
-                        json.dump(npc_data, f, indent=4)
-                except ValueError:
-                    QMessageBox.warning(self, "Invalid Cash", "Cash must be an integer.")
-                    return
+                    self.main_window.manager.save_document(npc_json_path, npc_data)
         elif self.current_type == "Vehicles":
             contents_path = self.main_window.manager.current_save / "OwnedVehicles" / self.current_entity / "Contents.json"
             self.main_window.manager.create_feature_backup("Vehicles", [contents_path.parent])
             data = {"DataType": "InventoryData", "DataVersion": 0, "GameVersion": "0.3.3f15", "Items": items}
-            with open(contents_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
+            self.main_window.manager.save_document(contents_path, data)
         QMessageBox.information(self, "Success", f"Inventory for {self.current_entity} saved successfully!")
         self.main_window.backups_tab.refresh_backup_list()
 
@@ -2563,24 +2884,13 @@ class MiscTab(QWidget):
 
         try:
             player_dir = self.main_window.manager.current_save / "Players/Player_0"
-            appearance_path = player_dir / "Appearance.json"
-            clothing_path = player_dir / "Clothing.json"
+            appearance, clothing = self.appearance_data[selected], self.clothing_data[selected]
 
             # Create backup of player directory
             self.main_window.manager.create_feature_backup("Appearance & Clothing", [player_dir])
             self.main_window.backups_tab.refresh_backup_list()
 
-            # Handle Appearance.json
-            if appearance_path.exists():
-                appearance_path.unlink()
-            with open(appearance_path, 'w', encoding='utf-8') as f:
-                json.dump(self.appearance_data[selected], f, indent=4)
-
-            # Handle Clothing.json
-            if clothing_path.exists():
-                clothing_path.unlink()
-            with open(clothing_path, 'w', encoding='utf-8') as f:
-                json.dump(self.clothing_data[selected], f, indent=4)
+            self.main_window.manager.set_player_appearance(appearance, clothing)
 
             QMessageBox.information(
                 self, 
@@ -2606,7 +2916,8 @@ class MiscTab(QWidget):
             quests_completed, objectives_completed = self.main_window.manager.complete_all_quests()
             self.main_window.backups_tab.refresh_backup_list()
             QMessageBox.information(self, "Quests Completed",
-                                    f"Marked {quests_completed} quests and {objectives_completed} objectives as completed!")
+                                    f"Marked {quests_completed} quests and {objectives_completed} objectives as completed!\n"
+                                    f"Files: {self.main_window.manager.last_write_counts}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to complete quests: {str(e)}")
 
@@ -2617,22 +2928,22 @@ class MiscTab(QWidget):
         try:
             variables_paths = [self.main_window.manager.current_save / "Variables"]
             for i in range(10):
-                player_vars = self.main_window.manager.current_save / f"Players/Player_{i}/Variables"
-                if player_vars.exists():
-                    variables_paths.append(player_vars)
+                if self.main_window.manager.storage.exists(f"Players/Player_{i}/Variables"):
+                    variables_paths.append(self.main_window.manager.current_save / f"Players/Player_{i}/Variables")
             self.main_window.manager.create_feature_backup("Variables", variables_paths)
             count = self.main_window.manager.modify_variables()
             self.main_window.backups_tab.refresh_backup_list()
             QMessageBox.information(self, "Variables Modified",
-                                    f"Successfully updated {count} variables!")
+                                    f"Successfully updated {count} variables!\n"
+                                    f"Files: {self.main_window.manager.last_write_counts}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to modify variables: {str(e)}")
 
     def update_vars_warning(self):
         if not self.main_window or not self.main_window.manager.current_save:
             return
-        players_path = self.main_window.manager.current_save / "Players"
-        player_dirs = [f"Player_{i}" for i in range(10) if (players_path / f"Player_{i}").exists()]
+        player_dirs = [f"Player_{i}" for i in range(10)
+                       if self.main_window.manager.storage.exists(f"Players/Player_{i}")]
         lines = ["- Variables/"]
         if player_dirs:
             for dir_name in player_dirs:
@@ -2733,22 +3044,13 @@ class TransferTab(QWidget):
 
     def populate_old_saves(self):
         """Populate the combo box with available old save slots."""
-        source_dir = Path.home() / "AppData" / "LocalLow" / "TVGS" / "Schedule I Free Sample" / "Saves"
-        if not source_dir.exists():
+        # Free Sample saves are SaveGame_ folders, or JSON files directly in the Saves folder ("Default Save")
+        old_saves = self.main_window.manager.get_legacy_saves()
+        if not old_saves:
             self.old_save_combo.addItem("No old saves found")
             return
-
-        save_folders = [f for f in source_dir.iterdir() if f.is_dir() and f.name.startswith("SaveGame_")]
-        if save_folders:
-            for folder in save_folders:
-                self.old_save_combo.addItem(folder.name, str(folder))
-        else:
-            # Check for JSON files directly under source_dir
-            json_files = list(source_dir.glob("*.json"))
-            if json_files:
-                self.old_save_combo.addItem("Default Save", str(source_dir))
-            else:
-                self.old_save_combo.addItem("No old saves found")
+        for save in old_saves:
+            self.old_save_combo.addItem(save.name, save.path)
 
     def transfer_saves(self):
         """Transfer the selected old save to a new save slot and update JSON versions."""
@@ -2773,17 +3075,18 @@ class TransferTab(QWidget):
                 else:
                     shutil.copy2(item, dest_save_dir / item.name)
 
-            # Update all JSON files in the new save slot
+            # Update all JSON files in the new save slot, rewriting only those whose output differs
             json_files = list(dest_save_dir.rglob("*.json"))
+            written = 0
             for json_file in json_files:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = self.main_window.manager.codec.load(json_file)
                 if "GameVersion" in data:
                     data["GameVersion"] = "0.3.3f15"
-                with open(json_file, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=4)
+                written += self.main_window.manager.codec.dump_if_changed(data, json_file, PRESERVE)
+            counts = WriteCounts(written, len(json_files) - written)
 
-            QMessageBox.information(self, "Success", f"Transferred save to new slot '{next_save_name}'.")
+            QMessageBox.information(self, "Success", f"Transferred save to new slot '{next_save_name}'.\n"
+                                                     f"Files: {counts}")
             self.main_window.populate_save_table()
 
         except Exception as e:
@@ -2819,9 +3122,16 @@ class TransferTab(QWidget):
 
         if reply == QMessageBox.Yes:
             try:
+                if Path(save_path) == self.main_window.manager.current_save:
+                    self.main_window.manager.flush_writes()
+                    self.main_window.manager.close_index()
+                    self.main_window.manager.locks.close()
                 shutil.rmtree(save_path)
                 if backup_path.exists():
                     shutil.rmtree(backup_path)
+                for sidecar_path in self.main_window.manager.slot_sidecars(save_path):
+                    if sidecar_path.exists():
+                        sidecar_path.unlink()
                 QMessageBox.information(self, "Success", "Save folder and its backup deleted successfully.")
                 self.load_save_folders()
                 self.main_window.populate_save_table()
@@ -2867,11 +3177,9 @@ class TransferTab(QWidget):
 
             game_json_path = new_save_path / "Game.json"
             if game_json_path.exists():
-                with open(game_json_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = self.main_window.manager.codec.load(game_json_path)
                 data["OrganisationName"] = new_org_name
-                with open(game_json_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=4)
+                self.main_window.manager.codec.dump(data, game_json_path, PRESERVE)
             else:
                 raise FileNotFoundError("Game.json not found in the new save folder")
 
@@ -2909,6 +3217,10 @@ class BackupsTab(QWidget):
         revert_all_btn.clicked.connect(self.revert_all_changes)
         revert_layout.addWidget(revert_all_btn)
 
+        show_changes_btn = QPushButton("Show Changes Since Initial Backup")
+        show_changes_btn.clicked.connect(self.show_changes)
+        revert_layout.addWidget(show_changes_btn)
+
         revert_group.setLayout(revert_layout)
         layout.addWidget(revert_group)
 
@@ -2950,10 +3262,39 @@ class BackupsTab(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to revert feature: {str(e)}")
 
+    def show_changes(self):
+        """List the files and folders that differ from the initial backup."""
+        if not self.main_window or not self.main_window.manager.current_save:
+            QMessageBox.critical(self, "Error", "No save file loaded")
+            return
+        try:
+            diff = self.main_window.manager.diff_with_backup()
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to compare with the initial backup: {str(e)}")
+            return
+        if not diff:
+            QMessageBox.information(self, "No Changes", "The save matches its initial backup.")
+            return
+        lines = ([f"Changed: {path}" for path in diff.changed] + [f"Added: {path}" for path in diff.only_right]
+                 + [f"Removed: {path}" for path in diff.only_left])
+        if len(lines) > 30:
+            lines = lines[:30] + [f"... and {len(lines) - 30} more"]
+        QMessageBox.information(self, "Changes Since Initial Backup", "\n".join(lines))
+
     def revert_all_changes(self):
         """Revert all changes to the initial backup."""
+        try:
+            diff = self.main_window.manager.diff_with_backup()
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to compare with the initial backup: {str(e)}")
+            return
+        if not diff:
+            QMessageBox.information(self, "No Changes", "The save matches its initial backup.")
+            return
+        changed = len(diff.changed) + len(diff.only_left) + len(diff.only_right)
         reply = QMessageBox.question(self, "Confirm Revert",
-                                    "This will revert ALL changes since the initial backup. Continue?",
+                                    f"This will revert ALL changes since the initial backup "
+                                    f"({changed} files or folders differ). Continue?",
                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
             try:
@@ -3246,6 +3587,10 @@ class SaveEditorWindow(QMainWindow):
         frame_geo.moveCenter(screen_center)
         self.move(frame_geo.topLeft())
         self.manager = SaveManager()  # Assume SaveManager is defined elsewhere
+        # Queued edits are written in the background; a failure is shown whenever it happens
+        self.write_failures = WriteFailureNotifier()
+        self.write_failures.failed.connect(self.show_write_failure)
+        self.manager.writer.on_failure = self.write_failures.report
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
 
@@ -3263,6 +3608,10 @@ class SaveEditorWindow(QMainWindow):
         self.populate_save_table()
         self.stacked_widget.setCurrentWidget(self.save_selection_page)
 
+    def show_write_failure(self, message: str):
+        QMessageBox.critical(self, "Save Failed", f"Some edits could not be saved:\n{message}\n\n"
+                                                  "Reload the save to see what is on disk.")
+
     def check_for_updates(self):
         self.update_thread = QThread()
         self.update_worker = UpdateChecker()
@@ -3353,8 +3702,9 @@ class SaveEditorWindow(QMainWindow):
 
             # Setup save table
             self.save_table = QTableWidget()
-            self.save_table.setColumnCount(2)
-            self.save_table.setHorizontalHeaderLabels(["Organization Names", "Save Folders"])
+            self.save_table.setColumnCount(6)
+            self.save_table.setHorizontalHeaderLabels(["Organization Names", "Save Folders", "Game Version",
+                                                       "Playtime", "Networth", "Last Modified"])
             self.save_table.setSelectionBehavior(QTableWidget.SelectRows)
             self.save_table.setSelectionMode(QTableWidget.SingleSelection)
             
@@ -3379,25 +3729,63 @@ class SaveEditorWindow(QMainWindow):
             return page
 
     def populate_save_table(self):
-        """Populate the save table with data from save folders."""
-        saves = self.manager.get_save_folders()
+        """Populate the save table from cached slot summaries, then refresh them in the background."""
+        self.render_save_table(self.manager.get_save_folders(cached=True))
+        self.refresh_save_summaries()
+
+    def render_save_table(self, saves):
+        """Fill the save table, keeping the selected slot selected."""
+        selected_path = None
+        selected_items = self.save_table.selectedItems()
+        if selected_items:
+            selected_path = self.save_table.item(selected_items[0].row(), 0).data(Qt.UserRole)
+
+        # With several Steam accounts, slot names alone are ambiguous
+        several_accounts = len({save.get('steam_id') for save in saves}) > 1
         self.save_table.setRowCount(len(saves))
         for row, save in enumerate(saves):
             # Organization name item
             org_item = QTableWidgetItem(save['organisation_name'])
             org_item.setFlags(org_item.flags() & ~Qt.ItemIsEditable)
             org_item.setData(Qt.UserRole, save['path'])
-            
-            # Save folder name item
-            folder_item = QTableWidgetItem(save['name'])
-            folder_item.setFlags(folder_item.flags() & ~Qt.ItemIsEditable)
 
             # Add items to table
             self.save_table.setItem(row, 0, org_item)
-            self.save_table.setItem(row, 1, folder_item)
-        
+            name = f"{save['name']} ({save['steam_id']})" if several_accounts else save['name']
+            for column, value in enumerate([name, save['game_version'], save['playtime'],
+                                            f"${save['networth']:,}", save['last_modified']], start=1):
+                item = QTableWidgetItem(str(value))
+                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+                self.save_table.setItem(row, column, item)
+            if save['path'] == selected_path:
+                self.save_table.selectRow(row)
+
         self.save_table.resizeColumnsToContents()
 
+    def refresh_save_summaries(self):
+        """Re-validate slot summaries on a worker thread and redraw the table when done."""
+        if getattr(self, 'summary_thread', None) is not None:
+            self.summary_refresh_pending = True
+            return
+        self.summary_refresh_pending = False
+        self.summary_thread = QThread()
+        self.summary_worker = SlotSummaryRefresher(self.manager)
+        self.summary_worker.moveToThread(self.summary_thread)
+        self.summary_thread.started.connect(self.summary_worker.run)
+        self.summary_worker.finished.connect(self.handle_summary_refresh)
+        self.summary_worker.finished.connect(self.summary_thread.quit)
+        self.summary_worker.finished.connect(self.summary_worker.deleteLater)
+        self.summary_thread.finished.connect(self.summary_thread.deleteLater)
+        self.summary_thread.start()
+
+    def handle_summary_refresh(self, saves):
+        self.summary_thread = None
+        if self.summary_refresh_pending:
+            self.refresh_save_summaries()
+            return
+        if saves:
+            self.render_save_table(saves)
+
     def load_selected_save(self):
         """Load the selected save and switch to the save info page."""
         selected_items = self.save_table.selectedItems()
@@ -3553,30 +3941,39 @@ class SaveEditorWindow(QMainWindow):
                 self.manager.create_feature_backup("Stats", stats_files)
                 self.backups_tab.refresh_backup_list()
 
-                # Apply money changes
-                self.manager.set_online_money(money_data["online_money"])
-                self.manager.set_networth(money_data["networth"])
-                self.manager.set_lifetime_earnings(money_data["lifetime_earnings"])
-                self.manager.set_weekly_deposit_sum(money_data["weekly_deposit_sum"])
-                self.manager.set_cash_balance(money_data["cash_balance"])
-
-                # Apply rank changes
-                self.manager.set_rank(rank_data["current_rank"])
-                self.manager.set_rank_number(rank_data["rank_number"])
-                self.manager.set_tier(rank_data["tier"])
-
-                self.manager.set_organisation_name(misc_data["organisation_name"])
-                
-                # Update ConsoleEnabled in Game.json Settings
-                game_data = self.manager._load_json_file("Game.json")
-                # Ensure Settings dictionary exists
-                game_data.setdefault("Settings", {})
-                game_data["Settings"]["ConsoleEnabled"] = misc_data["console_enabled"]
-                self.manager._save_json_file("Game.json", game_data)
-
-                QMessageBox.information(self, "Success", "Changes applied successfully!")
+                # Each file is written once, when the transaction commits
+                with self.manager.transaction() as transaction:
+                    # Apply money changes
+                    self.manager.set_online_money(money_data["online_money"])
+                    self.manager.set_networth(money_data["networth"])
+                    self.manager.set_lifetime_earnings(money_data["lifetime_earnings"])
+                    self.manager.set_weekly_deposit_sum(money_data["weekly_deposit_sum"])
+                    self.manager.set_cash_balance(money_data["cash_balance"])
+
+                    # Apply rank changes
+                    self.manager.set_rank(rank_data["current_rank"])
+                    self.manager.set_rank_number(rank_data["rank_number"])
+                    self.manager.set_tier(rank_data["tier"])
+
+                    self.manager.set_organisation_name(misc_data["organisation_name"])
+
+                    # Update ConsoleEnabled in Game.json Settings
+                    game_data = self.manager._load_json_file("Game.json")
+                    # Ensure Settings dictionary exists
+                    game_data.setdefault("Settings", {})
+                    game_data["Settings"]["ConsoleEnabled"] = misc_data["console_enabled"]
+                    self.manager._save_json_file("Game.json", game_data)
+                QMessageBox.information(self, "Success", "Changes applied successfully!\n"
+                                                         f"Files: {WriteCounts(transaction.written, transaction.unchanged)}\n"
+                                                         f"Writes saved: {transaction.writes_saved} of {transaction.requested}")
                 self.update_save_info_page()
                 self.stacked_widget.setCurrentWidget(self.save_info_page)
+            except SlotLockTimeout as e:
+                QMessageBox.warning(self, "Save In Use", f"{e}\n\nAnother editor is writing this save; try again once it has finished.")
+            except WriteConflictError as e:
+                # The transaction rolled back and re-read the files, so the stats now show what is on disk
+                QMessageBox.warning(self, "Save Changed", f"{e}\n\nReview the values and apply them again.")
+                self.update_save_info_page()
             except ValueError:
                 QMessageBox.warning(self, "Invalid Input", "Please enter valid integer values.")
 
@@ -3586,6 +3983,9 @@ class SaveEditorWindow(QMainWindow):
         self.stacked_widget.setCurrentWidget(self.save_selection_page)
 
 if __name__ == "__main__":
+    # Needed for worker processes in the frozen executable
+    multiprocessing.freeze_support()
+
     # Check if running with admin privileges
     if not is_admin():
         print("Not running as administrator. Attempting to relaunch with elevated privileges...")
@@ -0,0 +1,41 @@
+import json
+from pathlib import Path
+
+import pytest
+
+SLOT_FILES = {
+    "Game.json": {"DataType": "GameData", "DataVersion": 0, "GameVersion": "0.3.3f14",
+                  "OrganisationName": "Test Org", "Seed": 1234},
+    "Money.json": {"DataType": "MoneyData", "DataVersion": 0, "GameVersion": "0.3.3f14",
+                   "OnlineBalance": 500.0, "Networth": 1500.0, "LifetimeEarnings": 2000.0},
+    "Rank.json": {"DataType": "RankData", "DataVersion": 0, "GameVersion": "0.3.3f14",
+                  "Rank": 2, "Tier": 3, "XP": 150, "TotalXP": 4000},
+    "Time.json": {"DataType": "TimeData", "DataVersion": 0, "GameVersion": "0.3.3f14",
+                  "TimeOfDay": 900, "ElapsedDays": 12, "Playtime": 3600},
+    "Players/Player_0/Inventory.json": {
+        "DataType": "InventoryData", "DataVersion": 0, "GameVersion": "0.3.3f14",
+        "Items": [json.dumps({"DataType": "CashData", "DataVersion": 0, "GameVersion": "0.3.3f14",
+                              "ID": "cash", "Quality": "Standard", "Quantity": 1, "CashBalance": 250.0})]},
+    "NPCs/Benji/NPC.json": {"DataType": "DealerData", "DataVersion": 0, "GameVersion": "0.3.3f14",
+                            "ID": "benji_coleman", "Recruited": True, "Cash": 100.0},
+    "NPCs/Kyle/NPC.json": {"DataType": "NPCData", "DataVersion": 0, "GameVersion": "0.3.3f14",
+                           "ID": "kyle_cooley"},
+    "Properties/Barn/Property.json": {"DataType": "PropertyData", "DataVersion": 0, "GameVersion": "0.3.3f14",
+                                      "PropertyCode": "barn", "IsOwned": True},
+    "Products/Products.json": {"DataType": "ProductManagerData", "DataVersion": 0, "GameVersion": "0.3.3f14",
+                               "DiscoveredProducts": ["ogkush"], "ListedProducts": [], "MixRecipes": []},
+}
+
+
+def write_slot(root: Path, files: dict = SLOT_FILES) -> Path:
+    """Write a save slot the way the game lays it out: 4-space indented JSON."""
+    for rel_path, data in files.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=4), encoding="utf-8")
+    return root
+
+
+@pytest.fixture
+def slot(tmp_path) -> Path:
+    return write_slot(tmp_path / "SaveGame_1")
@@ -0,0 +1,94 @@
+import asyncio
+import threading
+
+from lib.asyncmanager import AsyncSaveManager
+
+TIMEOUT = 5
+
+
+class Manager:
+    """Operations that only finish once ``parties`` of them are running at the same time."""
+
+    def __init__(self, parties: int):
+        self.barrier = threading.Barrier(parties, timeout=TIMEOUT)
+        self.running = 0
+        self.most_running = 0
+        self._lock = threading.Lock()
+
+    def _run(self, name, meet=True):
+        with self._lock:
+            self.running += 1
+            self.most_running = max(self.most_running, self.running)
+        try:
+            if meet:
+                self.barrier.wait()
+            else:
+                threading.Event().wait(0.05)
+            return name
+        finally:
+            with self._lock:
+                self.running -= 1
+
+    def set_online_money(self, amount):
+        return self._run("money")
+
+    def set_rank(self, rank):
+        return self._run("rank")
+
+    def set_cash_balance(self, amount, meet=True):
+        return self._run("cash", meet)
+
+    def get_dealers(self):
+        return self._run("dealers")
+
+    def get_plastic_pots(self):
+        return self._run("pots")
+
+    def update_property_quantities(self, *args):
+        return self._run("properties")
+
+    def load_save(self, path):
+        return self._run("load", meet=False)
+
+
+def run(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, TIMEOUT * 2))
+
+
+async def gather(manager, *calls):
+    async with AsyncSaveManager(manager, max_workers=4) as facade:
+        return await asyncio.gather(*(getattr(facade, name)(*args) for name, *args in calls))
+
+
+def test_writes_to_independent_sections_overlap():
+    manager = Manager(2)
+
+    assert run(gather(manager, ("set_online_money", 1), ("set_rank", "Kingpin"))) == ["money", "rank"]
+    assert manager.most_running == 2
+
+
+def test_read_runs_beside_a_write_on_another_section():
+    manager = Manager(2)
+
+    assert run(gather(manager, ("get_dealers",), ("set_cash_balance", 10))) == ["dealers", "cash"]
+
+
+def test_reads_of_one_section_overlap():
+    manager = Manager(2)
+
+    assert run(gather(manager, ("get_plastic_pots",), ("get_plastic_pots",))) == ["pots", "pots"]
+
+
+def test_writes_to_one_section_take_turns():
+    manager = Manager(1)
+
+    run(gather(manager, ("set_cash_balance", 1, False), ("set_cash_balance", 2, False),
+               ("set_cash_balance", 3, False)))
+    assert manager.most_running == 1
+
+
+def test_load_save_has_the_slot_to_itself():
+    manager = Manager(1)
+
+    run(gather(manager, ("load_save", "slot"), ("set_cash_balance", 1, False), ("load_save", "slot")))
+    assert manager.most_running == 1
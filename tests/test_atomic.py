@@ -0,0 +1,153 @@
+import os
+
+import pytest
+
+from lib.atomic import WriteJournal, atomic_write
+
+
+class Crash(BaseException):
+    """Stands in for the process dying: nothing after it runs."""
+
+
+def crash_during_commit(monkeypatch, renames_done: int):
+    """Make the commit die after ``renames_done`` renames, as a crash between them would."""
+    replace = os.replace
+    calls = []
+
+    def crashing_replace(src, dst):
+        if not str(dst).endswith("journal"):
+            if len(calls) == renames_done:
+                raise Crash()
+            calls.append(dst)
+        replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", crashing_replace)
+
+
+def test_atomic_write_replaces_file(tmp_path):
+    target = tmp_path / "Money.json"
+    target.write_text("old")
+    atomic_write(target, "new")
+
+    assert target.read_text() == "new"
+    assert os.listdir(tmp_path) == ["Money.json"]
+
+
+def test_group_renames_files_when_it_ends(tmp_path):
+    target = tmp_path / "Money.json"
+    target.write_bytes(b'{"OnlineBalance": 0}')
+    journal = WriteJournal(tmp_path / "journal")
+    journal.begin()
+    journal.write(target, b'{"OnlineBalance": 10}')
+
+    assert target.read_bytes() == b'{"OnlineBalance": 0}'
+    assert journal.resolve(target).read_bytes() == b'{"OnlineBalance": 10}'
+    journal.end()
+
+    assert target.read_bytes() == b'{"OnlineBalance": 10}'
+    assert journal.resolve(target) == target
+    assert sorted(os.listdir(tmp_path)) == ["Money.json"]
+
+
+def test_crash_before_end_keeps_old_files(tmp_path):
+    money, rank = tmp_path / "Money.json", tmp_path / "Rank.json"
+    money.write_bytes(b'{"OnlineBalance": 0}')
+    rank.write_bytes(b'{"Rank": 1}')
+    journal = WriteJournal(tmp_path / "journal")
+    journal.begin()
+    journal.write(money, b'{"OnlineBalance": 10}')
+    journal.write(rank, b'{"Rank": 2}')
+    # The process dies here: end() never runs
+
+    assert WriteJournal(journal.journal_path).recover() == 0
+    assert money.read_bytes() == b'{"OnlineBalance": 0}'
+    assert rank.read_bytes() == b'{"Rank": 1}'
+
+
+def test_recover_finishes_interrupted_commit(tmp_path, monkeypatch):
+    money, rank = tmp_path / "Money.json", tmp_path / "Rank.json"
+    money.write_bytes(b'{"OnlineBalance": 0}')
+    rank.write_bytes(b'{"Rank": 1}')
+    journal = WriteJournal(tmp_path / "journal")
+    journal.begin()
+    journal.write(money, b'{"OnlineBalance": 10}')
+    journal.write(rank, b'{"Rank": 2}')
+    crash_during_commit(monkeypatch, renames_done=1)
+    with pytest.raises(Crash):
+        journal.end()
+    monkeypatch.undo()
+    assert journal.journal_path.exists()
+
+    assert WriteJournal(journal.journal_path).recover() == 1
+    assert money.read_bytes() == b'{"OnlineBalance": 10}'
+    assert rank.read_bytes() == b'{"Rank": 2}'
+    assert sorted(os.listdir(tmp_path)) == ["Money.json", "Rank.json"]
+
+
+def test_recover_leaves_files_written_since(tmp_path, monkeypatch):
+    target = tmp_path / "Money.json"
+    target.write_bytes(b'{"OnlineBalance": 0}')
+    journal = WriteJournal(tmp_path / "journal")
+    journal.begin()
+    journal.write(target, b'{"OnlineBalance": 10}')
+    crash_during_commit(monkeypatch, renames_done=0)
+    with pytest.raises(Crash):
+        journal.end()
+    monkeypatch.undo()
+    mtime_ns = os.stat(target).st_mtime_ns + 10_000_000_000
+    target.write_bytes(b'{"OnlineBalance": 99}')
+    os.utime(target, ns=(mtime_ns, mtime_ns))
+
+    assert WriteJournal(journal.journal_path).recover() == 0
+    assert target.read_bytes() == b'{"OnlineBalance": 99}'
+    assert sorted(os.listdir(tmp_path)) == ["Money.json"]
+
+
+def test_recover_does_not_recreate_deleted_files(tmp_path, monkeypatch):
+    target = tmp_path / "Products" / "Created" / "mixed1.json"
+    target.parent.mkdir(parents=True)
+    target.write_bytes(b'{}')
+    journal = WriteJournal(tmp_path / "journal")
+    journal.begin()
+    journal.write(target, b'{"ID": "mixed1"}')
+    crash_during_commit(monkeypatch, renames_done=0)
+    with pytest.raises(Crash):
+        journal.end()
+    monkeypatch.undo()
+    target.unlink()
+
+    assert WriteJournal(journal.journal_path).recover() == 0
+    assert not target.exists()
+    assert os.listdir(target.parent) == []
+    assert not journal.journal_path.exists()
+
+
+def test_failed_rename_does_not_stop_the_group(tmp_path):
+    blocked = tmp_path / "Properties"
+    blocked.mkdir()
+    journal = WriteJournal(tmp_path / "journal")
+    journal.begin()
+    journal.write(blocked, b"{}")
+    journal.write(tmp_path / "Money.json", b'{"OnlineBalance": 10}')
+    with pytest.raises(OSError):
+        journal.end()
+
+    assert (tmp_path / "Money.json").read_bytes() == b'{"OnlineBalance": 10}'
+    assert blocked.is_dir()
+    assert sorted(os.listdir(tmp_path)) == ["Money.json", "Properties"]
+
+
+def test_forgotten_files_are_not_written(tmp_path):
+    folder = tmp_path / "Products"
+    folder.mkdir()
+    journal = WriteJournal(tmp_path / "journal")
+    journal.begin()
+    journal.write(folder / "a.json", b"{}")
+    journal.write(tmp_path / "Money.json", b"{}")
+    journal.forget(folder)
+
+    assert journal.pending_names(folder) == []
+    assert journal.pending_names(tmp_path) == ["Money.json"]
+    journal.end()
+    assert os.listdir(folder) == []
+    assert (tmp_path / "Money.json").exists()
@@ -0,0 +1,55 @@
+import json
+import os
+
+from lib.cache import JsonCache
+
+
+def load(path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_hits_return_independent_copies(slot):
+    cache = JsonCache()
+    path = slot / "Money.json"
+
+    first = cache.load(path, load)
+    first["OnlineBalance"] = 0
+    second = cache.load(path, load)
+
+    assert second["OnlineBalance"] == 500.0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_changed_file_is_reloaded(slot):
+    cache = JsonCache()
+    path = slot / "Money.json"
+    cache.load(path, load)
+    path.write_text(json.dumps({"OnlineBalance": 1.0}), encoding="utf-8")
+    os.utime(path, ns=(1, 1))
+
+    assert cache.load(path, load) == {"OnlineBalance": 1.0}
+    assert cache.misses == 2
+
+
+def test_put_refreshes_written_files(slot):
+    cache = JsonCache()
+    path = slot / "Rank.json"
+    cache.load(path, load)
+    path.write_text(json.dumps({"Rank": 9}), encoding="utf-8")
+    cache.put(path, {"Rank": 9})
+
+    assert cache.load(path, lambda _: {"unexpected": True}) == {"Rank": 9}
+
+
+def test_least_recently_used_entries_are_evicted(slot):
+    paths = [slot / "Game.json", slot / "Money.json", slot / "Rank.json"]
+    cache = JsonCache()
+    for path in paths:
+        cache.load(path, load)
+    cache.max_bytes = cache.stats()["bytes"] - 1
+    cache.load(paths[0], load)
+    cache.put(paths[2], load(paths[2]))
+
+    assert cache.evictions >= 1
+    assert str(paths[1]) not in cache._entries
+    assert cache.stats()["bytes"] <= cache.max_bytes
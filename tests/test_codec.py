@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+from lib.codec import COMPACT, PRESERVE, JsonCodec, OrjsonCodec, detect_indent, get_codec
+from tests.conftest import SLOT_FILES
+
+DOCUMENTS = list(SLOT_FILES.values()) + [
+    {"Floats": [0.1, 1e-05, 1e16, 2.5, -0.0], "Ints": [0, -1, 2 ** 53], "Nested": {"Empty": {}, "List": []}},
+    {"Unicode": "café ☃", "Escapes": "tab\tquote\"back\\slash\x7f", "None": None, "Bools": [True, False]},
+    [], {}, "text", 3.0,
+]
+
+
+@pytest.fixture(params=["json", "orjson"])
+def codec(request):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        return OrjsonCodec()
+    return JsonCodec()
+
+
+@pytest.mark.parametrize("indent", [4, 2, None])
+def test_dumps_matches_json_dumps(codec, indent):
+    for document in DOCUMENTS:
+        assert codec.dumps(document, indent) == json.dumps(document, indent=indent), document
+
+
+def test_compact_dumps(codec):
+    for document in DOCUMENTS:
+        assert codec.dumps(document, COMPACT) == json.dumps(document, separators=(",", ":")), document
+
+
+@pytest.mark.parametrize("indent", [4, 2, "\t", None, COMPACT])
+def test_detect_indent(indent):
+    document = SLOT_FILES["Game.json"]
+    text = json.dumps(document, separators=(",", ":")) if indent == COMPACT else json.dumps(document, indent=indent)
+
+    assert detect_indent(text.encode()) == indent
+    assert detect_indent(b"\xef\xbb\xbf" + text.encode()) == indent
+    assert detect_indent(json.dumps([1, 2], indent=indent).encode() if indent != COMPACT else b"[1,2]") == indent
+
+
+@pytest.mark.parametrize("head", [b"", b"{}", b"[]", b"  {\n}", b"3.0", b'{"A'])
+def test_detect_indent_falls_back_to_default(head):
+    assert detect_indent(head, default=2) == 2
+
+
+@pytest.mark.parametrize("indent", [2, "\t", None, COMPACT])
+def test_preserve_keeps_file_layout(codec, tmp_path, indent):
+    path = tmp_path / "Game.json"
+    codec.dump(SLOT_FILES["Game.json"], path, indent)
+    written = path.read_bytes()
+    codec.dump(SLOT_FILES["Game.json"], path, PRESERVE)
+
+    assert path.read_bytes() == written
+    assert not codec.dump_if_changed(SLOT_FILES["Game.json"], path, PRESERVE)
+
+
+def test_preserve_uses_default_for_new_files(codec, tmp_path):
+    path = tmp_path / "New.json"
+    codec.dump(SLOT_FILES["Rank.json"], path, PRESERVE)
+
+    assert path.read_text(encoding="utf-8") == json.dumps(SLOT_FILES["Rank.json"], indent=4)
+
+
+def test_orjson_loads_bytes_with_bom():
+    pytest.importorskip("orjson")
+    raw = b"\xef\xbb\xbf" + json.dumps(SLOT_FILES["Money.json"]).encode()
+
+    assert OrjsonCodec().loads(raw) == SLOT_FILES["Money.json"]
+
+
+def test_dump_and_load_round_trip(codec, tmp_path):
+    path = tmp_path / "Rank.json"
+    codec.dump(SLOT_FILES["Rank.json"], path)
+
+    assert path.read_text(encoding="utf-8") == json.dumps(SLOT_FILES["Rank.json"], indent=4)
+    assert codec.load(path) == SLOT_FILES["Rank.json"]
+
+
+def test_get_codec():
+    assert get_codec("json").name == "json"
+    assert get_codec().name in ("json", "orjson")
+    with pytest.raises(ValueError):
+        get_codec("yaml")
@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from lib.discovery import SaveDiscovery, SaveRoot, SlotInfo
+
+STEAM_ID = "76561198000000001"
+
+
+@pytest.fixture
+def roots(tmp_path):
+    steam = tmp_path / "steam"
+    (steam / STEAM_ID / "SaveGame_1").mkdir(parents=True)
+    (steam / STEAM_ID / "SaveGame_2").mkdir()
+    (steam / STEAM_ID / "NotASlot").mkdir()
+    (steam / "12345").mkdir()
+    legacy = tmp_path / "legacy"
+    (legacy / "SaveGame_3").mkdir(parents=True)
+    return SaveRoot(str(steam)), SaveRoot(str(legacy), "legacy")
+
+
+def test_refresh_finds_slots_in_every_root(roots):
+    steam, legacy = roots
+    slots = SaveDiscovery(roots).refresh()
+
+    account = os.path.join(steam.path, STEAM_ID)
+    assert sorted(slots) == sorted([
+        SlotInfo(os.path.join(account, "SaveGame_1"), "SaveGame_1", steam.path, "steam", STEAM_ID),
+        SlotInfo(os.path.join(account, "SaveGame_2"), "SaveGame_2", steam.path, "steam", STEAM_ID),
+        SlotInfo(os.path.join(legacy.path, "SaveGame_3"), "SaveGame_3", legacy.path, "legacy", None),
+    ])
+
+
+def test_legacy_root_with_loose_files_is_a_default_save(tmp_path):
+    (tmp_path / "Game.json").write_text("{}", encoding="utf-8")
+    root = SaveRoot(str(tmp_path), "legacy")
+
+    assert SaveDiscovery([root]).refresh() == [SlotInfo(str(tmp_path), "Default Save", str(tmp_path), "legacy", None)]
+
+
+def test_unchanged_folders_are_not_listed_again(roots):
+    discovery = SaveDiscovery(roots)
+    discovery.refresh()
+    listed = discovery.listed
+    discovery.refresh()
+    assert discovery.listed == listed
+
+    os.mkdir(os.path.join(roots[0].path, STEAM_ID, "SaveGame_4"))
+    assert any(slot.name == "SaveGame_4" for slot in discovery.refresh())
+    assert discovery.listed == listed + 1
+
+
+def test_catalogue_persists_between_runs(roots, tmp_path):
+    cache_path = tmp_path / "discovery.json"
+    discovery = SaveDiscovery(roots, cache_path)
+    slots = discovery.refresh()
+    discovery.save()
+
+    reopened = SaveDiscovery(roots, cache_path)
+    assert sorted(reopened.cached()) == sorted(slots)
+    assert sorted(reopened.refresh()) == sorted(slots)
+    assert reopened.listed == 0
+
+
+def test_unreadable_cache_starts_empty(roots, tmp_path):
+    cache_path = tmp_path / "discovery.json"
+    cache_path.write_text("not json", encoding="utf-8")
+
+    assert SaveDiscovery(roots, cache_path).cached() == []
+
+
+def test_save_failure_is_raised_and_retried(roots, tmp_path):
+    blocker = tmp_path / "not_a_folder"
+    blocker.write_text("", encoding="utf-8")
+    discovery = SaveDiscovery(roots, blocker / "discovery.json")
+    discovery.refresh()
+
+    with pytest.raises(OSError):
+        discovery.save()
+    blocker.unlink()
+    blocker.mkdir()
+    discovery.save()
+    assert (blocker / "discovery.json").exists()
@@ -0,0 +1,42 @@
+import json
+import os
+
+from lib.index import SaveIndex
+
+
+def open_index(slot, **kwargs):
+    return SaveIndex(slot, slot.parent / "SaveGame_1_Index.sqlite", workers=1, **kwargs)
+
+
+def test_refresh_indexes_key_fields(slot):
+    index = open_index(slot)
+
+    assert index.refresh() == (9, 0)
+    dealers = index.find(data_type="DealerData")
+    assert [(f.path, f.id, f.recruited) for f in dealers] == [("NPCs/Benji/NPC.json", "benji_coleman", True)]
+    assert [f.path for f in index.find(under="NPCs", filename="NPC.json")] == [
+        "NPCs/Benji/NPC.json", "NPCs/Kyle/NPC.json"]
+    assert [f.property_code for f in index.find(parent="Properties/Barn")] == ["barn"]
+    index.close()
+
+
+def test_refresh_only_rereads_changed_files(slot):
+    index = open_index(slot)
+    index.refresh()
+    money = slot / "Money.json"
+    money.write_text(json.dumps({"DataType": "MoneyData", "OnlineBalance": 1.0}, indent=4), encoding="utf-8")
+    os.utime(money, ns=(1, 1))
+    (slot / "NPCs" / "Kyle" / "NPC.json").unlink()
+
+    assert index.refresh() == (1, 1)
+    assert index.refresh() == (0, 0)
+    index.close()
+
+
+def test_index_persists_between_sessions(slot):
+    open_index(slot).refresh()
+    index = open_index(slot)
+
+    assert index.refresh() == (0, 0)
+    assert len(index.find()) == 9
+    index.close()
@@ -0,0 +1,87 @@
+import json
+
+import pytest
+
+from lib.items import ItemList, ItemRecord
+
+ITEMS = [
+    json.dumps({"DataType": "ItemData", "DataVersion": 0, "GameVersion": "0.3", "ID": "ogkush", "Quantity": 5}),
+    json.dumps({"DataType": "CashData", "DataVersion": 0, "GameVersion": "0.3", "ID": "cash", "Quantity": 1,
+                "CashBalance": 250.0}),
+    json.dumps({"DataType": "WeedData", "DataVersion": 0, "GameVersion": "0.3", "ID": "sourdiesel",
+                "Quantity": 20, "PackagingID": "baggie", "Quality": "Standard"}),
+]
+
+
+def test_item_list_round_trips_unedited_items_verbatim():
+    items = ItemList(ITEMS)
+
+    assert [item.to_dict() for _, item in items.decoded()] == [json.loads(item) for item in ITEMS]
+    assert not items.changed
+    assert items.encode() == ITEMS
+
+
+def test_item_list_re_encodes_only_edited_items():
+    items = ItemList(ITEMS)
+
+    assert not items.update(0, {"Quantity": 5})
+    assert items.update(2, {"Quantity": 10, "Quality": "Premium"})
+    encoded = items.encode()
+
+    assert encoded[:2] == ITEMS[:2]
+    edited = json.loads(ITEMS[2])
+    edited.update(Quantity=10, Quality="Premium")
+    assert json.loads(encoded[2]) == edited
+    assert list(json.loads(encoded[2])) == list(edited)
+    assert not items.changed
+
+
+def test_find_append_and_reorder():
+    items = ItemList(ITEMS)
+
+    index, cash = items.find("CashData")
+    assert index == 1 and cash["CashBalance"] == 250.0
+    new = items.append({"DataType": "ItemData", "ID": "cuke", "Quantity": 3})
+    assert items.dirty_count == 1
+
+    encoded = items.encode(order=[new, 0])
+    assert json.loads(encoded[0]) == {"DataType": "ItemData", "ID": "cuke", "Quantity": 3}
+    assert encoded[1] == ITEMS[0]
+
+
+def test_undecodable_items_are_skipped_and_kept():
+    items = ItemList([ITEMS[0], "not json", json.dumps([1, 2])])
+
+    assert [index for index, _ in items.decoded()] == [0]
+    assert items.encode() == [ITEMS[0], "not json", json.dumps([1, 2])]
+
+
+def test_item_record_keeps_key_order_and_extras():
+    data = {"ID": "cash", "DataType": "CashData", "Extra": [1, 2], "Quantity": 1}
+    record = ItemRecord(data)
+    record["Quantity"] = 3
+
+    assert list(record.to_dict()) == list(data)
+    assert record.to_dict() == {**data, "Quantity": 3}
+    assert record == ItemRecord({**data, "Quantity": 3}) == {**data, "Quantity": 3}
+
+
+def test_item_record_dict_operations():
+    record = ItemRecord({"DataType": "ItemData", "ID": "cuke"})
+
+    assert "Quantity" not in record and record.get("Quantity", 0) == 0
+    assert record.setdefault("Quantity", 2) == 2
+    record["Note"] = "new"
+    assert list(record.to_dict()) == ["DataType", "ID", "Quantity", "Note"]
+    assert record.pop("ID") == "cuke" and record.pop("ID", None) is None
+    with pytest.raises(KeyError):
+        record["ID"]
+    assert record.to_dict() == {"DataType": "ItemData", "Quantity": 2, "Note": "new"}
+
+
+def test_records_of_one_layout_share_their_key_order():
+    first = ItemRecord(json.loads(ITEMS[0]))
+    second = ItemRecord(json.loads(ITEMS[0]))
+
+    assert first._keys is second._keys
+    assert not hasattr(first, "__dict__")
@@ -0,0 +1,21 @@
+import json
+
+from lib.loader import load_json_files
+
+
+def test_results_keep_the_order_of_paths(slot):
+    paths = sorted(slot.rglob("*.json"), reverse=True)
+
+    results = load_json_files(paths, workers=4)
+
+    assert [path for path, _ in results] == paths
+    assert [data for _, data in results] == [json.loads(path.read_text(encoding="utf-8")) for path in paths]
+
+
+def test_undecodable_files_are_skipped(slot):
+    broken = slot / "Broken.json"
+    broken.write_text("{not json", encoding="utf-8")
+    paths = [slot / "Money.json", broken, slot / "Rank.json"]
+
+    for workers in (1, 4):
+        assert [path for path, _ in load_json_files(paths, workers=workers)] == [paths[0], paths[2]]
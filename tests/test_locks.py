@@ -0,0 +1,95 @@
+import subprocess, sys, threading, time
+from pathlib import Path
+
+import pytest
+
+from lib.locks import SlotLock, SlotLockTimeout, slot_lock, subtree_of
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HOLDER = """
+import sys
+from lib.locks import SlotLock
+lock = SlotLock(sys.argv[1])
+with lock.exclusive(*sys.argv[2:]):
+    print("locked", flush=True)
+    sys.stdin.readline()
+"""
+
+
+@pytest.fixture
+def holder(tmp_path):
+    """Start another process holding subtrees of a slot exclusively until the test ends."""
+    processes = []
+
+    def start(*subtrees):
+        process = subprocess.Popen([sys.executable, "-c", HOLDER, str(tmp_path / "Lock"), *subtrees],
+                                   cwd=ROOT, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        processes.append(process)
+        assert process.stdout.readline().strip() == "locked"
+        return process
+
+    yield start
+    for process in processes:
+        if process.poll() is None:
+            process.communicate("\n", timeout=10)
+
+
+def test_subtree_of():
+    assert subtree_of("Properties/barn/Data.json") == "Properties"
+    assert subtree_of("Players\\Player_0\\Inventory.json") == "Players"
+    assert subtree_of("Money.json") == ""
+
+
+def test_other_process_blocks_the_same_subtree(tmp_path, holder):
+    holder("Properties")
+    lock = SlotLock(tmp_path / "Lock", timeout=0.2)
+
+    with pytest.raises(SlotLockTimeout):
+        with lock.exclusive("Properties"):
+            pass
+    with pytest.raises(SlotLockTimeout):
+        with lock.shared():
+            pass
+    with lock.exclusive("Players"):
+        pass
+
+
+def test_lock_is_free_once_other_process_releases(tmp_path, holder):
+    process = holder()
+    process.communicate("\n", timeout=10)
+
+    with SlotLock(tmp_path / "Lock", timeout=0.2).exclusive():
+        pass
+
+
+def test_threads_wait_for_each_other(tmp_path):
+    lock = slot_lock(tmp_path / "Lock")
+    order = []
+
+    def writer():
+        with lock.exclusive("Properties"):
+            order.append("second")
+
+    with lock.exclusive("Properties"):
+        thread = threading.Thread(target=writer)
+        thread.start()
+        time.sleep(0.1)
+        order.append("first")
+    thread.join(timeout=5)
+
+    assert order == ["first", "second"]
+    assert slot_lock(tmp_path / "Lock") is lock
+    lock.close()
+
+
+def test_holds_are_reentrant_but_not_upgradable(tmp_path):
+    lock = SlotLock(tmp_path / "Lock")
+    with lock.exclusive():
+        with lock.exclusive("Properties"), lock.shared("Players"):
+            pass
+    with lock.shared("Properties"):
+        with pytest.raises(RuntimeError):
+            with lock.exclusive("Properties"):
+                pass
+    lock.close()
@@ -0,0 +1,28 @@
+from lib.manifest import SlotManifest
+
+
+def test_manifest_lists_the_slot_tree(slot):
+    manifest = SlotManifest(slot)
+
+    assert manifest.exists("NPCs/Benji/NPC.json") and not manifest.exists("NPCs/Nobody")
+    assert manifest.is_dir("Properties/Barn")
+    assert manifest.children("NPCs", dirs=True) == ["Benji", "Kyle"]
+    assert manifest.children(dirs=False) == ["Game.json", "Money.json", "Rank.json", "Time.json"]
+    stats = manifest.json_stats()
+    assert len(stats) == 9
+    assert stats["Money.json"][0] == (slot / "Money.json").stat().st_size
+
+
+def test_manifest_from_entries_matches_a_walk(slot):
+    walked = SlotManifest(slot)
+    built = SlotManifest.from_entries(slot, sorted(walked.entries.values(), key=lambda entry: entry.path.count("/")))
+
+    assert built.entries == walked.entries
+    assert built.children("Players/Player_0") == ["Inventory.json"]
+    assert built.json_stats() == walked.json_stats()
+
+
+def test_missing_slot_gives_an_empty_manifest(tmp_path):
+    manifest = SlotManifest(tmp_path / "missing")
+
+    assert manifest.entries == {} and manifest.children() == []
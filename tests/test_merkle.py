@@ -0,0 +1,91 @@
+import json
+import os
+
+from lib.merkle import MerkleTree, diff_trees, mirror_tree
+from lib.storage import DiskStorage, MemoryStorage, diff_storages, mirror_storage
+
+
+def edit(path, **fields):
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data.update(fields)
+    path.write_text(json.dumps(data, indent=4), encoding="utf-8")
+
+
+def test_unchanged_files_are_not_rehashed(slot, tmp_path):
+    store = tmp_path / "slot.merkle"
+    tree = MerkleTree(slot, store).refresh()
+    assert tree.hashed == 9
+    tree.save()
+
+    reopened = MerkleTree(slot, store).refresh()
+    assert reopened.hashed == 0 and reopened.root_hash == tree.root_hash
+
+    edit(slot / "Money.json", OnlineBalance=1.0)
+    assert reopened.refresh().hashed == 1 and reopened.root_hash != tree.root_hash
+
+
+def test_diff_descends_only_into_changed_folders(slot, tmp_path):
+    copy = DiskStorage(tmp_path / "copy")
+    DiskStorage(slot).copy_to(copy)
+    edit(copy.path("NPCs/Benji/NPC.json"), Recruited=False)
+    (copy.path("NPCs/Kyle/NPC.json")).unlink()
+    copy.write_text("Extra.json", "{}")
+
+    diff = diff_trees(MerkleTree(slot).refresh(), MerkleTree(copy.root).refresh())
+
+    assert diff.changed == ["NPCs/Benji/NPC.json"]
+    assert diff.only_left == ["NPCs/Kyle/NPC.json"]
+    assert diff.only_right == ["Extra.json"]
+    assert not diff_trees(MerkleTree(slot).refresh(), MerkleTree(slot).refresh())
+
+
+def test_mirror_makes_trees_equal(slot, tmp_path):
+    backup = DiskStorage(tmp_path / "backup")
+    DiskStorage(slot).copy_to(backup)
+    edit(slot / "Rank.json", Rank=9)
+    (slot / "Products" / "Created").mkdir()
+    (slot / "Products" / "Created" / "mixed1.json").write_text("{}", encoding="utf-8")
+
+    source, target = MerkleTree(backup.root).refresh(), MerkleTree(slot).refresh()
+    assert mirror_tree(source, target) == 2
+    assert target.root_hash == source.root_hash
+    assert json.loads((slot / "Rank.json").read_text(encoding="utf-8"))["Rank"] == 2
+
+
+def test_ignored_entries_are_left_out(slot):
+    (slot / "feature_backups").mkdir()
+    with_backups = MerkleTree(slot, ignore=("feature_backups",)).refresh()
+    (slot / "feature_backups").rmdir()
+
+    assert with_backups.root_hash == MerkleTree(slot).refresh().root_hash
+
+
+class CountingStorage(MemoryStorage):
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    def read_bytes(self, rel_path):
+        self.reads += 1
+        return super().read_bytes(rel_path)
+
+
+def test_storage_diff_reads_each_file_once_per_change(slot):
+    left, right = CountingStorage(), CountingStorage()
+    DiskStorage(slot).copy_to(left)
+    left.copy_to(right)
+    left.reads = right.reads = 0
+
+    assert not diff_storages(left, right)
+    assert left.reads == right.reads == 0
+
+    right.write_text("Money.json", left.read_bytes("Money.json").decode().replace("500.0", "600.0"))
+    right.write_text("Rank.json", left.read_bytes("Rank.json").decode() + " ")
+    left.reads = right.reads = 0
+    diff = diff_storages(left, right)
+    assert diff.changed == ["Money.json", "Rank.json"]
+    # Money.json: only the rewritten side is hashed; Rank.json differs in size, so neither is read
+    assert (left.reads, right.reads) == (0, 1)
+
+    assert mirror_storage(left, right) == 2
+    assert not diff_storages(left, right)
@@ -0,0 +1,65 @@
+import json
+
+from lib.products import ProductsFile
+from lib.storage import DiskStorage
+
+PRODUCTS = {
+    "DataType": "ProductManagerData",
+    "DataVersion": 0,
+    "GameVersion": "0.3.3f14",
+    "DiscoveredProducts": ["ogkush", "sourdiesel", "greencrack"],
+    "ListedProducts": ["ogkush"],
+    "MixRecipes": [{"Product": "ogkush", "Mixer": "cuke", "Output": "mixed1"}],
+    "ProductPrices": [{"String": "ogkush", "Int": 38}],
+}
+
+
+def write_products(tmp_path, data, indent=4):
+    path = tmp_path / "Products.json"
+    path.write_text(json.dumps(data, indent=indent), encoding="utf-8")
+    return path
+
+
+def test_noop_edit_leaves_file_untouched(tmp_path):
+    path = write_products(tmp_path, PRODUCTS)
+    original = path.read_bytes()
+
+    ProductsFile(path).edit(append={"DiscoveredProducts": ["ogkush"]}, unique={"DiscoveredProducts"})
+
+    assert path.read_bytes() == original
+
+
+def test_streaming_edit_matches_json_dump(tmp_path):
+    for indent in (2, 4):
+        path = write_products(tmp_path, PRODUCTS, indent)
+        ProductsFile(path).edit(
+            append={"DiscoveredProducts": ["ogkush", "mixed1"],
+                    "MixRecipes": [{"Product": "sourdiesel", "Mixer": "banana", "Output": "mixed2"}]},
+            keep={"ListedProducts": lambda product: False},
+            unique={"DiscoveredProducts"})
+
+        expected = dict(PRODUCTS)
+        expected["DiscoveredProducts"] = PRODUCTS["DiscoveredProducts"] + ["mixed1"]
+        expected["ListedProducts"] = []
+        expected["MixRecipes"] = PRODUCTS["MixRecipes"] + [
+            {"Product": "sourdiesel", "Mixer": "banana", "Output": "mixed2"}]
+        assert path.read_text(encoding="utf-8") == json.dumps(expected, indent=indent)
+
+
+def test_missing_arrays_are_created(tmp_path):
+    data = {key: value for key, value in PRODUCTS.items() if key != "MixRecipes"}
+    path = write_products(tmp_path, data)
+
+    ProductsFile("Products.json", storage=DiskStorage(tmp_path)).edit(
+        append={"MixRecipes": [{"Product": "ogkush", "Mixer": "cuke", "Output": "mixed1"}]})
+
+    assert json.loads(path.read_text(encoding="utf-8"))["MixRecipes"] == PRODUCTS["MixRecipes"]
+
+
+def test_other_layouts_fall_back_to_a_full_load(tmp_path):
+    path = tmp_path / "Products.json"
+    path.write_text(json.dumps(PRODUCTS), encoding="utf-8")
+
+    ProductsFile(path).edit(append={"DiscoveredProducts": ["mixed1"]})
+
+    assert json.loads(path.read_text(encoding="utf-8"))["DiscoveredProducts"][-1] == "mixed1"
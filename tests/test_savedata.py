@@ -0,0 +1,27 @@
+from lib.savedata import LazySaveData
+
+
+def test_sections_load_on_first_access_only():
+    calls = []
+    data = LazySaveData()
+    data.register("properties", lambda: calls.append("properties") or [1, 2])
+
+    assert "properties" in data and len(data) == 1
+    assert calls == []
+    assert data["properties"] == [1, 2]
+    assert data["properties"] == [1, 2]
+    assert calls == ["properties"]
+
+
+def test_invalidated_section_is_reloaded():
+    counter = iter(range(10))
+    data = LazySaveData()
+    data.register("money", lambda: {"OnlineBalance": next(counter)})
+    data["game"] = {"GameVersion": "0.3"}
+
+    assert data["money"] == {"OnlineBalance": 0}
+    data.invalidate()
+    assert data["money"] == {"OnlineBalance": 1}
+    # Sections set directly have no loader and survive invalidation
+    assert data["game"] == {"GameVersion": "0.3"}
+    assert list(data) == ["money", "game"]
@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from lib.serializers import COLOUR_FIELDS, COMPACT, INVENTORY, WEED_PRODUCT, Field, Template, template_dumps
+
+INDENTS = [4, 2, "\t", None, COMPACT]
+
+DEALER = {"DataType": "DealerData", "DataVersion": 0, "GameVersion": "0.3.3f15", "ID": "benji_coleman",
+          "Recruited": True, "AssignedCustomerIDs": ["kyle_cooley", "café"], "ActiveContractGUIDs": [],
+          "Cash": 12.5, "OverflowItems": {"Items": [json.dumps({"ID": "ogkush", "Quantity": 3})]},
+          "HasBeenRecommended": False}
+
+
+def json_dumps(obj, indent):
+    if indent == COMPACT:
+        return json.dumps(obj, separators=(",", ":"))
+    return json.dumps(obj, indent=indent)
+
+
+@pytest.mark.parametrize("indent", INDENTS)
+def test_template_matches_json_dumps(indent):
+    assert template_dumps(DEALER, indent) == json_dumps(DEALER, indent)
+
+
+@pytest.mark.parametrize("document", [
+    {**DEALER, "Extra": 1},
+    {key: DEALER[key] for key in reversed(DEALER)},
+    {**DEALER, "OverflowItems": {"Items": [], "More": 1}},
+    {**DEALER, "OverflowItems": None},
+    {**DEALER, "DataType": 3},
+    {"DataType": "UnknownData"},
+    [DEALER],
+])
+def test_other_layouts_have_no_template(document):
+    assert template_dumps(document) is None
+
+
+@pytest.mark.parametrize("indent", INDENTS)
+def test_fill_matches_json_dumps(indent):
+    colours = {name: i for i, name in enumerate(COLOUR_FIELDS)}
+    text = WEED_PRODUCT.fill(indent, name="OG Kush", product_id="ogkush", drug_type=0,
+                             properties=["calming", "munchies"], **colours)
+    document = json.loads(text)
+
+    assert text == json_dumps(document, indent)
+    assert document["AppearanceSettings"]["LeafColor"] == {"r": colours["leaf_r"], "g": colours["leaf_g"],
+                                                           "b": colours["leaf_b"], "a": 255}
+    assert INVENTORY.fill(indent, items=[]) == json_dumps(
+        {"DataType": "InventoryData", "DataVersion": 0, "GameVersion": "0.3.3f15", "Items": []}, indent)
+
+
+def test_values_are_encoded_like_json():
+    template = Template({"DataType": "TestData", "Values": None, "Name": Field("name")})
+    document = {"DataType": "TestData",
+                "Values": [float("nan"), float("inf"), -0.0, 1e-05, 2 ** 64, None, {"a": [1, {}]}, "\x7f"],
+                "Name": None}
+    for indent in INDENTS:
+        assert template.dumps(document, indent) == json_dumps(document, indent)
+        assert template.fill(indent, name="é\n") == json_dumps({"DataType": "TestData", "Values": None,
+                                                                "Name": "é\n"}, indent)
@@ -0,0 +1,51 @@
+import json
+
+from lib.snapshot import SaveSnapshot, file_fingerprint, folder_fingerprint
+
+
+def load_money(slot, calls):
+    calls.append("Money.json")
+    return json.loads((slot / "Money.json").read_text(encoding="utf-8"))
+
+
+def test_parts_are_reused_across_sessions_while_unchanged(slot, tmp_path):
+    path = SaveSnapshot.path_for(tmp_path / "snapshots", slot)
+    calls = []
+    snapshot = SaveSnapshot(path, slot)
+    money = snapshot.get("money", file_fingerprint(slot / "Money.json"), lambda: load_money(slot, calls))
+    snapshot.save()
+
+    reopened = SaveSnapshot(path, slot)
+    assert reopened.get("money", file_fingerprint(slot / "Money.json"), lambda: load_money(slot, calls)) == money
+    assert calls == ["Money.json"]
+
+    (slot / "Money.json").write_text(json.dumps({"OnlineBalance": 1.0}), encoding="utf-8")
+    assert reopened.get("money", file_fingerprint(slot / "Money.json"),
+                        lambda: load_money(slot, calls)) == {"OnlineBalance": 1.0}
+    assert calls == ["Money.json", "Money.json"]
+
+
+def test_returned_parts_are_copies(slot):
+    snapshot = SaveSnapshot(None, slot)
+    snapshot.get("npcs", ("fingerprint",), lambda: {"Benji": {"Recruited": True}})
+
+    snapshot.get("npcs", ("fingerprint",), None)["Benji"]["Recruited"] = False
+    assert snapshot.get("npcs", ("fingerprint",), None) == {"Benji": {"Recruited": True}}
+
+
+def test_snapshot_of_another_slot_is_ignored(slot, tmp_path):
+    path = tmp_path / "shared.snapshot"
+    snapshot = SaveSnapshot(path, slot)
+    snapshot.get("money", 1, lambda: "first")
+    snapshot.save()
+
+    assert SaveSnapshot(path, tmp_path / "SaveGame_2").get("money", 1, lambda: "rebuilt") == "rebuilt"
+
+
+def test_folder_fingerprint_tracks_files(slot):
+    before = folder_fingerprint(slot / "NPCs" / "Benji")
+    (slot / "NPCs" / "Benji" / "Extra.json").write_text("{}", encoding="utf-8")
+
+    assert [name for name, _, _ in before] == ["NPC.json"]
+    assert folder_fingerprint(slot / "NPCs" / "Benji") != before
+    assert folder_fingerprint(slot / "Missing") is None
@@ -0,0 +1,35 @@
+from lib.index import SaveIndex
+from lib.sniff import sniff_bytes, sniff_data_type, sniff_files
+
+
+def test_sniff_bytes():
+    assert sniff_bytes(b'{\n    "DataType": "DealerData",\n    "ID": "benji"') == "DealerData"
+    assert sniff_bytes(b'\xef\xbb\xbf{"DataType":"NPCData"}') == "NPCData"
+    assert sniff_bytes(b'{"ID": "benji", "DataType": "DealerData"}') is None
+    assert sniff_bytes(b"") is None
+
+
+def test_sniff_files_in_order(slot, tmp_path):
+    missing = tmp_path / "missing.json"
+    paths = [slot / "NPCs" / "Benji" / "NPC.json", missing, slot / "Money.json"]
+
+    assert sniff_files(paths, workers=4) == ["DealerData", None, "MoneyData"]
+    assert sniff_data_type(missing) is None
+
+
+def test_sniffed_files_are_not_parsed(slot):
+    asked = []
+
+    def parse(rel_path, data_type):
+        asked.append(rel_path)
+        return data_type == "DealerData"
+
+    index = SaveIndex(slot, slot.parent / "SaveGame_1_Index.sqlite", workers=1, parse=parse)
+    index.refresh()
+
+    assert len(asked) == 9
+    kyle, = index.find(filename="NPC.json", data_type="NPCData")
+    assert kyle.id is None
+    benji, = index.find(data_type="DealerData")
+    assert benji.recruited is True
+    index.close()
@@ -0,0 +1,104 @@
+import json
+import zipfile
+
+import pytest
+
+from lib.codec import COMPACT, JsonCodec
+from lib.storage import DiskStorage, MemoryStorage, SaveStorage, ZipStorage, open_storage
+
+
+@pytest.fixture(params=["disk", "memory", "zip"])
+def storage(request, slot, tmp_path):
+    if request.param == "disk":
+        return DiskStorage(slot)
+    if request.param == "memory":
+        storage = MemoryStorage()
+    else:
+        storage = ZipStorage(tmp_path / "SaveGame_2.zip")
+    DiskStorage(slot).copy_to(storage)
+    return storage
+
+
+def test_incomplete_backend_cannot_be_created():
+    class NoRemove(SaveStorage):
+        def exists(self, rel_path): return False
+        def is_dir(self, rel_path): return False
+        def listdir(self, rel_dir="", dirs=None): return []
+        def stat(self, rel_path): return None
+        def read_bytes(self, rel_path): raise FileNotFoundError(rel_path)
+        def write_text(self, rel_path, text): pass
+        def makedirs(self, rel_dir): pass
+
+    with pytest.raises(TypeError, match="remove"):
+        NoRemove()
+
+
+def test_listing_and_reading(storage):
+    assert storage.listdir(dirs=True) == ["NPCs", "Players", "Products", "Properties"]
+    assert storage.listdir("NPCs/Benji") == ["NPC.json"]
+    assert storage.is_dir("NPCs") and not storage.is_dir("Money.json")
+    assert storage.load_json("Money.json", JsonCodec())["OnlineBalance"] == 500.0
+    assert storage.stat("Money.json")[1] == len(storage.read_bytes("Money.json"))
+    assert storage.stat("Missing.json") is None
+    assert {entry.path for entry in storage.walk() if not entry.is_dir} == set(storage.manifest().json_stats())
+
+
+def test_writes_and_removal(storage):
+    codec = JsonCodec()
+    with storage.group():
+        assert storage.dump_json("Money.json", {"OnlineBalance": 1.0}, codec)
+        storage.write_text("Products/Created/mixed1.json", "{}")
+    storage.flush()
+
+    assert not storage.dump_json("Money.json", {"OnlineBalance": 1.0}, codec)
+    assert storage.read_bytes("Money.json") == json.dumps({"OnlineBalance": 1.0}, indent=4).encode()
+    assert storage.listdir("Products/Created") == ["mixed1.json"]
+    storage.remove("Products/Created")
+    storage.remove("Missing.json")
+    assert not storage.exists("Products/Created")
+
+
+def test_group_reads_its_own_writes(storage):
+    codec = JsonCodec()
+    with storage.group():
+        storage.dump_json("Money.json", {"OnlineBalance": 2.0}, codec)
+        storage.write_text("Products/Created/mixed1.json", "{}")
+        assert storage.load_json("Money.json", codec) == {"OnlineBalance": 2.0}
+        assert storage.exists("Products/Created/mixed1.json")
+        assert storage.listdir("Products/Created") == ["mixed1.json"]
+        stat = storage.stat("Money.json")
+    storage.flush()
+
+    assert storage.stat("Money.json") == stat
+    assert storage.listdir("Products/Created") == ["mixed1.json"]
+
+
+def test_existing_layout_is_preserved(storage):
+    codec = JsonCodec()
+    storage.write_text("Compact.json", json.dumps({"A": 1}, separators=(",", ":")))
+    storage.dump_json("Compact.json", {"A": 2}, codec)
+    storage.dump_json("New.json", {"A": 2}, codec, COMPACT)
+
+    assert storage.read_bytes("Compact.json") == b'{"A":2}'
+    assert storage.read_bytes("New.json") == b'{"A":2}'
+
+
+def test_zip_slot_is_written_back_on_flush(slot, tmp_path):
+    path = tmp_path / "SaveGame_3.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        for file in slot.rglob("*.json"):
+            zf.write(file, "SaveGame_3/" + file.relative_to(slot).as_posix())
+    storage = open_storage(path)
+    assert isinstance(storage, ZipStorage) and storage.exists("NPCs/Benji/NPC.json")
+
+    storage.write_text("Money.json", "{}")
+    assert ZipStorage(path).read_bytes("Money.json") != b"{}"
+    storage.flush()
+
+    reopened = ZipStorage(path)
+    assert reopened.read_bytes("Money.json") == b"{}"
+    assert reopened.read_bytes("Rank.json") == (slot / "Rank.json").read_bytes()
+    with zipfile.ZipFile(path) as zf:
+        assert "SaveGame_3/Money.json" in zf.namelist()
+    assert storage.sidecar("_Lock") == tmp_path / "SaveGame_3_Lock"
+    assert storage.backup_storage().location == tmp_path / "SaveGame_3_Backup.zip"
@@ -0,0 +1,59 @@
+import json
+import shutil
+
+import pytest
+
+from lib.summary import SlotSummaryCache, format_playtime
+
+
+def test_format_playtime():
+    assert format_playtime(90061) == "1d, 1h, 1m, 1s"
+
+
+def test_summary_reads_slot_details(slot, tmp_path):
+    summary = SlotSummaryCache(tmp_path / "summaries.json").get(slot)
+
+    assert summary["organisation_name"] == "Test Org"
+    assert summary["game_version"] == "0.3.3f14"
+    assert summary["networth"] == 1500
+    assert summary["playtime"] == "0d, 1h, 0m, 0s"
+
+
+def test_summary_persists_until_slot_files_change(slot, tmp_path):
+    cache_path = tmp_path / "summaries.json"
+    cache = SlotSummaryCache(cache_path)
+    cache.get(slot)
+    cache.save()
+
+    reopened = SlotSummaryCache(cache_path)
+    reopened._read_summary = None  # a stored, current summary must not re-read the slot
+    assert reopened.get(slot)["organisation_name"] == "Test Org"
+
+    game = json.loads((slot / "Game.json").read_text(encoding="utf-8"))
+    game["OrganisationName"] = "Renamed"
+    (slot / "Game.json").write_text(json.dumps(game, indent=4), encoding="utf-8")
+    reopened = SlotSummaryCache(cache_path)
+    assert reopened.cached(slot)["organisation_name"] == "Test Org"
+    assert reopened.get(slot)["organisation_name"] == "Renamed"
+
+
+def test_missing_slots_are_dropped(slot, tmp_path):
+    cache = SlotSummaryCache(tmp_path / "summaries.json")
+    cache.get(slot)
+    shutil.rmtree(slot)
+    cache.discard_missing()
+
+    assert cache.cached(slot) is None
+
+
+def test_save_failure_is_raised_and_retried(slot, tmp_path):
+    blocker = tmp_path / "not_a_folder"
+    blocker.write_text("", encoding="utf-8")
+    cache = SlotSummaryCache(blocker / "summaries.json")
+    cache.get(slot)
+
+    with pytest.raises(OSError):
+        cache.save()
+    cache.cache_path = tmp_path / "summaries.json"
+    cache.save()
+    assert str(slot) in json.loads(cache.cache_path.read_text(encoding="utf-8"))
@@ -0,0 +1,84 @@
+from contextlib import contextmanager
+
+import pytest
+
+from lib.codec import JsonCodec
+from lib.storage import MemoryStorage
+from lib.transaction import SaveTransaction, TransactionError
+
+
+class Manager:
+    """The parts of SaveManager a transaction uses, over a MemoryStorage slot."""
+
+    def __init__(self, fail_on=None):
+        self.storage = MemoryStorage()
+        self.codec = JsonCodec()
+        self.fail_on = fail_on
+        self.reloaded = []
+        self.groups = []
+        self._transaction = None
+
+    @contextmanager
+    def _writing(self, subtrees):
+        self.groups.append(sorted(subtrees))
+        with self.storage.group():
+            yield
+
+    def _write_json_file(self, filename, data):
+        if filename == self.fail_on:
+            raise OSError(f"Cannot write {filename}")
+        return self.storage.dump_json(filename, data, self.codec)
+
+    def _reload_documents(self, filenames):
+        self.reloaded.extend(filenames)
+
+
+def test_commit_writes_each_file_once():
+    manager = Manager()
+    manager.storage.dump_json("Rank.json", {"Rank": 1}, manager.codec)
+    with SaveTransaction(manager) as transaction:
+        transaction.stage("Money.json", {"OnlineBalance": 1})
+        transaction.stage("Money.json", {"OnlineBalance": 2})
+        transaction.stage("Rank.json", {"Rank": 1})
+        transaction.stage("Players/Player_0/Inventory.json", {"Items": []})
+
+    assert manager.storage.load_json("Money.json", manager.codec) == {"OnlineBalance": 2}
+    assert (transaction.requested, transaction.written, transaction.unchanged) == (4, 2, 1)
+    assert transaction.writes_saved == 2
+    assert manager.groups == [["", "Players"]]
+    assert manager._transaction is None
+
+
+def test_exception_in_block_rolls_back():
+    manager = Manager()
+    with pytest.raises(ValueError):
+        with SaveTransaction(manager) as transaction:
+            transaction.stage("Money.json", {"OnlineBalance": 1})
+            raise ValueError("bad input")
+
+    assert not manager.storage.exists("Money.json")
+    assert manager.reloaded == ["Money.json"]
+    assert transaction.staged == {}
+
+
+def test_failed_commit_restores_written_files():
+    manager = Manager(fail_on="Rank.json")
+    manager.storage.dump_json("Money.json", {"OnlineBalance": 0}, manager.codec)
+    original = manager.storage.read_bytes("Money.json")
+    with pytest.raises(OSError):
+        with SaveTransaction(manager) as transaction:
+            transaction.stage("Money.json", {"OnlineBalance": 1})
+            transaction.stage("Time.json", {"ElapsedDays": 3})
+            transaction.stage("Rank.json", {"Rank": 2})
+
+    assert manager.storage.read_bytes("Money.json") == original
+    assert not manager.storage.exists("Time.json")
+    assert sorted(manager.reloaded) == ["Money.json", "Rank.json", "Time.json"]
+
+
+def test_transactions_do_not_nest():
+    manager = Manager()
+    with SaveTransaction(manager):
+        with pytest.raises(TransactionError):
+            with SaveTransaction(manager):
+                pass
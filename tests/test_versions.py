@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from lib.versions import MISSING, DocumentVersions, WriteConflictError, content_digest, merge
+
+BASE = {"OnlineBalance": 100, "Lifetime": 500, "Settings": {"Music": 1, "Sound": 1}}
+
+
+def test_merge_takes_each_sides_changes():
+    ours = {**BASE, "OnlineBalance": 200}
+    theirs = {**BASE, "Lifetime": 600, "Settings": {"Music": 0, "Sound": 1}, "New": True}
+
+    merged, conflicts = merge(BASE, ours, theirs)
+
+    assert conflicts == []
+    assert merged == {"OnlineBalance": 200, "Lifetime": 600, "Settings": {"Music": 0, "Sound": 1}, "New": True}
+
+
+def test_merge_drops_keys_removed_on_one_side():
+    theirs = {key: value for key, value in BASE.items() if key != "Lifetime"}
+
+    merged, conflicts = merge(BASE, dict(BASE), theirs)
+
+    assert conflicts == [] and "Lifetime" not in merged
+
+
+def test_merge_reports_overlapping_changes():
+    ours = {**BASE, "Settings": {"Music": 0, "Sound": 1}}
+    theirs = {**BASE, "Settings": {"Music": 2, "Sound": 1}}
+
+    merged, conflicts = merge(BASE, ours, theirs)
+
+    assert [(c.path, c.base, c.ours, c.theirs) for c in conflicts] == [("Settings/Music", 1, 0, 2)]
+    assert merged["Settings"]["Music"] == 0
+
+
+def test_merge_of_key_added_differently_on_both_sides():
+    _, conflicts = merge({}, {"New": 1}, {"New": 2})
+
+    assert conflicts[0].base is MISSING
+
+
+class Disk:
+    """A file another program may rewrite between the editor's read and write."""
+
+    def __init__(self, data):
+        self.stat = (1, 0)
+        self.set(data)
+
+    def set(self, data):
+        self.raw = json.dumps(data).encode()
+        self.stat = (self.stat[0] + 1, len(self.raw))
+
+    def reconcile(self, versions: DocumentVersions, ours):
+        return versions.reconcile("Money.json", ours, self.stat, lambda: self.raw, json.loads)
+
+
+def test_reconcile_unchanged_file_returns_our_document():
+    disk = Disk(BASE)
+    versions = DocumentVersions()
+    versions.record("Money.json", disk.stat, content_digest(disk.raw), BASE)
+    ours = {**BASE, "OnlineBalance": 1}
+
+    assert disk.reconcile(versions, ours) is ours
+
+
+def test_reconcile_merges_changes_made_on_disk():
+    disk = Disk(BASE)
+    versions = DocumentVersions()
+    versions.record("Money.json", disk.stat, content_digest(disk.raw), BASE)
+    disk.set({**BASE, "Lifetime": 900})
+
+    assert disk.reconcile(versions, {**BASE, "OnlineBalance": 1}) == {**BASE, "OnlineBalance": 1, "Lifetime": 900}
+
+
+def test_reconcile_raises_on_conflict():
+    disk = Disk(BASE)
+    versions = DocumentVersions()
+    versions.record("Money.json", disk.stat, content_digest(disk.raw), BASE)
+    disk.set({**BASE, "OnlineBalance": 5})
+
+    with pytest.raises(WriteConflictError) as excinfo:
+        disk.reconcile(versions, {**BASE, "OnlineBalance": 1})
+    assert excinfo.value.filename == "Money.json"
+    assert [conflict.path for conflict in excinfo.value.conflicts] == ["OnlineBalance"]
+
+
+def test_reconcile_without_base_treats_any_change_as_conflict():
+    disk = Disk(BASE)
+    versions = DocumentVersions()
+    versions.record("Money.json", disk.stat, content_digest(disk.raw))
+    disk.set({**BASE, "Lifetime": 900})
+
+    with pytest.raises(WriteConflictError):
+        disk.reconcile(versions, {**BASE, "OnlineBalance": 1})
@@ -0,0 +1,40 @@
+import json
+
+from lib.loader import load_json_files
+from lib.versions import content_digest
+from lib.workers import run_batches, update_storage_batch
+
+WEED = {"DataType": "WeedData", "ID": "ogkush", "Quantity": 1, "PackagingID": "baggie", "Quality": "Standard"}
+ITEM = {"DataType": "ItemData", "ID": "cuke", "Quantity": 1}
+
+
+def storage_file(path, items):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"DataType": "StorageData", "Contents": {"Items": [json.dumps(item) for item in items]}},
+                               indent=4), encoding="utf-8")
+    return path
+
+
+def test_process_pool_decoding_matches_thread_pool(slot):
+    paths = sorted(slot.rglob("*.json"))
+    (slot / "Broken.json").write_text("{", encoding="utf-8")
+    paths.append(slot / "Broken.json")
+
+    assert load_json_files(paths, process_threshold=1) == load_json_files(paths, workers=4)
+
+
+def test_storage_edits_are_returned_not_written(tmp_path):
+    weed = storage_file(tmp_path / "Barn" / "Objects" / "Rack" / "Data.json", [WEED, ITEM])
+    items = storage_file(tmp_path / "Barn" / "Objects" / "Shelf" / "Data.json", [ITEM])
+    raw = weed.read_bytes()
+
+    results = run_batches(update_storage_batch, [weed, items, tmp_path / "missing.json"],
+                          "json", 20, "jar", "weed", "Premium")
+
+    stat, digest, data = results[0]
+    assert digest == content_digest(raw) and stat[1] == len(raw)
+    assert [json.loads(item) for item in data["Contents"]["Items"]] == [
+        {**WEED, "Quantity": 20, "PackagingID": "jar", "Quality": "Premium"}, ITEM]
+    assert results[1] is None
+    assert isinstance(results[2], FileNotFoundError)
+    assert weed.read_bytes() == raw
@@ -0,0 +1,101 @@
+import threading
+from contextlib import contextmanager
+
+import pytest
+
+from lib.writebehind import WriteBehindError, WriteBehindQueue
+
+
+def test_writes_run_and_flush_waits():
+    written = []
+    queue = WriteBehindQueue()
+    for i in range(5):
+        queue.submit(f"file{i}", lambda i=i: written.append(i))
+    queue.flush()
+
+    assert sorted(written) == [0, 1, 2, 3, 4]
+    assert (queue.queued, queue.written) == (5, 5)
+    queue.close()
+
+
+def test_pending_value_until_written_and_latest_write_wins():
+    started, release = threading.Event(), threading.Event()
+    written = []
+    queue = WriteBehindQueue()
+    queue.submit("blocker", lambda: (started.set(), release.wait()))
+    assert started.wait(5)
+    queue.submit("Money.json", lambda: written.append(1), {"OnlineBalance": 1})
+    queue.submit("Money.json", lambda: written.append(2), {"OnlineBalance": 2})
+
+    assert queue.pending("Money.json") == {"OnlineBalance": 2}
+    release.set()
+    queue.flush()
+    assert queue.pending("Money.json") is None
+    assert written == [2]
+    queue.close()
+
+
+def test_each_batch_runs_inside_the_batch_context():
+    batches = []
+
+    @contextmanager
+    def batch(keys):
+        batches.append(sorted(keys))
+        yield
+
+    started, release = threading.Event(), threading.Event()
+    queue = WriteBehindQueue(batch)
+    queue.submit("blocker", lambda: (started.set(), release.wait()))
+    assert started.wait(5)
+    queue.submit("a", lambda: None)
+    queue.submit("b", lambda: None)
+    release.set()
+    queue.flush()
+
+    assert batches == [["blocker"], ["a", "b"]]
+    queue.close()
+
+
+def test_flush_raises_failures_once():
+    def fail():
+        raise OSError("disk full")
+
+    queue = WriteBehindQueue()
+    queue.submit("Money.json", fail)
+    queue.submit("Rank.json", lambda: None)
+    with pytest.raises(WriteBehindError) as raised:
+        queue.flush()
+
+    assert [key for key, error in raised.value.failures] == ["Money.json"]
+    assert queue.written == 1
+    queue.flush()
+    queue.close()
+
+
+def test_failures_go_to_on_failure_instead_of_flush():
+    reported = []
+    done = threading.Event()
+
+    def on_failure(error):
+        reported.append((threading.current_thread().name, [key for key, e in error.failures]))
+        done.set()
+
+    def fail():
+        raise OSError("disk full")
+
+    queue = WriteBehindQueue(on_failure=on_failure)
+    queue.submit("Money.json", fail)
+    assert done.wait(5)
+
+    queue.flush()
+    assert reported == [("save-writer", ["Money.json"])]
+    queue.close()
+
+
+def test_closed_queue_refuses_writes():
+    queue = WriteBehindQueue()
+    queue.submit("a", lambda: None)
+    queue.close()
+
+    with pytest.raises(RuntimeError):
+        queue.submit("b", lambda: None)